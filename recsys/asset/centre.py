@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Sunday March 19th 2023 04:20:33 pm                                                  #
-# Modified   : Monday March 20th 2023 11:28:18 am                                                  #
+# Modified   : Monday October 19th 2026 01:04:36 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -24,7 +24,7 @@ import logging
 from sqlalchemy import text, exc
 import pandas as pd
 
-from recsys.services.io import IOService
+from recsys.services.io import IOService, PickleIO
 from recsys.asset.base import AssetCentreABC, Asset
 from recsys.persistence.database import Database
 
@@ -93,6 +93,24 @@ class AssetCentre(AssetCentreABC):
             self._logger.error(msg)
             raise FileNotFoundError(msg)
 
+    def get_many(self, assets: list) -> list:
+        """Gets several assets, loading them concurrently.
+
+        Args:
+            assets (list): (name, asset_type) tuples for the assets.
+
+        Returns: The assets, in the order given.
+        """
+        filepaths = []
+        for name, asset_type in assets:
+            filepath = self._get_filepath(name=name, asset_type=asset_type)
+            if not filepath:
+                msg = f"Attribute named {name} of type {asset_type} does not exist."
+                self._logger.error(msg)
+                raise FileNotFoundError(msg)
+            filepaths.append(filepath)
+        return self._io.read_many(filepaths=filepaths)
+
     def remove(self, name: str, asset_type: str) -> None:
         """Removes the asset with the designated name from storage and registry.
 
@@ -247,11 +265,13 @@ class AssetCentre(AssetCentreABC):
     def _save(self, asset: Asset) -> None:
         """Persists the asset to storage
 
+        Large arrays are written out-of-band and memory-mapped when the asset is loaded.
+
         Args:
             asset (Asset): The asset to persist.
 
         """
-        self._io.write(filepath=asset.filepath, data=asset)
+        self._io.write(filepath=asset.filepath, data=asset, out_of_band=True)
 
     def _load(self, filepath: str) -> Asset:
         """Returns the asset with the designated name from storage.
@@ -268,8 +288,9 @@ class AssetCentre(AssetCentreABC):
         Args:
             filepath (str): The filepath for the asset
         """
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        for path in [filepath] + PickleIO.sidecars(filepath):
+            if os.path.exists(path):
+                os.remove(path)
 
     def _purge_assets(self) -> None:
         """Delete the directory containing assets."""
@@ -11,18 +11,22 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday February 22nd 2023 07:35:10 pm                                            #
-# Modified   : Monday March 20th 2023 09:48:27 am                                                  #
+# Modified   : Monday October 19th 2026 01:42:37 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Data Mover Module"""
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import os
+import threading
 import requests
 from tqdm import tqdm
 import logging
 
-from recsys import Operator
+from recsys.workflow.operator import Operator
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -31,45 +35,229 @@ from recsys import Operator
 class DownloadOperator(Operator):
     """Downloads a zip file from a website.
 
+    If the server accepts range requests, the file is divided into n_connections ranges which
+    are downloaded concurrently into a '<destination>.part' file. The bytes received for
+    each range are recorded in a '<destination>.part.json' state file every checkpoint_size
+    bytes, so an interrupted download resumes from where it stopped, provided the remote ETag
+    and length are unchanged. Dropped connections are retried, resuming the range, up to
+    max_retries times. If the server answers a range request with anything other than the
+    requested partial content, the file is downloaded whole in a single request instead.
+
+    Once complete, the file is optionally verified against a checksum, moved to the
+    destination, and the remote ETag and length are recorded in '<destination>.json'. An
+    existing destination is skipped unless the remote ETag or length has changed. It is also
+    used as it is if the server cannot be reached, or does not report the length.
+
     Args:
         source (str): The URL to the zip file resource
         destination (str): A filename into which the zip file will be downloaded.
-        chunk_size (int): Size of download chunks
+        chunk_size (int): Size of the read buffer for each connection. Default = 1 MiB
         force (bool): Whether to force execution.
+        n_connections (int): Maximum number of concurrent range requests. Default = 4
+        checksum (str): Optional expected digest as '<algorithm>:<hex digest>', e.g.
+            'md5:c4d9eecfca2ab87c1945afe126590906'.
+        max_retries (int): Maximum retries per range on connection errors. Default = 3
+        timeout (float): Connection and read timeout in seconds. Default = 60
     """
 
     __name = "download_operator"
     __desc = "Downloads files from remote sites using HTTP requests."
 
+    checkpoint_size = 8388608
+
     def __init__(
-        self, source: str, destination: str, chunk_size: int = 1024, force: bool = False
+        self,
+        source: str,
+        destination: str,
+        chunk_size: int = 1048576,
+        force: bool = False,
+        n_connections: int = 4,
+        checksum: str = None,
+        max_retries: int = 3,
+        timeout: float = 60,
     ) -> None:
         super().__init__()
         self._source = source
         self._destination = destination
         self._force = force
         self._chunk_size = chunk_size
+        self._n_connections = n_connections
+        self._checksum = checksum
+        self._max_retries = max_retries
+        self._timeout = timeout
+        self._partfile = f"{destination}.part"
+        self._statefile = f"{destination}.part.json"
+        self._metafile = f"{destination}.json"
+        self._lock = threading.Lock()
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
 
     def __call__(self, *args, **kwargs) -> None:
         """Downloads a zipfile."""
+        try:
+            remote = self._head()
+        except requests.RequestException as e:
+            if self._force or not os.path.isfile(self._destination):
+                raise
+            self._logger.warning(f"{self._source} is unavailable: {e}. Using the local file.")
+            return
+        if self._current(remote):
+            self._logger.info(f"{self.__class__.__name__} skipped. Endpoint is up to date.")
+            return
+
+        os.makedirs(os.path.dirname(self._destination) or ".", exist_ok=True)
+        ranges = self._plan(remote)
+        if not self._download(remote, ranges):
+            self._logger.warning(f"{self._source} ignored the range requests. Downloading whole.")
+            remote = {**remote, "ranges": False}
+            ranges = self._plan(remote)
+            self._download(remote, ranges)
+
+        self._verify(self._partfile)
+        os.replace(self._partfile, self._destination)
+        os.remove(self._statefile)
+        with open(self._metafile, "w") as f:
+            json.dump({"etag": remote["etag"], "length": remote["length"]}, f)
+
+        self._logger.debug(f"Downloaded zip archive from {self._source} to {self._destination}")
+
+    def _download(self, remote: dict, ranges: list) -> bool:
+        """Fetches the ranges concurrently. Returns False if the server ignored a range request."""
+        with tqdm(
+            desc=self._destination,
+            total=remote["length"] or None,
+            initial=sum(done for _, _, done in ranges),
+            unit="iB",
+            unit_scale=True,
+            unit_divisor=1024,
+        ) as bar:
+            with ThreadPoolExecutor(max_workers=max(len(ranges), 1)) as executor:
+                futures = [
+                    executor.submit(self._fetch, ranges, k, remote, bar) for k in range(len(ranges))
+                ]
+                try:
+                    return all([future.result() for future in futures])
+                finally:
+                    self._save_state(remote, ranges)
+
+    def _head(self) -> dict:
+        """Returns the ETag, length and range support of the remote resource."""
+        resp = requests.head(self._source, allow_redirects=True, timeout=self._timeout)
+        resp.raise_for_status()
+        length = int(resp.headers.get("Content-Length", 0))
+        return {
+            "etag": resp.headers.get("ETag"),
+            "length": length,
+            # An empty resource has no satisfiable byte range.
+            "ranges": resp.headers.get("Accept-Ranges", "none").lower() == "bytes" and length > 0,
+        }
+
+    def _current(self, remote: dict) -> bool:
+        """Returns True if the destination exists and matches the remote ETag and length."""
+        if self._force or not os.path.isfile(self._destination):
+            return False
+        if not os.path.exists(self._metafile) or not remote["length"]:
+            # Downloaded before the remote metadata was recorded, or the length is unknown.
+            return True
+        with open(self._metafile, "r") as f:
+            local = json.load(f)
+        return (
+            local["etag"] == remote["etag"]
+            and local["length"] == remote["length"]
+            and os.path.getsize(self._destination) == remote["length"]
+        )
+
+    def _plan(self, remote: dict) -> list:
+        """Returns the [start, end, done] byte ranges, resuming from a matching state file."""
+        # Without range requests, the download restarts from the first byte.
+        if remote["ranges"] and os.path.exists(self._statefile) and os.path.exists(self._partfile):
+            with open(self._statefile, "r") as f:
+                state = json.load(f)
+            if state["etag"] == remote["etag"] and state["length"] == remote["length"]:
+                self._logger.info(f"Resuming download of {self._source}.")
+                return state["ranges"]
+
+        length = remote["length"]
+        with open(self._partfile, "wb") as f:
+            f.truncate(length)
+        if not remote["ranges"]:
+            return [[0, length - 1, 0]]
+        n = max(1, min(self._n_connections, length // self._chunk_size))
+        bounds = [length * k // n for k in range(n + 1)]
+        return [[bounds[k], bounds[k + 1] - 1, 0] for k in range(n)]
+
+    def _fetch(self, ranges: list, k: int, remote: dict, bar: tqdm) -> bool:
+        """Downloads a byte range into the part file, resuming after dropped connections.
+
+        Returns False, without writing, if the server does not answer the range request with
+        the requested partial content.
+        """
+        start, end, _ = ranges[k]
+        for attempt in range(self._max_retries + 1):
+            offset = start + ranges[k][2]
+            if end >= start and offset > end:
+                return True
+            headers = {"Range": f"bytes={offset}-{end}"} if remote["ranges"] else {}
+            try:
+                # Unbuffered, so the bytes counted in the state file are in the part file.
+                with requests.get(
+                    self._source, headers=headers, stream=True, timeout=self._timeout
+                ) as resp, open(self._partfile, "r+b", buffering=0) as f:
+                    resp.raise_for_status()
+                    if remote["ranges"] and not (
+                        resp.status_code == 206
+                        and resp.headers.get("Content-Range", "").startswith(
+                            f"bytes {offset}-{end}/"
+                        )
+                    ):
+                        return False
+                    f.seek(offset)
+                    unsaved = 0
+                    for data in resp.iter_content(chunk_size=self._chunk_size):
+                        f.write(data)
+                        with self._lock:
+                            ranges[k][2] += len(data)
+                            bar.update(len(data))
+                        unsaved += len(data)
+                        if unsaved >= self.checkpoint_size:
+                            self._save_state(remote, ranges)
+                            unsaved = 0
+                if not remote["ranges"] or start + ranges[k][2] > end:
+                    return True
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                if not remote["ranges"] or attempt == self._max_retries:
+                    raise
+                self._logger.warning(f"Range {start}-{end} interrupted: {e}. Resuming.")
+        msg = f"Range {start}-{end} of {self._source} is incomplete."
+        self._logger.error(msg)
+        raise IOError(msg)
+
+    def _save_state(self, remote: dict, ranges: list) -> None:
+        """Records the progress of each range, replacing the state file atomically."""
+        tempfile = f"{self._statefile}.tmp"
+        with self._lock:
+            state = {"etag": remote["etag"], "length": remote["length"], "ranges": ranges}
+            with open(tempfile, "w") as f:
+                json.dump(state, f)
+            os.replace(tempfile, self._statefile)
 
-        if not self._skip(endpoint=self._destination):
-
-            resp = requests.get(self._source, stream=True)
-            total = int(resp.headers.get("content-length", 0))
-            os.makedirs(os.path.dirname(self._destination), exist_ok=True)
-            with open(self._destination, "wb") as file, tqdm(
-                desc=self._destination,
-                total=total,
-                unit="iB",
-                unit_scale=True,
-                unit_divisor=1024,
-            ) as bar:
-                for data in resp.iter_content(chunk_size=self._chunk_size):
-                    size = file.write(data)
-                    bar.update(size)
-
-            self._logger.debug(f"Downloaded zip archive from {self._source} to {self._destination}")
+    def _verify(self, filepath: str) -> None:
+        """Verifies the file against the checksum, if provided."""
+        if self._checksum is None:
+            return
+        algorithm, expected = self._checksum.split(":", 1)
+        digest = hashlib.new(algorithm)
+        with open(filepath, "rb") as f:
+            while data := f.read(self._chunk_size):
+                digest.update(data)
+        if digest.hexdigest() != expected.lower():
+            os.remove(filepath)
+            os.remove(self._statefile)
+            msg = f"Checksum of {self._source} is {digest.hexdigest()}, not {expected}."
+            self._logger.error(msg)
+            raise ValueError(msg)
@@ -11,17 +11,24 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday February 25th 2023 05:55:47 am                                             #
-# Modified   : Monday March 20th 2023 09:48:55 am                                                  #
+# Modified   : Monday October 19th 2026 01:41:38 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Data Compression Module"""
+from concurrent.futures import ThreadPoolExecutor
 import os
+from typing import Union
+import uuid
 from zipfile import ZipFile
 import logging
 
-from recsys import Operator
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from recsys.workflow.operator import Operator
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -30,45 +37,142 @@ from recsys import Operator
 class ZipExtractOperator(Operator):
     """Extracts Zipfile contents.
 
+    Members are extracted in parallel, each from its own handle on the archive. With
+    to_parquet, each member is decompressed as a stream into a chunked CSV parser, and every
+    block parsed is written as a row group of '<member stem>.parquet' in the extract
+    directory. The member is never written to disk uncompressed, nor held in memory whole.
+    Only .csv members are converted. Other members, such as a README or the '::' delimited
+    .dat files, which DatIO reads, are extracted as they are. Each Parquet file is written
+    to a temporary file and renamed once complete, so an interrupted conversion never
+    leaves a partial file behind.
+
+    If members are named, extraction is skipped only if the file each member extracts to,
+    e.g. 'ratings.parquet' for 'ratings.csv' with to_parquet, already exists. Otherwise, it
+    is skipped if the extract directory is not empty.
+
     Args:
         source (str): Path to the zipfile
         destination (str): The extract directory
-        member (str): The member to extract. If None, all members will be extracted.
+        member (str, list): The member or members to extract. If None, all members will be
+            extracted.
         force (bool): Whether to force execution.
+        to_parquet (bool): Whether to convert the members to Parquet files as they are
+            extracted. Default = False
+        sep (str): The single character delimiter of the members converted to Parquet.
+        column_types (dict): Optional mapping of column names to arrow types, or type names
+            such as 'int32', for the members converted to Parquet.
+        block_size (int): Bytes parsed per block, and so per row group. Default = 16 MiB
+        max_workers (int): Maximum number of members extracted concurrently. Default = 4
     """
 
     __name = "zip_extract_operator"
     __desc = "Extracts files from zip archives."
+    __tabular = (".csv",)
 
     def __init__(
-        self, source: str, destination: str, member: str = None, force: bool = False
+        self,
+        source: str,
+        destination: str,
+        member: Union[str, list] = None,
+        force: bool = False,
+        to_parquet: bool = False,
+        sep: str = ",",
+        column_types: dict = None,
+        block_size: int = 16777216,
+        max_workers: int = 4,
     ) -> None:
         super().__init__()
         self._source = source
         self._destination = destination
         self._force = force
-        self._member = member
+        self._member = [member] if isinstance(member, str) else member
+        self._to_parquet = to_parquet
+        self._sep = sep
+        self._column_types = column_types
+        self._block_size = block_size
+        self._max_workers = max_workers
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
+        if to_parquet and len(sep) != 1:
+            msg = f"Members converted to Parquet require a single character delimiter, not {sep}."
+            self._logger.error(msg)
+            raise ValueError(msg)
 
     def __call__(self, *args, **kwargs) -> None:
         """Extracts the contents"""
 
-        if not self._skip(endpoint=self._destination):
+        if not self._extracted():
 
             os.makedirs(self._destination, exist_ok=True)
 
             with ZipFile(self._source, mode="r") as zip:
-                for zip_info in zip.infolist():
-                    if zip_info.filename[-1] == "/":
-                        continue
-                    zip_info.filename = os.path.basename(zip_info.filename)
-                    if self._member is not None:
-                        if zip_info.filename == self._member:
-                            zip.extract(zip_info, self._destination)
-                        else:
-                            continue
-                    else:
-                        zip.extract(zip_info, self._destination)
+                members = [
+                    zip_info.filename
+                    for zip_info in zip.infolist()
+                    if zip_info.filename[-1] != "/"
+                    and (
+                        self._member is None or os.path.basename(zip_info.filename) in self._member
+                    )
+                ]
+
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                for filepath in executor.map(self._unpack, members):
+                    self._logger.debug(f"Extracted {filepath}")
             self._logger.debug(f"Extracted zip archive from {self._source} to {self._destination}")
+
+    def _extracted(self) -> bool:
+        """Returns True if the members have already been extracted."""
+        if self._member is None:
+            return self._skip(endpoint=self._destination)
+        return all(self._skip(endpoint=self._endpoint(member)) for member in self._member)
+
+    def _endpoint(self, member: str) -> str:
+        """Returns the path of the file a member is extracted, or converted, to."""
+        filename = os.path.basename(member)
+        if self._converts(member):
+            filename = f"{os.path.splitext(filename)[0]}.parquet"
+        return os.path.join(self._destination, filename)
+
+    def _converts(self, member: str) -> bool:
+        """Returns True if the member is converted to Parquet."""
+        return self._to_parquet and os.path.splitext(member)[1].lower() in self.__tabular
+
+    def _unpack(self, member: str) -> str:
+        """Converts a delimited member to Parquet, if requested. Otherwise, extracts it."""
+        return self._convert(member) if self._converts(member) else self._extract(member)
+
+    def _extract(self, member: str) -> str:
+        """Extracts a member to the extract directory, discarding its directory."""
+        with ZipFile(self._source, mode="r") as zip:
+            zip_info = zip.getinfo(member)
+            zip_info.filename = os.path.basename(member)
+            return zip.extract(zip_info, self._destination)
+
+    def _convert(self, member: str) -> str:
+        """Streams a member through the CSV parser into a Parquet file, a block at a time."""
+        filepath = self._endpoint(member)
+        tempfile = os.path.join(
+            self._destination, f".{uuid.uuid4().hex[:8]}.{os.path.basename(filepath)}"
+        )
+        column_types = {
+            column: pa.type_for_alias(dtype) if isinstance(dtype, str) else dtype
+            for column, dtype in (self._column_types or {}).items()
+        }
+        try:
+            with ZipFile(self._source, mode="r") as zip, zip.open(member) as stream:
+                reader = pacsv.open_csv(
+                    stream,
+                    read_options=pacsv.ReadOptions(block_size=self._block_size),
+                    parse_options=pacsv.ParseOptions(delimiter=self._sep),
+                    convert_options=pacsv.ConvertOptions(column_types=column_types),
+                )
+                with pq.ParquetWriter(tempfile, schema=reader.schema) as writer:
+                    for batch in reader:
+                        writer.write_table(pa.Table.from_batches([batch]))
+            os.replace(tempfile, filepath)
+        except BaseException:
+            if os.path.exists(tempfile):
+                os.remove(tempfile)
+            raise
+        return filepath
@@ -11,20 +11,23 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday March 18th 2023 06:39:05 am                                                #
-# Modified   : Monday March 20th 2023 09:49:36 am                                                  #
+# Modified   : Monday October 19th 2026 01:47:43 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Data Prep: Filter Module"""
 from typing import Union
+import os
 import logging
-from tqdm import tqdm
-from pandas import pd
+import numpy as np
+import pandas as pd
 
-from recsys import Dataset
-
-from recsys import Operator
+from recsys.dataprep.reservoir import ReservoirState, random_rank
+from recsys.dataset.base import Dataset
+from recsys.dataset.parquet import ParquetDataset
+from recsys.services.io import IOService
+from recsys.workflow.operator import Operator
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -67,14 +70,18 @@ class MinItemsPerUserFilter(Operator):
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
+        # Lazy datasets read only the columns needed to count interactions.
+        interactions = _read(data, columns=[self._userid, self._itemid])
         userids = (
-            data.drop_duplicates([self._userid, self._itemid])[self._userid]
+            interactions.drop_duplicates([self._userid, self._itemid])[self._userid]
             if self._drop_duplicates
-            else data[self._userid]
+            else interactions[self._userid]
         )
         items_per_user = userids.value_counts()
-        users_to_keep = list(items_per_user[items_per_user >= self._min_items_per_user])
+        users_to_keep = items_per_user[items_per_user >= self._min_items_per_user].index
 
+        if isinstance(data, ParquetDataset):
+            return data.read(filters=[(self._userid, "in", users_to_keep.values)])
         return data[data[self._userid].isin(users_to_keep)].copy()
 
 
@@ -118,15 +125,19 @@ class MinUsersPerItemFilter(Operator):
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
+        # Lazy datasets read only the columns needed to count interactions.
+        interactions = _read(data, columns=[self._userid, self._itemid])
         itemids = (
-            data.drop_duplicates([self._userid, self._itemid])[self._itemid]
+            interactions.drop_duplicates([self._userid, self._itemid])[self._itemid]
             if self._drop_duplicates
-            else data[self._itemid]
+            else interactions[self._itemid]
         )
         users_per_item = itemids.value_counts()
-        items_to_keep = list(users_per_item[users_per_item >= self._min_users_per_item])
+        items_to_keep = users_per_item[users_per_item >= self._min_users_per_item].index
 
-        return data[data[self._userid].isin(items_to_keep)].copy()
+        if isinstance(data, ParquetDataset):
+            return data.read(filters=[(self._itemid, "in", items_to_keep.values)])
+        return data[data[self._itemid].isin(items_to_keep)].copy()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -135,18 +146,19 @@ class MinUsersPerItemFilter(Operator):
 class MaxItemsPerUserFilter(Operator):
     """Filters users based upon a maximum number of interactions.
 
-    The first 'max_items_per_user' interactions are obtained for each user. For each additional
-    user interaction, a randomly chosen interaction from the user's history is discarded,
-    and replaced by the new interaction. This process repeats until all interactions for
-    each user are processed in this way. Adapted from [1_].
+    The first 'max_items_per_user' interactions are obtained for each user. Thereafter, the
+    n-th interaction of a user replaces a randomly chosen retained interaction with
+    probability max_items_per_user / n, i.e. reservoir sampling. Adapted from [1_].
+
+    The reservoir retained at the end of this process is a uniformly random sample of the
+    user's interactions, so all users are sampled at once by ranking random priorities
+    within each user, rather than by replaying the interactions one at a time.
 
     Args:
         max_items_per_user (int): The maximum number of items allowed per user. Default = 1000
-        drop_duplicates (bool): Whether to drop duplicate interactions beetween a user
-            and an item. Default = True
         userid (str): Name of the column containing the user id.
         itemid (str): Name of the column containing the item id.
-        timestamp (timestamp): Timestamp of the interaction
+        seed (int): Seed for the random number generator. Default = None
 
     Reference:
     .. [1] S. Schelter, U. Celebi, and T. Dunning, “Efficient Incremental Cooccurrence
@@ -161,17 +173,15 @@ class MaxItemsPerUserFilter(Operator):
     def __init__(
         self,
         max_items_per_user: int = 1000,
-        drop_duplicates: bool = True,
         userid: str = "userId",
         itemid: str = "movieId",
-        timestamp: str = "timestamp",
+        seed: int = None,
     ) -> None:
         super().__init__()
         self._max_items_per_user = max_items_per_user
-        self._drop_duplicates = drop_duplicates
         self._userid = userid
         self._itemid = itemid
-        self._timestamp = timestamp
+        self._seed = seed
         self._interactions_cut = 0
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
@@ -183,50 +193,17 @@ class MaxItemsPerUserFilter(Operator):
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
-
-        # Sample the first user interactions, up to the threshold
-        data = self._sample_interactions(data=data)
-
-        data.drop(columns=["interactions"], inplace=True)
-
-        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
-
-        return data
-
-    def _sample_interactions(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Obtain the first transactions up to the threshold."""
-
-        # Groupby user, sort by timestamp ascending within groups, and count the interactions.
-        data["interactions"] = (
-            data.sort_values(by=self._timestamp, ascending=True)
-            .groupby(by=self._userid, group_keys=False)
-            .cumcount()
-            + 1
+        data = _read(data)
+        keep = _reservoir_sample(
+            groups=data[self._userid].values,
+            k=self._max_items_per_user,
+            rng=np.random.default_rng(self._seed),
         )
+        self._interactions_cut = int(data.shape[0] - keep.sum())
 
-        # Retain the first interactions up to the  threshold
-        data = data[data["interactions"] <= self._max_items_per_user]
-        pending = data[data["interactions"] > self._max_items_per_user]
-
-        if pending.shape[0] > 0:
-            data = self._handle_pending(data=data, pending=pending)
-        return data
-
-    def _handle_pending(self, data: pd.DataFrame, pending: pd.DataFrame) -> pd.DataFrame:
-        """Existing interactions are randomly withdrawn to accommodate new interactions."""
+        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
 
-        # Repeatedly remove a single interaction at random and replace with new interaction.
-        groups = pending.sort_values(by=[self._timestamp], ascending=True).groupby(
-            by=self._userid, group_keys=False
-        )
-        for name, ratings in tqdm(groups):
-            for _, row in ratings.iterrows():
-                row = row.to_frame()
-                eviction = data[data[self._userid] == name].sample(n=1, replace=False, axis=0)
-                self._interactions_cut += 1
-                data = data.drop(eviction.index.values)
-                data = pd.concat([data, row.T], axis=0)
-        return data
+        return data[keep].copy()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -235,18 +212,19 @@ class MaxItemsPerUserFilter(Operator):
 class MaxUsersPerItemFilter(Operator):
     """Filters items based upon a maximum number of interactions.
 
-    The first 'max_users_per_item' interactions are obtained for each item. For each additional
-    item interaction, a randomly chosen interaction from the item's history is discarded,
-    and replaced by the new interaction. This process repeats until all interactions for
-    each item are processed in this way. Adapted from [1_].
+    The first 'max_users_per_item' interactions are obtained for each item. Thereafter, the
+    n-th interaction of an item replaces a randomly chosen retained interaction with
+    probability max_users_per_item / n, i.e. reservoir sampling. Adapted from [1_].
+
+    The reservoir retained at the end of this process is a uniformly random sample of the
+    item's interactions, so all items are sampled at once by ranking random priorities
+    within each item, rather than by replaying the interactions one at a time.
 
     Args:
         max_users_per_item (int): The maximum number of interactions allowed per item. Default = 1000
-        drop_duplicates (bool): Whether to drop duplicate interactions beetween a user
-            and an item. Default = True
         userid (str): Name of the column containing the user id.
         itemid (str): Name of the column containing the item id.
-        timestamp (timestamp): Timestamp of the interaction
+        seed (int): Seed for the random number generator. Default = None
 
     Reference:
     .. [1] S. Schelter, U. Celebi, and T. Dunning, “Efficient Incremental Cooccurrence
@@ -262,17 +240,15 @@ class MaxUsersPerItemFilter(Operator):
     def __init__(
         self,
         max_users_per_item: int = 1000,
-        drop_duplicates: bool = True,
         userid: str = "userId",
         itemid: str = "movieId",
-        timestamp: str = "timestamp",
+        seed: int = None,
     ) -> None:
         super().__init__()
         self._max_users_per_item = max_users_per_item
-        self._drop_duplicates = drop_duplicates
         self._userid = userid
         self._itemid = itemid
-        self._timestamp = timestamp
+        self._seed = seed
         self._interactions_cut = 0
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
@@ -284,47 +260,340 @@ class MaxUsersPerItemFilter(Operator):
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
+        data = _read(data)
+        keep = _reservoir_sample(
+            groups=data[self._itemid].values,
+            k=self._max_users_per_item,
+            rng=np.random.default_rng(self._seed),
+        )
+        self._interactions_cut = int(data.shape[0] - keep.sum())
 
-        # Sample the first user interactions, up to the threshold
-        data = self._sample_interactions(data=data)
+        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
 
-        data.drop(columns=["interactions"], inplace=True)
+        return data[keep].copy()
 
-        self._logger.debug(f"\nInteractions cut: {self._interactions_cut}")
 
-        return data
+# ------------------------------------------------------------------------------------------------ #
+#                           INCREMENTAL MAXIMUM ITEMS PER USER                                     #
+# ------------------------------------------------------------------------------------------------ #
+class IncrementalMaxItemsPerUserFilter(Operator):
+    """Applies the maximum items per user cap to a batch of new interactions only.
+
+    Rather than re-filtering the whole history, the per user reservoirs of the
+    MaxItemsPerUserFilter are kept in a ReservoirState between runs, and each batch of new
+    interactions is merged into them. The items retained for each user are distributed as
+    if the cap had been applied to the full history.
+
+    The new interactions admitted are returned. Interactions of the history evicted from
+    the reservoirs are available as (user, item) pairs via the evictions property, and are
+    to be removed from the stored history.
+
+    Args:
+        max_items_per_user (int): The maximum number of items allowed per user. Default = 1000
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+        state_filepath (str): Path to which the ReservoirState is persisted between runs.
+            If None, the state is retained in memory only.
+        seed (int): Seed for the random number generator. Default = None
+    """
+
+    __name = "incremental_max_items_per_user_filter"
+    __desc = "Filters out new interactions above a threshold for each user."
+
+    def __init__(
+        self,
+        max_items_per_user: int = 1000,
+        userid: str = "userId",
+        itemid: str = "movieId",
+        state_filepath: str = None,
+        seed: int = None,
+    ) -> None:
+        super().__init__()
+        self._max_items_per_user = max_items_per_user
+        self._userid = userid
+        self._itemid = itemid
+        self._state_filepath = state_filepath
+        self._rng = np.random.default_rng(seed)
+        self._state = None
+        self._evictions = None
+        self._interactions_cut = 0
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def state(self) -> ReservoirState:
+        return self._state
+
+    @property
+    def evictions(self) -> pd.DataFrame:
+        """The (user, item) pairs of the history evicted by the last call."""
+        return self._evictions
+
+    def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
+        """Filters the new user interactions above a threshold
+
+        Args:
+            data (pd.DataFrame) The new user rating interactions.
+        """
+        data = _read(data)
+        self._state = _load_state(
+            state=self._state,
+            filepath=self._state_filepath,
+            k=self._max_items_per_user,
+            name="max_items_per_user_state",
+            desc="Reservoirs of the items retained per user",
+            logger=self._logger,
+        )
+        admitted, (keys, members) = self._state.update(
+            keys=data[self._userid].values, members=data[self._itemid].values, rng=self._rng
+        )
+        self._evictions = pd.DataFrame({self._userid: keys, self._itemid: members})
+        self._interactions_cut = int(data.shape[0] - admitted.sum())
+        self._logger.debug(
+            f"\nInteractions cut: {self._interactions_cut}. Evicted: {self._evictions.shape[0]}"
+        )
+
+        if self._state_filepath is not None:
+            IOService.write(filepath=self._state_filepath, data=self._state)
+        return data[admitted].copy()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                           INCREMENTAL MAXIMUM USERS PER ITEM                                     #
+# ------------------------------------------------------------------------------------------------ #
+class IncrementalMaxUsersPerItemFilter(Operator):
+    """Applies the maximum users per item cap to a batch of new interactions only.
+
+    Rather than re-filtering the whole history, the per item reservoirs of the
+    MaxUsersPerItemFilter are kept in a ReservoirState between runs, and each batch of new
+    interactions is merged into them. The users retained for each item are distributed as
+    if the cap had been applied to the full history.
+
+    The new interactions admitted are returned. Interactions of the history evicted from
+    the reservoirs are available as (item, user) pairs via the evictions property, and are
+    to be removed from the stored history.
+
+    Args:
+        max_users_per_item (int): The maximum number of users allowed per item. Default = 1000
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+        state_filepath (str): Path to which the ReservoirState is persisted between runs.
+            If None, the state is retained in memory only.
+        seed (int): Seed for the random number generator. Default = None
+    """
+
+    __name = "incremental_max_users_per_item_filter"
+    __desc = "Filters out new interactions above a threshold for each item."
+
+    def __init__(
+        self,
+        max_users_per_item: int = 1000,
+        userid: str = "userId",
+        itemid: str = "movieId",
+        state_filepath: str = None,
+        seed: int = None,
+    ) -> None:
+        super().__init__()
+        self._max_users_per_item = max_users_per_item
+        self._userid = userid
+        self._itemid = itemid
+        self._state_filepath = state_filepath
+        self._rng = np.random.default_rng(seed)
+        self._state = None
+        self._evictions = None
+        self._interactions_cut = 0
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def state(self) -> ReservoirState:
+        return self._state
 
-    def _sample_interactions(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Obtain the first transactions up to the respective threshold."""
+    @property
+    def evictions(self) -> pd.DataFrame:
+        """The (item, user) pairs of the history evicted by the last call."""
+        return self._evictions
 
-        # Groupby user, sort by timestamp ascending within groups, and count the interactions.
-        data["interactions"] = (
-            data.sort_values(by=self._timestamp, ascending=True)
-            .groupby(by=self._itemid, group_keys=False)
-            .cumcount()
-            + 1
+    def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
+        """Filters the new item interactions above a threshold
+
+        Args:
+            data (pd.DataFrame) The new user rating interactions.
+        """
+        data = _read(data)
+        self._state = _load_state(
+            state=self._state,
+            filepath=self._state_filepath,
+            k=self._max_users_per_item,
+            name="max_users_per_item_state",
+            desc="Reservoirs of the users retained per item",
+            logger=self._logger,
+        )
+        admitted, (keys, members) = self._state.update(
+            keys=data[self._itemid].values, members=data[self._userid].values, rng=self._rng
         )
+        self._evictions = pd.DataFrame({self._itemid: keys, self._userid: members})
+        self._interactions_cut = int(data.shape[0] - admitted.sum())
+        self._logger.debug(
+            f"\nInteractions cut: {self._interactions_cut}. Evicted: {self._evictions.shape[0]}"
+        )
+
+        if self._state_filepath is not None:
+            IOService.write(filepath=self._state_filepath, data=self._state)
+        return data[admitted].copy()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       K-CORE FILTER                                              #
+# ------------------------------------------------------------------------------------------------ #
+class KCoreFilter(Operator):
+    """Filters users and items until both minimum interaction thresholds hold simultaneously.
 
-        # Retain the first interactions up to the  threshold
-        data = data[data["interactions"] <= self._max_users_per_item]
-        pending = data[data["interactions"] > self._max_users_per_item]
+    Removing users with few items reduces the number of users per item, and vice versa, so
+    a single pass of the MinItemsPerUserFilter and MinUsersPerItemFilter does not, in general,
+    satisfy both thresholds. This filter applies both constraints repeatedly, counting
+    interactions with np.bincount over integer codes and tracking retained rows with a
+    boolean mask, until no further rows are removed.
 
-        if pending.shape[0] > 0:
-            data = self._handle_pending(data=data, pending=pending)
-        return data
+    Args:
+        min_items_per_user (int): The minimum number of items per user required. Default = 4
+        min_users_per_item (int): The minimum number of users per item required. Default = 4
+        drop_duplicates (bool): Whether to count duplicate interactions beetween a user
+            and an item once. Default = True
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+        max_iterations (int): Maximum number of iterations. Default = 100
+
+    """
 
-    def _handle_pending(self, data: pd.DataFrame, pending: pd.DataFrame) -> pd.DataFrame:
-        """Existing interactions are randomly withdrawn to accommodate new interactions."""
+    __name = "k_core_filter"
+    __desc = (
+        "Filters out users and items with interaction counts below thresholds until convergence."
+    )
 
-        # Repeatedly remove a single interaction at random and replace with new interaction.
-        groups = pending.sort_values(by=[self._timestamp], ascending=True).groupby(
-            by=self._itemid, group_keys=False
+    def __init__(
+        self,
+        min_items_per_user: int = 4,
+        min_users_per_item: int = 4,
+        drop_duplicates: bool = True,
+        userid: str = "userId",
+        itemid: str = "movieId",
+        max_iterations: int = 100,
+    ) -> None:
+        super().__init__()
+        self._min_items_per_user = min_items_per_user
+        self._min_users_per_item = min_users_per_item
+        self._drop_duplicates = drop_duplicates
+        self._userid = userid
+        self._itemid = itemid
+        self._max_iterations = max_iterations
+        self._iterations = 0
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
         )
-        for name, ratings in tqdm(groups):
-            for _, row in ratings.iterrows():
-                row = row.to_frame()
-                eviction = data[data[self._itemid] == name].sample(n=1, replace=False, axis=0)
-                self._interactions_cut += 1
-                data = data.drop(eviction.index.values)
-                data = pd.concat([data, row.T], axis=0)
-        return data
+
+    @property
+    def iterations(self) -> int:
+        """Number of iterations performed by the last call."""
+        return self._iterations
+
+    def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
+        """Filters the interactions to the k-core of the user/item graph.
+
+        Args:
+            data (pd.DataFrame) The user rating interaction dataframe.
+        """
+        # Lazy datasets read only the columns needed to count interactions.
+        interactions = _read(data, columns=[self._userid, self._itemid])
+        users, user_ids = pd.factorize(interactions[self._userid])
+        items, item_ids = pd.factorize(interactions[self._itemid])
+
+        # Rows counted towards the thresholds: the first of any duplicate interactions.
+        counted = np.ones(shape=users.shape[0], dtype=bool)
+        if self._drop_duplicates:
+            pairs = users.astype(np.int64) * len(item_ids) + items
+            _, first = np.unique(pairs, return_index=True)
+            counted[:] = False
+            counted[first] = True
+
+        keep = np.ones(shape=users.shape[0], dtype=bool)
+        n_kept = keep.shape[0]
+        self._iterations = 0
+        while self._iterations < self._max_iterations:
+            self._iterations += 1
+            counts = keep & counted
+            items_per_user = np.bincount(users[counts], minlength=len(user_ids))
+            users_per_item = np.bincount(items[counts], minlength=len(item_ids))
+            keep &= items_per_user[users] >= self._min_items_per_user
+            keep &= users_per_item[items] >= self._min_users_per_item
+
+            removed = n_kept - int(keep.sum())
+            n_kept -= removed
+            self._logger.info(
+                f"Iteration {self._iterations}: removed {removed} interactions. {n_kept} remain."
+            )
+            if removed == 0:
+                break
+        else:
+            self._logger.warning(
+                f"K-core filter did not converge after {self._max_iterations} iterations."
+            )
+
+        if isinstance(data, ParquetDataset):
+            return data.read(
+                filters=[
+                    (self._userid, "in", np.asarray(user_ids)[np.unique(users[keep])]),
+                    (self._itemid, "in", np.asarray(item_ids)[np.unique(items[keep])]),
+                ]
+            )
+        return data[keep].copy()
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _reservoir_sample(groups: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Returns a mask selecting a uniformly random sample of at most k rows from each group.
+
+    Rows of groups with k or fewer rows are all selected. The rows of larger groups are
+    ranked in random order within each group, and the first k rows of each group are
+    selected, in a single sort over the overflowing rows only.
+
+    Args:
+        groups (np.ndarray): The group, e.g. user id, of each row.
+        k (int): The maximum number of rows selected from each group.
+        rng (np.random.Generator): The random number generator.
+    """
+    codes, _ = pd.factorize(groups)
+    overflow = np.flatnonzero(np.bincount(codes)[codes] > k)
+    keep = np.ones(shape=codes.shape[0], dtype=bool)
+    if overflow.shape[0] == 0:
+        return keep
+
+    keep[overflow] = random_rank(codes[overflow], rng) < k
+    return keep
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _load_state(
+    state: ReservoirState, filepath: str, k: int, name: str, desc: str, logger: logging.Logger
+) -> ReservoirState:
+    """Returns the reservoir state held in memory, else persisted at filepath, else a new one."""
+    if state is None and filepath is not None and os.path.exists(filepath):
+        state = IOService.read(filepath=filepath)
+    if state is None:
+        state = ReservoirState(name=name, desc=desc, k=k)
+        state.filepath = filepath
+    if state.k != k:
+        msg = f"The reservoir state was created with a cap of {state.k}, not {k}."
+        logger.error(msg)
+        raise ValueError(msg)
+    return state
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _read(data: Union[pd.DataFrame, ParquetDataset], columns: list = None) -> pd.DataFrame:
+    """Returns the interaction dataframe, reading only the designated columns from lazy datasets."""
+    if isinstance(data, ParquetDataset):
+        return data.read(columns=columns)
+    return data
@@ -11,20 +11,123 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday March 18th 2023 06:41:01 am                                                #
-# Modified   : Monday March 20th 2023 09:49:47 am                                                  #
+# Modified   : Monday October 19th 2026 12:24:02 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Data Prep: Index Module"""
+from __future__ import annotations
 from typing import Union
 import logging
 
-from pandas import pd
+import pandas as pd
 import numpy as np
 
-from recsys import Dataset
-from recsys import Operator
+from recsys.asset.base import Asset
+from recsys.dataset.base import Dataset
+from recsys.services.io import IOService
+from recsys.workflow.operator import Operator
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         ID MAP                                                   #
+# ------------------------------------------------------------------------------------------------ #
+class IdMap(Asset):
+    """Bidirectional mapping between user and item ids and their sequential indices.
+
+    The index of an id is its position in the sorted array of unique ids, so the mapping is
+    stored as just those two arrays. Ids are encoded by binary search and indices are
+    decoded by array lookup, both vectorized.
+
+    Args:
+        name (str): Name of the id map in lowercase
+        desc (str): Description of the id map
+        users (np.ndarray): Sorted array of unique user ids
+        items (np.ndarray): Sorted array of unique item ids
+    """
+
+    def __init__(self, name: str, desc: str, users: np.ndarray, items: np.ndarray) -> None:
+        super().__init__()
+        self._name = name
+        self._desc = desc
+        self._users = np.asarray(users)
+        self._items = np.asarray(items)
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def desc(self) -> str:
+        return self._desc
+
+    @property
+    def users(self) -> np.ndarray:
+        return self._users
+
+    @property
+    def items(self) -> np.ndarray:
+        return self._items
+
+    @property
+    def n_users(self) -> int:
+        return self._users.shape[0]
+
+    @property
+    def n_items(self) -> int:
+        return self._items.shape[0]
+
+    def encode_users(self, ids: np.ndarray) -> np.ndarray:
+        """Returns the indices for user ids. Unknown ids are encoded as -1."""
+        return encode(ids, self._users)
+
+    def decode_users(self, idx: np.ndarray) -> np.ndarray:
+        """Returns the user ids for user indices."""
+        return decode(idx, self._users)
+
+    def encode_items(self, ids: np.ndarray) -> np.ndarray:
+        """Returns the indices for item ids. Unknown ids are encoded as -1."""
+        return encode(ids, self._items)
+
+    def decode_items(self, idx: np.ndarray) -> np.ndarray:
+        """Returns the item ids for item indices."""
+        return decode(idx, self._items)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def encode(ids: np.ndarray, vocabulary: np.ndarray) -> np.ndarray:
+    """Encodes ids as their positions in a sorted vocabulary of unique ids.
+
+    Args:
+        ids (np.ndarray): The ids to encode.
+        vocabulary (np.ndarray): Sorted array of unique ids.
+
+    Returns: np.ndarray of int32 indices, with -1 for ids not in the vocabulary.
+    """
+    ids = np.asarray(ids)
+    if vocabulary.shape[0] == 0:
+        return np.full(shape=ids.shape, fill_value=-1, dtype=np.int32)
+    idx = np.searchsorted(vocabulary, ids)
+    idx[idx == vocabulary.shape[0]] = 0
+    return np.where(vocabulary[idx] == ids, idx, -1).astype(np.int32)
+
+
+def decode(idx: np.ndarray, vocabulary: np.ndarray) -> np.ndarray:
+    """Decodes indices into ids from a sorted vocabulary of unique ids.
+
+    Args:
+        idx (np.ndarray): The indices to decode.
+        vocabulary (np.ndarray): Sorted array of unique ids.
+    """
+    idx = np.asarray(idx)
+    if idx.size > 0 and (idx.min() < 0 or idx.max() >= vocabulary.shape[0]):
+        msg = f"Indices must be in the range [0, {vocabulary.shape[0]})."
+        raise ValueError(msg)
+    return vocabulary[idx]
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -33,11 +136,15 @@ from recsys import Operator
 class IndexSequenceOperator(Operator):
     """Creates a user and item indices in the sequential space.
 
+    Indices are assigned in sorted id order via pd.factorize, and the id to index mappings
+    are retained in an IdMap, which is persisted if a filepath is provided.
+
     Args:
         useridx (str): The column to contain the new user index.
         itemidx (str: The column to contain the new item index.
         userid (str): Name of the column containing the user id.
         itemid (str): Name of the column containing the item id.
+        idmap_filepath (str): Optional path to which the IdMap is persisted.
 
     """
 
@@ -50,35 +157,52 @@ class IndexSequenceOperator(Operator):
         itemidx: str = "itemidx",
         userid: str = "userId",
         itemid: str = "movieId",
+        idmap_filepath: str = None,
     ) -> None:
         super().__init__()
         self._useridx = useridx
         self._itemidx = itemidx
         self._userid = userid
         self._itemid = itemid
+        self._idmap_filepath = idmap_filepath
+        self._idmap = None
 
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
 
+    @property
+    def idmap(self) -> IdMap:
+        """The id to index mappings created by the last call."""
+        return self._idmap
+
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
         """Filters the user interactions by the number of items per user
 
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
-        if "itemidx" in data.columns:
+        if self._itemidx in data.columns:
             msg = "The dataset has already been reindexed."
             self._logger.info(msg)
-        else:
-            data = self._reindex(data=data, id=self._userid, to=self._useridx)
-            return self._reindex(data=data, id=self._itemid, to=self._itemidx)
-
-    def _reindex(self, data: pd.DataFrame, id: str, to: str) -> pd.DataFrame:
-        """Creates sequential ids for users and movies."""
-        # Get unique user or movie ids.
-        features = np.sort(data[id].unique())
-        features = pd.DataFrame(data=features, columns=[id])
-        features.reset_index(inplace=True)
-        features = features.rename(columns={"index": to})
-        return data.merge(features, how="left", on=id)
+            return data
+
+        data = data.copy(deep=False)
+        data[self._useridx], users = self._reindex(data=data, id=self._userid)
+        data[self._itemidx], items = self._reindex(data=data, id=self._itemid)
+
+        self._idmap = IdMap(
+            name="idmap", desc="User and item id to index mappings", users=users, items=items
+        )
+        if self._idmap_filepath is not None:
+            self._idmap.filepath = self._idmap_filepath
+            IOService.write(filepath=self._idmap_filepath, data=self._idmap)
+        return data
+
+    def _reindex(self, data: pd.DataFrame, id: str) -> tuple:
+        """Creates sequential ids for users and movies.
+
+        Returns the indices and the sorted unique ids they index into.
+        """
+        codes, uniques = pd.factorize(data[id], sort=True)
+        return codes.astype(np.int32), np.asarray(uniques)
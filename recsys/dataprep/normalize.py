@@ -11,70 +11,330 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday March 18th 2023 06:41:14 am                                                #
-# Modified   : Monday March 20th 2023 09:49:58 am                                                  #
+# Modified   : Monday October 19th 2026 01:22:49 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 """Data Prep: Normalize Module"""
+from __future__ import annotations
+from dataclasses import dataclass
 from typing import Union
 import logging
 
-from pandas import pd
+import numpy as np
+import pandas as pd
 
-from recsys import Dataset
-from recsys import Operator
+from recsys.asset.base import Asset
+from recsys.dataprep.index import encode
+from recsys.dataset.base import Dataset
+from recsys.services.io import IOService
+from recsys.workflow.operator import Operator
+
+# ------------------------------------------------------------------------------------------------ #
+SCHEMES = ("mean", "zscore", "baseline")
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class GroupStats:
+    """Rating statistics per group, aligned with the sorted unique group ids, i.e. mean[k]
+    is the average rating of ids[k].
+
+    Args:
+        column (str): The column containing the grouping variable.
+        ids (np.ndarray): Sorted array of unique group ids.
+        count (np.ndarray): Number of ratings per group.
+        mean (np.ndarray): Average rating per group.
+        std (np.ndarray): Standard deviation of the ratings per group.
+        bias (np.ndarray): Baseline bias per group. Only computed for the baseline scheme.
+    """
+
+    column: str
+    ids: np.ndarray
+    count: np.ndarray
+    mean: np.ndarray
+    std: np.ndarray
+    bias: np.ndarray = None
+
+    def lookup(self, ids: np.ndarray, values: np.ndarray, default: float) -> np.ndarray:
+        """Returns the values for each id, and the default for ids not seen in the stats.
+
+        Args:
+            ids (np.ndarray): The group ids to look up.
+            values (np.ndarray): The per group values, e.g. mean, aligned with the stats ids.
+            default (float): The value for unknown ids.
+        """
+        idx = encode(ids, self.ids)
+        return np.where(idx >= 0, values[idx], default)
+
+
+def group_stats(column: str, ids: np.ndarray, ratings: np.ndarray) -> GroupStats:
+    """Computes the count, mean and standard deviation of the ratings per group in a single
+    vectorized pass with np.bincount.
+
+    Args:
+        column (str): The column containing the grouping variable.
+        ids (np.ndarray): The group id of each rating.
+        ratings (np.ndarray): The ratings.
+    """
+    codes, uniques = pd.factorize(ids, sort=True)
+    count = np.bincount(codes)
+    mean = np.bincount(codes, weights=ratings) / count
+    variance = np.bincount(codes, weights=np.square(ratings)) / count - np.square(mean)
+    return GroupStats(
+        column=column,
+        ids=np.asarray(uniques),
+        count=count,
+        mean=mean,
+        std=np.sqrt(np.maximum(variance, 0.0)),
+    )
 
 
 # ------------------------------------------------------------------------------------------------ #
-#                            MINIMUM ITEMS PER USER                                                #
+#                                  NORMALIZATION STATS                                             #
+# ------------------------------------------------------------------------------------------------ #
+class NormalizationStats(Asset):
+    """The statistics with which ratings were normalized, retained to de-normalize predictions.
+
+    Ratings of groups not seen when the stats were computed are normalized against the
+    global statistics, i.e. the global mean and standard deviation, and zero biases.
+
+    Args:
+        name (str): Name of the normalization stats in lowercase
+        desc (str): Description of the normalization stats
+        scheme (str): One of 'mean', 'zscore', or 'baseline'.
+        global_mean (float): The average of all ratings.
+        global_std (float): The standard deviation of all ratings.
+        groups (list): The GroupStats of the grouping variables, i.e. the 'by' column for the
+            mean and zscore schemes, and the item and user columns for the baseline scheme.
+        epsilon (float): Added to normalized ratings to avoid zero values.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        desc: str,
+        scheme: str,
+        global_mean: float,
+        global_std: float,
+        groups: list,
+        epsilon: float = 1e-9,
+    ) -> None:
+        super().__init__()
+        self._name = name
+        self._desc = desc
+        self._scheme = scheme
+        self._global_mean = global_mean
+        self._global_std = global_std
+        self._groups = groups
+        self._epsilon = epsilon
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def desc(self) -> str:
+        return self._desc
+
+    @property
+    def scheme(self) -> str:
+        return self._scheme
+
+    @property
+    def global_mean(self) -> float:
+        return self._global_mean
+
+    @property
+    def global_std(self) -> float:
+        return self._global_std
+
+    @property
+    def groups(self) -> list:
+        return self._groups
+
+    def normalize(self, data: pd.DataFrame, values: Union[str, np.ndarray]) -> np.ndarray:
+        """Returns the normalized values.
+
+        Args:
+            data (pd.DataFrame): Dataframe containing the grouping columns.
+            values (str, np.ndarray): The values to normalize, or the column containing them.
+        """
+        values = data[values].values if isinstance(values, str) else np.asarray(values)
+        center, scale = self._parameters(data)
+        return (values - center) / scale + self._epsilon
+
+    def denormalize(self, data: pd.DataFrame, values: Union[str, np.ndarray]) -> np.ndarray:
+        """Returns values, e.g. predictions, on the original rating scale.
+
+        Args:
+            data (pd.DataFrame): Dataframe containing the grouping columns.
+            values (str, np.ndarray): The normalized values, or the column containing them.
+        """
+        values = data[values].values if isinstance(values, str) else np.asarray(values)
+        center, scale = self._parameters(data)
+        return (values - self._epsilon) * scale + center
+
+    def _parameters(self, data: pd.DataFrame) -> tuple:
+        """Returns the center subtracted from, and the scale dividing, each rating."""
+        if self._scheme == "baseline":
+            center = np.full(shape=data.shape[0], fill_value=self._global_mean)
+            for group in self._groups:
+                center += group.lookup(data[group.column].values, group.bias, default=0.0)
+            return center, 1.0
+
+        group = self._groups[0]
+        center = group.lookup(data[group.column].values, group.mean, default=self._global_mean)
+        if self._scheme == "mean":
+            return center, 1.0
+        # Groups with constant ratings are centered but not scaled.
+        std = np.where(group.std > 0, group.std, 1.0)
+        return center, group.lookup(data[group.column].values, std, default=self._global_std)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     NORMALIZE OPERATOR                                           #
 # ------------------------------------------------------------------------------------------------ #
 class NormalizeOperator(Operator):
-    """Normalizes ratings values via mean centering.
+    """Normalizes ratings values.
+
+    The count, mean and standard deviation of the ratings per group are computed in a single
+    vectorized pass with np.bincount. Three schemes are supported:
+
+        mean: Ratings are centered on the average rating of the group.
+        zscore: Centered ratings are divided by the standard deviation of the group.
+        baseline: The residual of the baseline estimate mu + b_u + b_i, where mu is the global
+            average rating, b_i the item bias and b_u the user bias, each shrunk towards zero
+            by the shrinkage factor. The 'by' column is not used.
+
+    The normalized ratings are written to the output column, leaving the rating and grouping
+    columns intact. The NormalizationStats are retained, and persisted if a filepath is
+    provided, so that predictions can be de-normalized without recomputing them.
 
     Args:
-        by (str): The column containing the grouping variable.
-        epsilon (float): A factor added to the mean centered ratings to avoid zero values.
+        by (str): The column containing the grouping variable. Default = 'userId'
+        rating_col (str): The column containing the ratings.
+        epsilon (float): A factor added to the normalized ratings to avoid zero values.
             Default = 1e-9
+        scheme (str): One of 'mean', 'zscore', or 'baseline'. Default = 'mean'
+        output_col (str): The column to contain the normalized ratings. Ratings mean centered
+            by user or item default to '<rating_col>_cu' or '<rating_col>_ci', the centered
+            columns read by MovieLens.to_csr. Otherwise, defaults to
+            '<rating_col>_<scheme>_<by>', or '<rating_col>_baseline' for the baseline scheme.
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+        shrinkage (float): Regularization of the baseline biases. Default = 0
+        stats_filepath (str): Optional path to which the NormalizationStats are persisted.
 
     """
 
     __name = "normalize_operator"
-    __desc = "Mean centers ratings."
+    __desc = "Normalizes ratings."
 
     def __init__(
         self,
-        by: str,
+        by: str = "userId",
         rating_col: str = "rating",
         epsilon: float = 1e-9,
+        scheme: str = "mean",
+        output_col: str = None,
+        userid: str = "userId",
+        itemid: str = "movieId",
+        shrinkage: float = 0.0,
+        stats_filepath: str = None,
     ) -> None:
         super().__init__()
         self._by = by
         self._rating_col = rating_col
         self._epsilon = epsilon
+        self._scheme = scheme
+        self._userid = userid
+        self._itemid = itemid
+        self._shrinkage = shrinkage
+        self._stats_filepath = stats_filepath
+        self._stats = None
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
+        if scheme not in SCHEMES:
+            msg = f"Scheme {scheme} is not valid. Valid values are {SCHEMES}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        self._output_col = output_col or self._default_output_col()
+
+    def _default_output_col(self) -> str:
+        """Returns the name of the output column if none is provided."""
+        if self._scheme == "baseline":
+            return f"{self._rating_col}_baseline"
+        if self._scheme == "mean" and self._by in (self._userid, self._itemid):
+            return f"{self._rating_col}_c{'u' if self._by == self._userid else 'i'}"
+        return f"{self._rating_col}_{self._scheme}_{self._by}"
+
+    @property
+    def stats(self) -> NormalizationStats:
+        """The normalization stats computed by the last call."""
+        return self._stats
 
     def __call__(self, data: Union[pd.DataFrame, Dataset]) -> pd.DataFrame:
-        """Mean centers ratings.
+        """Normalizes ratings.
 
         Args:
             data (pd.DataFrame) The user rating interaction dataframe.
         """
         try:
-            # Obtain average ratings
-            rbar = data.groupby(by=self._by)[self._rating_col].mean().reset_index()
-            rbar.columns = [self._by, "rbar"]
-
-            # Merge with ratings dataset
-            data = data.merge(rbar, on=self._by, how="left")
-
-            # Compute centered rating and drop the average rating column
-            data[self._by] = data[self._rating_col] - data["rbar"]
-            data = data.drop(columns=["rbar"])
-            return data
-        except KeyError:
-            msg = f"Column {self._by} is not valid."
+            self._stats = self._fit(data)
+        except KeyError as e:
+            msg = f"Column {e} is not valid."
             self._logger.error(msg)
             raise ValueError(msg)
+
+        data = data.copy(deep=False)
+        data[self._output_col] = self._stats.normalize(data, values=self._rating_col)
+
+        if self._stats_filepath is not None:
+            self._stats.filepath = self._stats_filepath
+            IOService.write(filepath=self._stats_filepath, data=self._stats)
+        return data
+
+    def denormalize(self, data: pd.DataFrame, values: Union[str, np.ndarray]) -> np.ndarray:
+        """Returns normalized values, e.g. predictions, on the original rating scale.
+
+        Args:
+            data (pd.DataFrame): Dataframe containing the grouping columns.
+            values (str, np.ndarray): The normalized values, or the column containing them.
+        """
+        return self._stats.denormalize(data, values=values)
+
+    def _fit(self, data: pd.DataFrame) -> NormalizationStats:
+        """Computes the normalization stats."""
+        ratings = data[self._rating_col].values.astype(np.float64)
+        mu = float(ratings.mean())
+        if self._scheme == "baseline":
+            groups = self._biases(data, ratings, mu)
+        else:
+            groups = [group_stats(column=self._by, ids=data[self._by].values, ratings=ratings)]
+        return NormalizationStats(
+            name=f"{self._scheme}_normalization_stats",
+            desc=f"Statistics of the {self._scheme} normalization of {self._rating_col}",
+            scheme=self._scheme,
+            global_mean=mu,
+            global_std=float(ratings.std()) or 1.0,
+            groups=groups,
+            epsilon=self._epsilon,
+        )
+
+    def _biases(self, data: pd.DataFrame, ratings: np.ndarray, mu: float) -> list:
+        """Computes the item biases, then the user biases of the item bias residuals."""
+        items = group_stats(column=self._itemid, ids=data[self._itemid].values, ratings=ratings)
+        users = group_stats(column=self._userid, ids=data[self._userid].values, ratings=ratings)
+
+        item_codes = encode(data[self._itemid].values, items.ids)
+        items.bias = np.bincount(item_codes, weights=ratings - mu) / (items.count + self._shrinkage)
+        residuals = ratings - mu - items.bias[item_codes]
+        user_codes = encode(data[self._userid].values, users.ids)
+        users.bias = np.bincount(user_codes, weights=residuals) / (users.count + self._shrinkage)
+        return [items, users]
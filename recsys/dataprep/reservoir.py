@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/dataprep/reservoir.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:32:02 am                                                #
+# Modified   : Monday October 19th 2026 01:26:50 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Data Prep: Reservoir State Module"""
+from __future__ import annotations
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.asset.base import Asset
+from recsys.dataprep.index import encode
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     RESERVOIR STATE                                              #
+# ------------------------------------------------------------------------------------------------ #
+class ReservoirState(Asset):
+    """Per key reservoirs of at most k members, maintained across incremental loads.
+
+    For each key, e.g. a user, the state retains the number of interactions seen to date and a
+    uniformly random sample of at most k of them, identified by their member, e.g. the item.
+    The state is stored in three flat arrays: the sorted unique keys, the count seen for
+    each key, and the members of all reservoirs grouped by key in key order. The size of the
+    reservoir of a key is min(seen, k), so its members are located by a cumulative sum.
+
+    A batch is merged per key with a hypergeometric draw of the number of new interactions
+    that enter the reservoir, followed by uniform choices of the entering interactions from
+    the batch and of the surviving members from the old reservoir. The result is
+    distributed exactly as reservoir sampling over the whole history.
+
+    Args:
+        name (str): Name of the reservoir state in lowercase
+        desc (str): Description of the reservoir state
+        k (int): The maximum number of members retained per key.
+    """
+
+    def __init__(self, name: str, desc: str, k: int) -> None:
+        super().__init__()
+        self._name = name
+        self._desc = desc
+        self._k = k
+        self._keys = np.empty(shape=0, dtype=np.int64)
+        self._seen = np.empty(shape=0, dtype=np.int64)
+        self._members = np.empty(shape=0, dtype=np.int64)
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def desc(self) -> str:
+        return self._desc
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._keys
+
+    @property
+    def seen(self) -> np.ndarray:
+        return self._seen
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """The number of members in the reservoir of each key."""
+        return np.minimum(self._seen, self._k)
+
+    @property
+    def n_keys(self) -> int:
+        return self._keys.shape[0]
+
+    def members(self, key: int) -> np.ndarray:
+        """Returns the members of the reservoir of a key."""
+        idx = encode(np.array([key]), self._keys)[0]
+        if idx < 0:
+            return self._members[:0]
+        offsets = np.r_[0, np.cumsum(self.sizes)]
+        return self._members[offsets[idx] : offsets[idx + 1]]
+
+    def to_df(self, key: str = "key", member: str = "member") -> pd.DataFrame:
+        """Returns the retained (key, member) pairs."""
+        return pd.DataFrame(
+            {key: np.repeat(self._keys, self.sizes), member: self._members}, copy=False
+        )
+
+    def update(self, keys: np.ndarray, members: np.ndarray, rng: np.random.Generator) -> tuple:
+        """Merges a batch of interactions into the reservoirs.
+
+        Args:
+            keys (np.ndarray): The key, e.g. user id, of each new interaction.
+            members (np.ndarray): The member, e.g. item id, of each new interaction.
+            rng (np.random.Generator): The random number generator.
+
+        Returns: A boolean mask over the batch selecting the interactions admitted to the
+            reservoirs, and the keys and members of the previously retained pairs evicted.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        members = np.asarray(members, dtype=np.int64)
+
+        # Union of the known keys and the batch keys, with counts before and in the batch.
+        union = np.union1d(self._keys, keys)
+        batch_pos = np.searchsorted(union, keys)
+        old_pos = np.searchsorted(union, self._keys)
+        old_seen = np.zeros(shape=union.shape[0], dtype=np.int64)
+        old_seen[old_pos] = self._seen
+        new_seen = np.bincount(batch_pos, minlength=union.shape[0])
+
+        # Number of new interactions entering each reservoir, among those touched by the batch.
+        size = np.minimum(old_seen + new_seen, self._k)
+        entering = np.zeros(shape=union.shape[0], dtype=np.int64)
+        touched = new_seen > 0
+        entering[touched] = rng.hypergeometric(
+            ngood=new_seen[touched], nbad=old_seen[touched], nsample=size[touched]
+        )
+        surviving = size - entering
+
+        # Only members of reservoirs that overflow as new interactions enter are candidates for
+        # eviction.
+        batch_rank = random_rank(batch_pos, rng)
+        admitted = batch_rank < entering[batch_pos]
+        member_pos = np.repeat(old_pos, self.sizes)
+        evicted = np.zeros(shape=member_pos.shape[0], dtype=bool)
+        overflow = surviving < np.minimum(old_seen, self._k)
+        candidates = np.flatnonzero(overflow[member_pos])
+        evicted[candidates] = (
+            random_rank(member_pos[candidates], rng) >= surviving[member_pos[candidates]]
+        )
+
+        # Each reservoir holds its surviving members followed by its admitted interactions,
+        # so every retained pair is scattered to its slot without sorting the state.
+        start = np.r_[0, np.cumsum(size)[:-1]]
+        kept_pos = member_pos[~evicted]
+        kept_start = np.r_[0, np.cumsum(surviving)[:-1]]
+        kept_rank = np.arange(kept_pos.shape[0]) - kept_start[kept_pos]
+        retained = np.empty(shape=int(size.sum()), dtype=np.int64)
+        retained[start[kept_pos] + kept_rank] = self._members[~evicted]
+        admitted_pos = batch_pos[admitted]
+        retained[start[admitted_pos] + surviving[admitted_pos] + batch_rank[admitted]] = members[
+            admitted
+        ]
+
+        evictions = (union[member_pos[evicted]], self._members[evicted])
+        self._keys = union
+        self._seen = old_seen + new_seen
+        self._members = retained
+
+        self._logger.debug(
+            f"Admitted {int(admitted.sum())} of {keys.shape[0]} interactions and evicted "
+            f"{int(evicted.sum())} across {int(touched.sum())} reservoirs."
+        )
+        return admitted, evictions
+
+
+# ------------------------------------------------------------------------------------------------ #
+def random_rank(groups: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Returns a uniformly random rank for each row among the rows of its group.
+
+    Args:
+        groups (np.ndarray): Non-negative integer group codes.
+        rng (np.random.Generator): The random number generator.
+    """
+    rank = np.empty(shape=groups.shape[0], dtype=np.int64)
+    if groups.shape[0] == 0:
+        return rank
+    # Sorted by group, then by a random priority within the group.
+    order = np.lexsort((rng.random(groups.shape[0]), groups))
+    sorted_groups = groups[order]
+    starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+    sizes = np.diff(np.r_[starts, sorted_groups.shape[0]])
+    rank[order] = np.arange(sorted_groups.shape[0]) - np.repeat(starts, sizes)
+    return rank
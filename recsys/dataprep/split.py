@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday February 24th 2023 09:20:09 pm                                               #
-# Modified   : Monday March 20th 2023 09:50:08 am                                                  #
+# Modified   : Monday October 19th 2026 01:45:12 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -19,14 +19,26 @@
 """Train/Test Split Module"""
 from __future__ import annotations
 import os
+from typing import Iterator
 import logging
 
-from recsys import Operator
+import numpy as np
+import pandas as pd
+
+from recsys.workflow.operator import Operator
 from recsys.dataprep.artifact import Artifact
 from recsys.services.log import log
 from recsys.dataset.base import Dataset
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.parquet import ParquetDataset
+from recsys.dataset.view import SplitView
 from recsys.services.io import IOService
 
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+OUTPUTS = ("parquet", "index")
+STRATEGIES = ("leave_last", "fraction")
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                TEMPORAL TRAIN/TEST SPLIT                                         #
@@ -34,6 +46,19 @@ from recsys.services.io import IOService
 class TemporalSplitOperator(Operator):
     """Temporal train validatioon, and test split uses timestamp to split along a temporal dimension
 
+    The cut points are the timestamps at the train and validation boundaries, selected with
+    np.partition rather than a full sort, and the splits are boolean masks over the
+    timestamps. Interactions sharing the timestamp at a cut point are assigned to the later
+    split.
+
+    In-memory datasets are split in one of two output formats:
+        parquet: Each split is written to '<name>.parquet' in the directory, and returned as
+            a lazy ParquetDataset.
+        index: Each split is an array of row positions into the parent dataset, persisted to
+            '<name>.pkl' in the directory.
+
+    Parquet backed datasets are split into lazy datasets selecting each time window.
+
     Args:
         directory (str): The directory into which the splits will be persisted.
         train_size (float): Proportion of data for training. Default = 0.80
@@ -42,10 +67,16 @@ class TemporalSplitOperator(Operator):
             1 - (train_size + test_size)
         timestamp_var (str): The variable containing the timestamp
         force (bool): Whether to overwrite existing data if it already exists.
+        output (str): Either 'parquet' or 'index'. Default = 'parquet'
     """
 
     __name = "temporal_split_operator"
     __desc = "Splits datasets by fixed points in time."
+    __descriptions = {
+        "train": "Temporal Training Set",
+        "validation": "Temporal Validation Set",
+        "test": "Temporal Test Set",
+    }
 
     def __init__(
         self,
@@ -55,6 +86,7 @@ class TemporalSplitOperator(Operator):
         test_size: float = 0.10,
         timestamp_var: str = "timestamp",
         force: bool = False,
+        output: str = "parquet",
     ) -> None:
         super().__init__()
         self._directory = directory
@@ -64,93 +96,110 @@ class TemporalSplitOperator(Operator):
         self._timestamp_var = timestamp_var
         self._artifact = Artifact(isfile=False, path=directory, uripath="data")
         self._force = force
-        self._validate()
+        self._output = output
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
+        self._validate()
 
     @log
-    def __call__(self, dataset: Dataset) -> None:
+    def __call__(self, dataset: Dataset) -> dict:
         """Performs the train (validation) and test split."""
 
-        splits = {}  # Container of Dataset objects
-
-        if not self._skip(endpoint=self._directory):
+        if self._skip(endpoint=self._directory):
+            return _read_splits(
+                directory=self._directory,
+                descriptions=TemporalSplitOperator.__descriptions,
+                dataset=dataset,
+            )
 
-            data = dataset.to_df()
+        if isinstance(dataset, ParquetDataset):
+            splits = self._split_lazy(dataset)
+            for split in splits.values():
+                IOService.write(filepath=split.filepath, data=split)
+            return splits
 
-            try:
-                data_sorted = data.sort_values(by=[self._timestamp_var], ascending=True)
-            except KeyError:
-                msg = "The timestamp variable is invalid."
-                self._logger.error(msg)
-                raise ValueError(msg)
+        return self._split(dataset)
 
-            total_examples = data.shape[0]
+    def _split(self, dataset: Dataset) -> dict:
+        """Splits an in-memory dataset with boolean masks in a single pass over the timestamps."""
+        data = _frame(dataset)
+        try:
+            timestamps = data[self._timestamp_var].values
+        except KeyError:
+            msg = "The timestamp variable is invalid."
+            self._logger.error(msg)
+            raise ValueError(msg)
 
-            train_size = int(self._train_size * data.shape[0])
-            test_size = int(self._test_size * data.shape[0])
-            validation_size = min(
-                int(self._validation_size * data.shape[0]), total_examples - train_size + test_size
-            )
+        train_end, validation_end = self._cut_points(timestamps)
+        masks = {}
+        masks["train"] = timestamps < train_end
+        masks["test"] = timestamps >= validation_end
+        if self._validation_size > 0.0:
+            masks["validation"] = ~(masks["train"] | masks["test"])
 
-            train_begin = 0
-            train_end = train_size
-            validation_begin = train_end
-            validation_end = validation_begin + validation_size
-            test_begin = validation_end
-            test_end = test_begin + test_size
-
-            train = data_sorted[train_begin:train_end]
-            validation = data_sorted[validation_begin:validation_end]
-            test = data_sorted[test_begin:test_end]
-
-            # Training set
-            name = "train"
-            desc = "Temporal Training Set"
-            filepath = os.path.join(self._directory, "train.pkl")
-            data = train
-            dataset = Dataset(name=name, desc=desc, filepath=filepath, data=data)
-            IOService.write(filepath=dataset.filepath, data=dataset)
-            splits["train"] = dataset
-
-            # Test set
-            name = "test"
-            desc = "Temporal Test Set"
-            filepath = os.path.join(self._directory, "test.pkl")
-            data = test
-            dataset = Dataset(name=name, desc=desc, filepath=filepath, data=data)
-            IOService.write(filepath=dataset.filepath, data=dataset)
-            splits["test"] = dataset
-
-            # Validation set
-            if validation_size > 0.0:
-                name = "validation"
-                desc = "Temporal Validation Set"
-                filepath = os.path.join(self._directory, "validation.pkl")
-                data = validation
-                dataset = Dataset(name=name, desc=desc, filepath=filepath, data=data)
-                IOService.write(filepath=dataset.filepath, data=dataset)
-                splits["validation"] = dataset
+        return _write_splits(
+            dataset=dataset,
+            data=data,
+            masks=masks,
+            directory=self._directory,
+            output=self._output,
+            descriptions=TemporalSplitOperator.__descriptions,
+        )
 
-        else:
-            train_filepath = os.path.join(self._directory, "train.pkl")
-            train = IOService.read(filepath=train_filepath)
-            splits["train"] = train
+    def _split_lazy(self, dataset: ParquetDataset) -> dict:
+        """Splits a Parquet backed dataset reading only the timestamp column.
 
-            test_filepath = os.path.join(self._directory, "test.pkl")
-            test = IOService.read(filepath=test_filepath)
-            splits["test"] = test
+        Cut points are converted to timestamp ranges, so each split is itself a lazy dataset
+        which reads only its time window.
+        """
+        try:
+            timestamps = dataset.read(columns=[self._timestamp_var])[self._timestamp_var].values
+        except KeyError:
+            msg = "The timestamp variable is invalid."
+            self._logger.error(msg)
+            raise ValueError(msg)
 
-            validation_filepath = os.path.join(self._directory, "validation.pkl")
-            if os.path.exists(validation_filepath):
-                validation = IOService.read(filepath=validation_filepath)
-                splits["validation"] = validation
+        train_end, validation_end = self._cut_points(timestamps)
+        ranges = {"train": (None, train_end), "test": (validation_end, None)}
+        if self._validation_size > 0.0:
+            ranges["validation"] = (train_end, validation_end)
 
+        splits = {}
+        for name, timestamps in ranges.items():
+            splits[name] = dataset.select(
+                timestamps=timestamps, name=name, desc=TemporalSplitOperator.__descriptions[name]
+            )
+            splits[name].filepath = os.path.join(self._directory, f"{name}.pkl")
         return splits
 
+    def _cut_points(self, timestamps: np.ndarray) -> tuple:
+        """Returns the first timestamps of the validation and test sets.
+
+        Only the two order statistics are selected, via np.partition, in linear time.
+        """
+        train_size, validation_size, _ = self._sizes(timestamps.shape[0])
+        last = timestamps.shape[0] - 1
+        kth = [min(train_size, last), min(train_size + validation_size, last)]
+        partitioned = np.partition(timestamps, kth)
+        return partitioned[kth[0]], partitioned[kth[1]]
+
+    def _sizes(self, total_examples: int) -> tuple:
+        """Returns the number of training, validation, and test examples."""
+        train_size = int(self._train_size * total_examples)
+        test_size = int(self._test_size * total_examples)
+        validation_size = min(
+            int(self._validation_size * total_examples), total_examples - train_size - test_size
+        )
+        return train_size, validation_size, test_size
+
     def _validate(self) -> None:
-        """Ensures the sizes sum to one."""
+        """Ensures the sizes sum to one and the output format is valid."""
+        if self._output not in OUTPUTS:
+            msg = f"Output {self._output} is not valid. Valid values are 'parquet' and 'index'."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
         total_size = self._train_size + self._validation_size + self._test_size
         if total_size != 1.0:
             msg = f"Training, validation and test sizes sum to {total_size}. The sizes must sum to one."
@@ -161,3 +210,322 @@ class TemporalSplitOperator(Operator):
             msg = "Training and test set sizes must be greater than 0.0"
             self._logger.error(msg)
             raise ValueError(msg)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                 PER USER TRAIN/TEST SPLIT                                        #
+# ------------------------------------------------------------------------------------------------ #
+class UserSplitOperator(Operator):
+    """Splits the interactions of each user along the temporal dimension.
+
+    Unlike the global temporal split, every user with enough interactions contributes to each
+    split, and the held out interactions of a user are always later than their training
+    interactions. Two strategies are supported:
+
+        leave_last: The last n_test interactions of each user are held out for test, and the
+            preceding n_validation for validation. Users with no more than n_test +
+            n_validation interactions are retained entirely for training.
+        fraction: The first train_size of the interactions of each user, rounded up, are
+            used for training, the next validation_size for validation, and the remainder
+            for test.
+
+    Interactions are ranked within users via a single sort over a packed (user, timestamp)
+    key, rather than groupby().apply. Splits are written in the formats supported by the
+    TemporalSplitOperator.
+
+    Args:
+        directory (str): The directory into which the splits will be persisted.
+        strategy (str): Either 'leave_last' or 'fraction'. Default = 'leave_last'
+        n_test (int): Interactions per user held out for test by leave_last. Default = 1
+        n_validation (int): Interactions per user held out for validation by leave_last.
+            Default = 0
+        train_size (float): Proportion of each user's interactions for training. Default = 0.8
+        validation_size (float): Proportion of each user's interactions for validation.
+            Default = 0.0
+        test_size (float): Proportion of each user's interactions for test. Default = 0.2
+        userid (str): Name of the column containing the user id.
+        timestamp_var (str): The variable containing the timestamp
+        force (bool): Whether to overwrite existing data if it already exists.
+        output (str): Either 'parquet' or 'index'. Default = 'parquet'
+    """
+
+    __name = "user_split_operator"
+    __desc = "Splits the interactions of each user by time."
+    __descriptions = {
+        "train": "Per User Training Set",
+        "validation": "Per User Validation Set",
+        "test": "Per User Test Set",
+    }
+
+    def __init__(
+        self,
+        directory: str,
+        strategy: str = "leave_last",
+        n_test: int = 1,
+        n_validation: int = 0,
+        train_size: float = 0.8,
+        validation_size: float = 0.0,
+        test_size: float = 0.2,
+        userid: str = "userId",
+        timestamp_var: str = "timestamp",
+        force: bool = False,
+        output: str = "parquet",
+    ) -> None:
+        super().__init__()
+        self._directory = directory
+        self._strategy = strategy
+        self._n_test = n_test
+        self._n_validation = n_validation
+        self._train_size = train_size
+        self._validation_size = validation_size
+        self._test_size = test_size
+        self._userid = userid
+        self._timestamp_var = timestamp_var
+        self._force = force
+        self._output = output
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        self._validate()
+
+    @log
+    def __call__(self, dataset: Dataset) -> dict:
+        """Performs the per user train (validation) and test split."""
+        if self._skip(endpoint=self._directory):
+            return _read_splits(
+                directory=self._directory,
+                descriptions=UserSplitOperator.__descriptions,
+                dataset=dataset,
+            )
+
+        data = _frame(dataset)
+        try:
+            rank, count = grouped_rank(
+                groups=data[self._userid].values, values=data[self._timestamp_var].values
+            )
+        except KeyError as e:
+            msg = f"Column {e} is not valid."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+        if self._strategy == "leave_last":
+            # Rank from the most recent interaction of each user.
+            recency = count - 1 - rank
+            holdout = count > self._n_test + self._n_validation
+            test = holdout & (recency < self._n_test)
+            validation = holdout & ~test & (recency < self._n_test + self._n_validation)
+        else:
+            # Rounded before the ceiling, so products such as (0.8 + 0.05) * 100, which is
+            # 85.00000000000001, do not move a cut point by one.
+            train_end = np.ceil(np.round(self._train_size * count, 9))
+            validation_end = np.ceil(
+                np.round((self._train_size + self._validation_size) * count, 9)
+            )
+            test = rank >= validation_end
+            validation = (rank >= train_end) & ~test
+
+        masks = {"train": ~(test | validation), "test": test}
+        if validation.any():
+            masks["validation"] = validation
+
+        self._logger.debug(
+            f"Split {data.shape[0]} interactions of {int((rank == 0).sum())} users into "
+            + ", ".join(f"{name}: {int(mask.sum())}" for name, mask in masks.items())
+        )
+        return _write_splits(
+            dataset=dataset,
+            data=data,
+            masks=masks,
+            directory=self._directory,
+            output=self._output,
+            descriptions=UserSplitOperator.__descriptions,
+        )
+
+    def _validate(self) -> None:
+        """Ensures the strategy, sizes and output format are valid."""
+        if self._strategy not in STRATEGIES:
+            msg = f"Strategy {self._strategy} is not valid. Valid values are {STRATEGIES}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+        if self._output not in OUTPUTS:
+            msg = f"Output {self._output} is not valid. Valid values are {OUTPUTS}."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+        if self._strategy == "leave_last" and (self._n_test < 1 or self._n_validation < 0):
+            msg = "At least one test interaction per user must be held out."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+        total_size = self._train_size + self._validation_size + self._test_size
+        if self._strategy == "fraction" and not np.isclose(total_size, 1.0):
+            msg = f"Training, validation and test sizes sum to {total_size}. The sizes must sum to one."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def grouped_rank(groups: np.ndarray, values: np.ndarray) -> tuple:
+    """Returns the rank of each row by value within its group, and the size of its group.
+
+    Rows are ordered by a single sort on a 64 bit key packing the group code into the high
+    bits and the offset of the value from its minimum into the low bits. If the key does
+    not fit, the rows are ordered with np.lexsort instead. Ties are ranked arbitrarily.
+
+    Args:
+        groups (np.ndarray): The group, e.g. user id, of each row.
+        values (np.ndarray): Integer values, e.g. timestamps, by which rows are ranked.
+    """
+    n = groups.shape[0]
+    rank = np.zeros(shape=n, dtype=np.int64)
+    count = np.zeros(shape=n, dtype=np.int64)
+    if n == 0:
+        return rank, count
+
+    codes, uniques = pd.factorize(groups)
+    offsets = values.astype(np.int64) - values.min()
+    value_bits = int(offsets.max()).bit_length()
+    if int(len(uniques)).bit_length() + value_bits < 63:
+        order = np.argsort((codes.astype(np.int64) << value_bits) | offsets)
+    else:
+        order = np.lexsort((offsets, codes))
+
+    sizes = np.bincount(codes)
+    sorted_codes = codes[order]
+    starts = np.r_[0, np.cumsum(sizes)[:-1]]
+    rank[order] = np.arange(n) - starts[sorted_codes]
+    count[:] = sizes[codes]
+    return rank, count
+
+
+def kfold(dataset: MovieLens, n_folds: int = 5, seed: int = None) -> Iterator[tuple]:
+    """Generates train and test SplitViews for k-fold cross validation.
+
+    Each interaction is assigned to one of n_folds folds of equal size, at random. The views
+    of each fold are boolean masks over the parent dataset, created as the fold is
+    requested, so only the fold assignments and the masks of the current fold are held in
+    memory, at one byte per interaction each.
+
+    Args:
+        dataset (MovieLens): The dataset to split.
+        n_folds (int): The number of folds. Default = 5
+        seed (int): Seed for the random number generator. Default = None
+
+    Yields: (train, test) tuples of SplitViews.
+    """
+    folds = assign_folds(n=dataset.nrows, n_folds=n_folds, seed=seed)
+    for k in range(n_folds):
+        test = folds == k
+        yield (
+            SplitView(
+                name=f"train_fold_{k}", desc=f"Training Set of Fold {k}", parent=dataset, rows=~test
+            ),
+            SplitView(
+                name=f"test_fold_{k}", desc=f"Test Set of Fold {k}", parent=dataset, rows=test
+            ),
+        )
+
+
+def assign_folds(n: int, n_folds: int = 5, seed: int = None) -> np.ndarray:
+    """Assigns n interactions at random to n_folds folds of equal size, within one.
+
+    Args:
+        n (int): The number of interactions.
+        n_folds (int): The number of folds. Default = 5
+        seed (int): Seed for the random number generator. Default = None
+
+    Returns: np.ndarray of fold numbers, in the smallest integer type which holds them.
+    """
+    if n_folds < 2:
+        msg = f"The number of folds must be at least 2, not {n_folds}."
+        logger.error(msg)
+        raise ValueError(msg)
+
+    folds = np.empty(shape=n, dtype=np.int8 if n_folds <= np.iinfo(np.int8).max else np.int32)
+    folds[np.random.default_rng(seed).permutation(n)] = np.arange(n) % n_folds
+    return folds
+
+
+def _frame(dataset: Dataset) -> pd.DataFrame:
+    """Returns the data of a dataset, without copying the DataFrame of a MovieLens dataset.
+
+    The splits only read columns from the data, and select the rows of each Parquet split.
+    """
+    if isinstance(dataset, MovieLens):
+        return dataset.to_df(copy=False)
+    return dataset.to_df()
+
+
+def _matrix_shape(dataset: Dataset) -> tuple:
+    """Returns the interaction matrix shape of an in-memory parent dataset, else None."""
+    return dataset.matrix_shape if isinstance(dataset, (MovieLens, SplitView)) else None
+
+
+def _write_splits(
+    dataset: Dataset,
+    data: pd.DataFrame,
+    masks: dict,
+    directory: str,
+    output: str,
+    descriptions: dict,
+) -> dict:
+    """Writes the splits selected by boolean masks over the data.
+
+    Args:
+        dataset (Dataset): The parent dataset.
+        data (pd.DataFrame): The data of the parent dataset.
+        masks (dict): Boolean masks over the rows of the data, keyed by split name.
+        directory (str): The directory into which the splits are persisted.
+        output (str): Either 'parquet', for lazy ParquetDatasets bound to '<name>.parquet'
+            files, or 'index' for SplitViews over the parent dataset, whose row positions
+            are persisted to '<name>.pkl' files.
+        descriptions (dict): Descriptions of the splits, keyed by split name.
+    """
+    if output == "index" and not isinstance(dataset, MovieLens):
+        dataset = MovieLens(name=dataset.name, desc=dataset.desc, data=data)
+
+    splits = {}
+    for name, mask in masks.items():
+        if output == "index":
+            rows = np.flatnonzero(mask)
+            rows = rows.astype(np.int32) if mask.shape[0] <= np.iinfo(np.int32).max else rows
+            IOService.write(filepath=os.path.join(directory, f"{name}.pkl"), data=rows)
+            splits[name] = SplitView(name=name, desc=descriptions[name], parent=dataset, rows=rows)
+        else:
+            filepath = os.path.join(directory, f"{name}.parquet")
+            IOService.write(filepath=filepath, data=data[mask].reset_index(drop=True))
+            splits[name] = ParquetDataset(
+                name=name,
+                desc=descriptions[name],
+                path=filepath,
+                matrix_shape=_matrix_shape(dataset),
+            )
+            splits[name].filepath = filepath
+    return splits
+
+
+def _read_splits(directory: str, descriptions: dict, dataset: Dataset) -> dict:
+    """Reads the splits persisted in a split directory.
+
+    Args:
+        directory (str): The directory containing the splits.
+        descriptions (dict): Descriptions of the splits, keyed by split name.
+        dataset (Dataset): The parent dataset of splits persisted as row positions.
+    """
+    splits = {}
+    for name, desc in descriptions.items():
+        filepath = os.path.join(directory, name)
+        if os.path.exists(f"{filepath}.parquet"):
+            splits[name] = ParquetDataset(
+                name=name,
+                desc=desc,
+                path=f"{filepath}.parquet",
+                matrix_shape=_matrix_shape(dataset),
+            )
+            splits[name].filepath = f"{filepath}.parquet"
+        elif os.path.exists(f"{filepath}.pkl"):
+            splits[name] = IOService.read(filepath=f"{filepath}.pkl")
+            if isinstance(splits[name], np.ndarray):
+                splits[name] = SplitView(name=name, desc=desc, parent=dataset, rows=splits[name])
+    return splits
@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday March 17th 2023 08:42:29 pm                                                  #
-# Modified   : Monday March 20th 2023 09:50:58 am                                                  #
+# Modified   : Monday October 19th 2026 12:19:15 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -66,9 +66,10 @@ class Dataset(Asset):
     def to_df(self) -> pd.DataFrame:
         """Returns a DataFrame representation of the Dataset object."""
 
-    def summary(self) -> None:
-        self._summarize()
+    def summary(self) -> pd.DataFrame:
+        """Returns summary statistics for the Dataset."""
+        return self._summarize()
 
     @abstractmethod
-    def _summarize(self) -> None:
+    def _summarize(self) -> pd.DataFrame:
         """Computes summary statistics."""
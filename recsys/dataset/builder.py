@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/dataset/builder.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:20:54 am                                                #
+# Modified   : Monday October 19th 2026 01:06:06 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Dataset Builder Module"""
+from __future__ import annotations
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.index import IdMap
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.profile import Profile
+from recsys.services.io import IOService
+
+
+# ------------------------------------------------------------------------------------------------ #
+class MovieLensBuilder:
+    """Builds a MovieLens Dataset by streaming a ratings file in chunks.
+
+    Each chunk is reduced to compact arrays: user and item ids are encoded incrementally
+    into sequential indices, and ratings and timestamps are downcast. The chunk itself is
+    then discarded, so the raw ratings frame is never held in memory. Per user and per item
+    rating counts, along with running rating and timestamp statistics, are accumulated as
+    the chunks arrive, and seed the profile of the Dataset when it is built.
+
+    The Dataset produced contains the userId, movieId, rating and timestamp columns as well as
+    the useridx and itemidx columns created by the IndexSequenceOperator, i.e. indices
+    assigned in sorted id order.
+
+    Args:
+        name (str): Name of the Dataset to build
+        desc (str): Description of the Dataset
+        chunksize (int): Number of rows read per chunk. Default = 1,000,000
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+        rating (str): Name of the column containing the rating.
+        timestamp (str): Name of the column containing the timestamp.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        desc: str,
+        chunksize: int = 1000000,
+        userid: str = "userId",
+        itemid: str = "movieId",
+        rating: str = "rating",
+        timestamp: str = "timestamp",
+    ) -> None:
+        self._name = name
+        self._desc = desc
+        self._chunksize = chunksize
+        self._userid = userid
+        self._itemid = itemid
+        self._rating = rating
+        self._timestamp = timestamp
+        self._idmap = None
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        self.reset()
+
+    @property
+    def nrows(self) -> int:
+        """Number of interactions added so far."""
+        return self._nrows
+
+    @property
+    def idmap(self) -> IdMap:
+        """The id to index mappings of the last Dataset built."""
+        return self._idmap
+
+    @property
+    def stats(self) -> dict:
+        """Running statistics over the interactions added so far."""
+        n = max(self._nrows, 1)
+        mean = self._rating_sum / n
+        return {
+            "nrows": self._nrows,
+            "n_users": len(self._users),
+            "n_items": len(self._items),
+            "rating_mean": mean,
+            "rating_std": np.sqrt(max(self._rating_sumsq / n - mean**2, 0.0)),
+            "timestamp_min": self._timestamp_min,
+            "timestamp_max": self._timestamp_max,
+        }
+
+    def reset(self) -> None:
+        """Discards all accumulated buffers and statistics."""
+        self._users = pd.Index(np.empty(shape=0, dtype=np.int64))
+        self._items = pd.Index(np.empty(shape=0, dtype=np.int64))
+        self._user_degree = np.zeros(shape=0, dtype=np.int64)
+        self._item_degree = np.zeros(shape=0, dtype=np.int64)
+        self._buffers = {"useridx": [], "itemidx": [], "rating": [], "timestamp": []}
+        self._nrows = 0
+        self._rating_sum = 0.0
+        self._rating_sumsq = 0.0
+        self._timestamp_min = None
+        self._timestamp_max = None
+
+    def read(
+        self, filepath: str, sep: str = ",", header: int = 0, names: list = None
+    ) -> MovieLensBuilder:
+        """Streams a delimited ratings file into the builder.
+
+        The file is read in chunks via IOService.iter_batches, so .csv files are parsed by
+        the pandas C parser and '::' delimited .dat files by the pyarrow reader of DatIO.
+
+        Args:
+            filepath (str): Path to the ratings file.
+            sep (str): The delimiter, e.g. '::' for the .dat files.
+            header (int): Row number containing the column names, or None.
+            names (list): Column names to use if the file has no header.
+        """
+        chunks = IOService.iter_batches(
+            filepath,
+            batch_size=self._chunksize,
+            sep=sep,
+            header=header,
+            names=names,
+            usecols=[self._userid, self._itemid, self._rating, self._timestamp],
+        )
+        for chunk in chunks:
+            self.add(chunk)
+            self._logger.debug(f"Read {self._nrows} interactions from {filepath}.")
+        return self
+
+    def add(self, chunk: pd.DataFrame) -> MovieLensBuilder:
+        """Encodes a chunk of interactions and appends it to the buffers.
+
+        Args:
+            chunk (pd.DataFrame): Interactions containing user, item, rating and timestamp.
+        """
+        self._users, useridx = self._encode(self._users, chunk[self._userid].values)
+        self._items, itemidx = self._encode(self._items, chunk[self._itemid].values)
+        rating = chunk[self._rating].values.astype(np.float32)
+        timestamp = chunk[self._timestamp].values.astype(np.int64)
+
+        self._user_degree = self._accumulate(self._user_degree, useridx, len(self._users))
+        self._item_degree = self._accumulate(self._item_degree, itemidx, len(self._items))
+
+        self._buffers["useridx"].append(useridx)
+        self._buffers["itemidx"].append(itemidx)
+        self._buffers["rating"].append(rating)
+        self._buffers["timestamp"].append(timestamp)
+
+        self._nrows += chunk.shape[0]
+        self._rating_sum += float(rating.sum(dtype=np.float64))
+        self._rating_sumsq += float(np.square(rating, dtype=np.float64).sum())
+        if timestamp.shape[0] > 0:
+            tmin, tmax = int(timestamp.min()), int(timestamp.max())
+            self._timestamp_min = (
+                tmin if self._timestamp_min is None else min(self._timestamp_min, tmin)
+            )
+            self._timestamp_max = (
+                tmax if self._timestamp_max is None else max(self._timestamp_max, tmax)
+            )
+        return self
+
+    def build(self) -> MovieLens:
+        """Finalizes the buffers into a MovieLens Dataset and resets the builder.
+
+        Indices assigned in order of first appearance are remapped to sorted id order. Each
+        buffer is released as soon as its column has been assembled.
+        """
+        if self._nrows == 0:
+            msg = "No interactions have been added to the builder."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+
+        self._logger.debug(f"Building {self._name} from {self._nrows} interactions: {self.stats}")
+
+        users, user_rank, user_degree = self._sort(self._users, self._user_degree)
+        items, item_rank, item_degree = self._sort(self._items, self._item_degree)
+
+        data = {}
+        useridx = user_rank[self._concat("useridx")]
+        data[self._userid] = users[useridx]
+        data["useridx"] = useridx
+        itemidx = item_rank[self._concat("itemidx")]
+        data[self._itemid] = items[itemidx]
+        data["itemidx"] = itemidx
+        data[self._rating] = self._concat("rating")
+        data[self._timestamp] = self._concat("timestamp")
+        data = pd.DataFrame(data, copy=False)
+
+        profile = Profile(
+            nrows=data.shape[0],
+            ncols=data.shape[1],
+            memory=int(data.memory_usage(deep=True).sum()),
+            users=users,
+            items=items,
+            user_degree=user_degree,
+            item_degree=item_degree,
+        )
+        dataset = MovieLens(name=self._name, desc=self._desc, data=data, profile=profile)
+        self._idmap = IdMap(
+            name=f"{self._name}_idmap",
+            desc=f"User and item id to index mappings for {self._name}",
+            users=users,
+            items=items,
+        )
+        self.reset()
+        return dataset
+
+    def _concat(self, column: str) -> np.ndarray:
+        """Concatenates and releases the buffers for a column."""
+        buffers = self._buffers[column]
+        array = np.concatenate(buffers)
+        buffers.clear()
+        return array
+
+    @staticmethod
+    def _encode(index: pd.Index, ids: np.ndarray) -> tuple:
+        """Encodes ids against the known ids, appending unseen ids in order of appearance.
+
+        Returns the (possibly extended) index of known ids and the encoded ids.
+        """
+        codes = index.get_indexer(ids)
+        unseen = codes < 0
+        if unseen.any():
+            new = pd.unique(ids[unseen])
+            index = index.append(pd.Index(new))
+            codes[unseen] = index.get_indexer(ids[unseen])
+        return index, codes.astype(np.int32)
+
+    @staticmethod
+    def _accumulate(degree: np.ndarray, codes: np.ndarray, n: int) -> np.ndarray:
+        """Adds the occurrences of each code to the running degree counts."""
+        counts = np.bincount(codes, minlength=n)
+        counts[: degree.shape[0]] += degree
+        return counts
+
+    @staticmethod
+    def _sort(index: pd.Index, degree: np.ndarray) -> tuple:
+        """Returns the sorted ids, the rank of each appearance-ordered code, and the
+        degrees in sorted id order."""
+        ids = index.values
+        order = np.argsort(ids, kind="stable")
+        rank = np.empty_like(order, dtype=np.int32)
+        rank[order] = np.arange(order.shape[0], dtype=np.int32)
+        return ids[order], rank, degree[order]
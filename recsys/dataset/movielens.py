@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday March 17th 2023 06:05:25 pm                                                  #
-# Modified   : Monday March 20th 2023 11:09:12 am                                                  #
+# Modified   : Monday October 19th 2026 01:45:12 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -26,6 +26,7 @@ import numpy as np
 import pandas as pd
 
 from recsys.dataset.base import Dataset
+from recsys.dataset.profile import Profile, profile
 
 warnings.filterwarnings("ignore")
 
@@ -38,8 +39,16 @@ class MovieLens(Dataset):
         name (str): Name of the matrix in lowercase
         desc (str): desc of the matrix
         data (str): Pandas DataFrame containing rating interaction data.
+        profile (Profile): Optional precomputed profile of the data, e.g. from a builder which
+            accumulated the statistics while reading. If None, the profile is computed on
+            first use.
+        matrix_shape (tuple): Optional shape of the interaction matrix, e.g. that of the parent
+            of a split or shard, so that matrices of related datasets share their coordinates.
+            If None, the shape is computed on first use.
     """
 
+    __ITEMIDX = "itemidx"
+    __USERIDX = "useridx"
     __ITEMID = "movieId"
     __USERID = "userId"
     __RATING = "rating"
@@ -52,23 +61,17 @@ class MovieLens(Dataset):
         name: str,
         desc: str,
         data: pd.DataFrame,
+        profile: Profile = None,
+        matrix_shape: tuple = None,
     ) -> None:
         super().__init__()
         self._name = name
         self._desc = desc
         self._data = data
 
-        self._profiled = False
+        self._profile = profile
+        self._matrix_shape = None if matrix_shape is None else tuple(matrix_shape)
         self._summary = None
-        self._nrows = None
-        self._ncols = None
-        self._size = None
-        self._n_users = None
-        self._n_items = None
-        self._interaction_matrix_size = None
-        self._sparsity = None
-        self._density = None
-        self._memory = None
         self._logger = logging.getLogger(
             f"{self.__module__}.{self.__class__.__name__}",
         )
@@ -88,22 +91,22 @@ class MovieLens(Dataset):
     @property
     def sparsity(self) -> float:
         """Returns measure of sparsity of the data in percent"""
-        return self._sparsity
+        return self.profile.sparsity
 
     @property
     def density(self) -> float:
         """Returns measure of density of the data in percent"""
-        return self._density
+        return self.profile.density
 
     @property
     def n_users(self) -> int:
         """Returns number of unique users"""
-        return self._n_users
+        return self.profile.n_users
 
     @property
     def n_items(self) -> int:
         """Returns number of unique items."""
-        return self._n_items
+        return self.profile.n_items
 
     @property
     def columns(self) -> np.array:
@@ -113,31 +116,57 @@ class MovieLens(Dataset):
     @property
     def nrows(self) -> int:
         """Returns the number of rows in the Dataset"""
-        return self._nrows
+        return self.profile.nrows
 
     @property
     def ncols(self) -> int:
         """Returns the number of columns in the Dataset"""
-        return self._ncols
+        return self.profile.ncols
 
     @property
     def size(self) -> int:
         """The number of elements in the Dataset"""
-        return self._size
+        return self.profile.nrows * self.profile.ncols
 
     @property
     def interaction_matrix_size(self) -> int:
-        return self._interaction_matrix_size
+        return self.profile.interaction_matrix_size
+
+    @property
+    def matrix_shape(self) -> tuple:
+        """Returns the (rows, columns) shape of the user/item interaction matrix.
+
+        The coordinates of a filtered or combined dataset index the interaction matrix of its
+        parent, so, unless given, the shape spans the largest coordinates, not the number of
+        users and items. It is computed once, on first use.
+        """
+        # Datasets persisted before the shape was retained lack the attribute.
+        if getattr(self, "_matrix_shape", None) is None:
+            users, items = self._coordinates()
+            self._matrix_shape = (
+                (int(users.max()) + 1, int(items.max()) + 1) if users.shape[0] > 0 else (0, 0)
+            )
+        return self._matrix_shape
+
+    @property
+    def profile(self) -> Profile:
+        """Returns the dataset profile, computed once on first access."""
+        if self._profile is None:
+            self._logger.debug("Profiling dataset....")
+            self._profile = profile(
+                data=self._data, userid=MovieLens.__USERID, itemid=MovieLens.__ITEMID
+            )
+        return self._profile
 
     @property
     def users(self) -> np.array:
         """Returns array of unique users"""
-        return np.sort(self._data[MovieLens.__USERID].unique())
+        return self.profile.users
 
     @property
     def items(self) -> np.array:
         """Returns array of unique items"""
-        return np.sort(self._data[MovieLens.__ITEMID].unique())
+        return self.profile.items
 
     @property
     def user_item_ratio(self) -> float:
@@ -152,32 +181,26 @@ class MovieLens(Dataset):
     @property
     def user_rating_frequency(self) -> pd.DataFrame:
         """Returns number of ratings by user."""
-        return (
-            self._data[MovieLens.__USERID]
-            .value_counts()
-            .to_frame(name="n_ratings")
-            .reset_index(names=[MovieLens.__USERID])
+        return pd.DataFrame(
+            {MovieLens.__USERID: self.profile.users, "n_ratings": self.profile.user_degree}
         )
 
     @property
     def user_rating_frequency_distribution(self) -> pd.DataFrame:
         """Distribution of user rating frequency"""
-        return self.user_rating_frequency["n_ratings"].describe().to_frame().T
+        return self.profile.degree_distribution(dimension="user")
 
     @property
     def item_rating_frequency(self) -> pd.DataFrame:
         """Returns number of ratings by item."""
-        return (
-            self._data[MovieLens.__ITEMID]
-            .value_counts()
-            .to_frame(name="n_ratings")
-            .reset_index(names=[MovieLens.__ITEMID])
+        return pd.DataFrame(
+            {MovieLens.__ITEMID: self.profile.items, "n_ratings": self.profile.item_degree}
         )
 
     @property
     def item_rating_frequency_distribution(self) -> pd.DataFrame:
         """Distribution of item rating frequency"""
-        return self.item_rating_frequency["n_ratings"].describe().to_frame().T
+        return self.profile.degree_distribution(dimension="item")
 
     def head(self, n: int = 5) -> pd.DataFrame:
         """Prints n rows from the top of the DataFrame"""
@@ -242,21 +265,31 @@ class MovieLens(Dataset):
         Args:
             other (MovieLens): The other interaction matrix which to compare.
         """
-        df1 = self._summary
+        df1 = self.summary()
         df2 = other.summary()
         both = pd.concat([df1, df2], axis=1)
         both["% change"] = (df1[self._name] - df2[other.name]) / df1[self._name] * 100
         return both
 
-    def to_df(self) -> pd.DataFrame:
-        """Returns the nonzero values in dataframe format"""
-        return deepcopy(self._data)
+    def to_df(self, rows: np.ndarray = None, copy: bool = True) -> pd.DataFrame:
+        """Returns the nonzero values in dataframe format
+
+        Args:
+            rows (np.ndarray): Optional integer positions or boolean mask selecting rows.
+            copy (bool): Whether to return a copy. If False, the underlying DataFrame, or the
+                selection from it, is returned and must be treated as read only. Default True
+        """
+        if rows is None:
+            return deepcopy(self._data) if copy else self._data
+        return self._data.iloc[rows].copy() if copy else self._data.iloc[rows]
 
-    def to_csr(self, centered_by: str = None) -> csr_matrix:
+    def to_csr(self, centered_by: str = None, rows: np.ndarray = None) -> csr_matrix:
         """Produces a csr matrix
 
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+            rows (np.ndarray): Optional integer positions or boolean mask selecting the
+                interactions. The matrix retains the shape of the full interaction matrix.
 
         Returns: scipy.sparse.csr_matrix
 
@@ -269,16 +302,16 @@ class MovieLens(Dataset):
         else:
             col = MovieLens.__RATING_ITEM_CENTERED
 
-        rows = self._data[MovieLens.__USERID]
-        cols = self._data[MovieLens.__ITEMID]
-        data = self._data[col]
-        return csr_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        data, (users, items) = self._select(col, rows)
+        return csr_matrix((data, (users, items)), shape=self.matrix_shape)
 
-    def to_csc(self, centered_by: str = None) -> csc_matrix:
+    def to_csc(self, centered_by: str = None, rows: np.ndarray = None) -> csc_matrix:
         """Produces a csr matrix
 
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+            rows (np.ndarray): Optional integer positions or boolean mask selecting the
+                interactions. The matrix retains the shape of the full interaction matrix.
 
         Returns: scipy.sparse.csc_matrix
 
@@ -291,16 +324,16 @@ class MovieLens(Dataset):
         else:
             col = MovieLens.__RATING_ITEM_CENTERED
 
-        rows = self._data[MovieLens.__USERID]
-        cols = self._data[MovieLens.__ITEMID]
-        data = self._data[col]
-        return csc_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
+        data, (users, items) = self._select(col, rows)
+        return csc_matrix((data, (users, items)), shape=self.matrix_shape)
 
-    def to_coo(self, centered_by: str = None) -> coo_matrix:
+    def to_coo(self, centered_by: str = None, rows: np.ndarray = None) -> coo_matrix:
         """Produces a csr matrix
 
         Args:
             centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+            rows (np.ndarray): Optional integer positions or boolean mask selecting the
+                interactions. The matrix retains the shape of the full interaction matrix.
 
         Returns: scipy.sparse.csc_matrix
 
@@ -312,66 +345,44 @@ class MovieLens(Dataset):
         else:
             col = MovieLens.__RATING_ITEM_CENTERED
 
-        rows = self._data[MovieLens.__USERID]
-        cols = self._data[MovieLens.__ITEMID]
-        data = self._data[col]
-        return coo_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
-
-    def to_binary(self) -> csr_matrix:
-        """Returns a user/item interaction matrix in csr format"""
-        df = self._data[[MovieLens.__USERID, MovieLens.__ITEMID]]
-        df["interaction"] = 1
-        rows = df[MovieLens.__USERID]
-        cols = df[MovieLens.__ITEMID]
-        data = df["interaction"]
-        return csr_matrix((data, (rows, cols)), shape=(self.n_users, self.n_items))
-
-    def _summarize(self) -> None:
+        data, (users, items) = self._select(col, rows)
+        return coo_matrix((data, (users, items)), shape=self.matrix_shape)
+
+    def to_binary(self, rows: np.ndarray = None) -> csr_matrix:
+        """Returns a user/item interaction matrix in csr format
+
+        Args:
+            rows (np.ndarray): Optional integer positions or boolean mask selecting the
+                interactions.
+        """
+        _, (users, items) = self._select(None, rows)
+        data = np.ones(shape=users.shape[0], dtype=np.int8)
+        return csr_matrix((data, (users, items)), shape=self.matrix_shape)
+
+    def _coordinates(self) -> tuple:
+        """Returns the matrix row and column coordinates of the interactions.
+
+        The sequential user and item indices are used if the dataset has been reindexed.
+        Otherwise, the user and item ids are used.
+        """
+        if MovieLens.__USERIDX in self._data.columns:
+            return self._data[MovieLens.__USERIDX], self._data[MovieLens.__ITEMIDX]
+        return self._data[MovieLens.__USERID], self._data[MovieLens.__ITEMID]
+
+    def _select(self, col: str, rows: np.ndarray) -> tuple:
+        """Returns the values of a column and the coordinates of the selected interactions."""
+        userid, itemid = self._coordinates()
+        values = None if col is None else self._data[col].values
+        if rows is None:
+            return values, (userid.values, itemid.values)
+        values = None if values is None else values[rows]
+        return values, (userid.values[rows], itemid.values[rows])
+
+    def _summarize(self) -> pd.DataFrame:
         """Runs a data profile including basic summary statistics"""
-        if not self._profiled:
+        if self._summary is None:
             self._logger.debug("Computing descriptive statistics....")
-            # Computes basic statistics
-            self._nrows = self._data.shape[0]
-            self._ncols = self._data.shape[1]
-            self._size = self._nrows * self._ncols
-            self._memory = round(self._data.memory_usage(deep=True).sum() / 1024**2, 3)
-            self._n_users = int(self._data[MovieLens.__USERID].nunique())
-            self._n_items = int(self._data[MovieLens.__ITEMID].nunique())
-            self._user_item_ratio = self.user_item_ratio
-            self._item_user_ratio = self.item_user_ratio
-            self._mean_ratings_per_user = self._nrows / self._n_users
-            self._mean_ratings_per_item = self._nrows / self._n_items
-            self._interaction_matrix_size = int(self._n_users * self._n_items)
-            self._density = self._nrows / (self._n_users * self._n_items) * 100
-            self._sparsity = 100 - self._density
-            self._memory = self._data.memory_usage(deep=True).sum()
-            self._max_ratings_per_user = self.user_rating_frequency["n_ratings"].max()
-            self._max_ratings_per_item = self.item_rating_frequency["n_ratings"].max()
-            self._min_ratings_per_user = self.user_rating_frequency["n_ratings"].min()
-            self._min_ratings_per_item = self.item_rating_frequency["n_ratings"].min()
-
-            d = {}
-            # d["name"] = self._name
-            # d["type"] = self.__class__.__name__
-            # d["desc"] = self._desc
-            d["nrows"] = self._data.shape[0]
-            d["ncols"] = self._data.shape[1]
-            d["n_users"] = self._n_users
-            d["n_items"] = self._n_items
-            d["max_ratings_per_user"] = self._max_ratings_per_user
-            d["mean_ratings_per_user"] = self._mean_ratings_per_user
-            d["min_ratings_per_user"] = self._min_ratings_per_user
-            d["max_ratings_per_item"] = self._max_ratings_per_item
-            d["mean_ratings_per_item"] = self._mean_ratings_per_item
-            d["min_ratings_per_item"] = self._min_ratings_per_item
-            d["user_item_ratio"] = self._user_item_ratio
-            d["item_user_ratio"] = self._item_user_ratio
-            d["size"] = self._size
-            d["interaction_matrix_size"] = self._interaction_matrix_size
-            d["memory"] = self._memory
-            d["sparsity"] = self._sparsity
-            d["density"] = self._density
-
-            self._summary = pd.DataFrame.from_dict(data=d, orient="index", columns=[self._name])
-
-        self._profiled = True
+            self._summary = pd.DataFrame.from_dict(
+                data=self.profile.to_dict(), orient="index", columns=[self._name]
+            )
+        return self._summary
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/dataset/parquet.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:23:22 am                                                #
+# Modified   : Monday October 19th 2026 01:45:12 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Parquet Dataset Module"""
+from __future__ import annotations
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from recsys.dataset.base import Dataset
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.profile import Profile, degrees
+from recsys.services.io import ParquetIO
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ParquetDataset(Dataset):
+    """Lazy interaction dataset bound to a Parquet file or directory of Parquet files.
+
+    Nothing is read on construction. Column projections and row filters are accumulated via
+    the select method and pushed down to pyarrow when data is requested, so only the row
+    groups whose statistics satisfy the filters, and only the requested columns, are read.
+
+    Filters are expressed as a list of (column, op, value) tuples, combined conjunctively,
+    where op is one of '==', '!=', '<', '<=', '>', '>=', 'in', and 'not in'.
+
+    Args:
+        name (str): Name of the dataset in lowercase
+        desc (str): Description of the dataset
+        path (str): Path to a Parquet file or a directory containing Parquet files.
+        columns (list): Columns to project. If None, all columns are read.
+        filters (list): Row filters as (column, op, value) tuples.
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+        timestamp (str): Name of the column containing the timestamp.
+        matrix_shape (tuple): Optional shape of the interaction matrix of the dataset loaded,
+            e.g. that of the parent of a split. If None, it spans the coordinates loaded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        desc: str,
+        path: str,
+        columns: list = None,
+        filters: list = None,
+        userid: str = "userId",
+        itemid: str = "movieId",
+        timestamp: str = "timestamp",
+        matrix_shape: tuple = None,
+    ) -> None:
+        super().__init__()
+        self._name = name
+        self._desc = desc
+        self._path = path
+        self._columns = columns
+        self._filters = list(filters or [])
+        self._userid = userid
+        self._itemid = itemid
+        self._timestamp = timestamp
+        self._matrix_shape = matrix_shape
+
+        self._profile = None
+        self._summary = None
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def __getstate__(self) -> dict:
+        # The profile is cheap to recompute; persist only the binding to the Parquet data.
+        state = self.__dict__.copy()
+        state["_profile"] = None
+        state["_summary"] = None
+        return state
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def desc(self) -> str:
+        return self._desc
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def filters(self) -> list:
+        return list(self._filters)
+
+    @property
+    def shape(self) -> tuple:
+        return (self.nrows, self.ncols)
+
+    @property
+    def columns(self) -> np.array:
+        """Returns the array of the (projected) column names in the Dataset"""
+        return np.array(self._columns or self._source().schema.names)
+
+    @property
+    def nrows(self) -> int:
+        """Returns the number of rows satisfying the filters, using Parquet metadata where
+        possible."""
+        return self._source().count_rows(filter=self._expression(self._filters))
+
+    @property
+    def ncols(self) -> int:
+        return len(self.columns)
+
+    @property
+    def size(self) -> int:
+        return self.nrows * self.ncols
+
+    @property
+    def profile(self) -> Profile:
+        """Returns the dataset profile, computed from the user and item columns only."""
+        if self._profile is None:
+            self._logger.debug("Profiling dataset....")
+            table = self._scan(columns=[self._userid, self._itemid])
+            users, user_degree = degrees(table.column(self._userid).to_numpy())
+            items, item_degree = degrees(table.column(self._itemid).to_numpy())
+            schema = self._source().schema
+            width = sum(
+                schema.field(column).type.bit_width // 8
+                for column in self.columns
+                if pa.types.is_primitive(schema.field(column).type)
+            )
+            self._profile = Profile(
+                nrows=table.num_rows,
+                ncols=self.ncols,
+                memory=table.num_rows * width,
+                users=users,
+                items=items,
+                user_degree=user_degree,
+                item_degree=item_degree,
+            )
+        return self._profile
+
+    @property
+    def n_users(self) -> int:
+        return self.profile.n_users
+
+    @property
+    def n_items(self) -> int:
+        return self.profile.n_items
+
+    @property
+    def users(self) -> np.array:
+        return self.profile.users
+
+    @property
+    def items(self) -> np.array:
+        return self.profile.items
+
+    def select(
+        self,
+        columns: list = None,
+        users: tuple = None,
+        timestamps: tuple = None,
+        filters: list = None,
+        name: str = None,
+        desc: str = None,
+    ) -> ParquetDataset:
+        """Returns a new lazy dataset restricted to a subset of columns and rows.
+
+        Args:
+            columns (list): Columns to project. Defaults to the columns of this dataset.
+            users (tuple): Half open [low, high) range of user ids. Either bound may be None.
+            timestamps (tuple): Half open [low, high) range of timestamps. Either bound may
+                be None.
+            filters (list): Additional (column, op, value) filters.
+            name (str): Name of the new dataset. Defaults to the name of this dataset.
+            desc (str): Description of the new dataset. Defaults to this description.
+        """
+        selection = self._filters + list(filters or [])
+        selection += self._range(self._userid, users)
+        selection += self._range(self._timestamp, timestamps)
+        return ParquetDataset(
+            name=name or self._name,
+            desc=desc or self._desc,
+            path=self._path,
+            columns=columns or self._columns,
+            filters=selection,
+            userid=self._userid,
+            itemid=self._itemid,
+            timestamp=self._timestamp,
+            matrix_shape=self._matrix_shape,
+        )
+
+    def read(self, columns: list = None, filters: list = None) -> pd.DataFrame:
+        """Reads the dataset into a DataFrame.
+
+        Args:
+            columns (list): Columns to read. Defaults to the projected columns.
+            filters (list): Additional (column, op, value) filters for this read only.
+        """
+        return self._scan(columns=columns, filters=filters).to_pandas()
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """Prints n rows from the top of the Dataset"""
+        table = self._source().head(
+            n, columns=self._columns, filter=self._expression(self._filters)
+        )
+        print(table.to_pandas())
+
+    def to_df(self) -> pd.DataFrame:
+        """Returns the selected rows and columns in dataframe format"""
+        return self.read()
+
+    def load(self) -> MovieLens:
+        """Materializes the selection as an in-memory MovieLens Dataset."""
+        return MovieLens(
+            name=self._name, desc=self._desc, data=self.read(), matrix_shape=self._matrix_shape
+        )
+
+    def _summarize(self) -> pd.DataFrame:
+        """Runs a data profile including basic summary statistics"""
+        if self._summary is None:
+            self._summary = pd.DataFrame.from_dict(
+                data=self.profile.to_dict(), orient="index", columns=[self._name]
+            )
+        return self._summary
+
+    def _source(self) -> ds.Dataset:
+        return ds.dataset(self._path, format="parquet")
+
+    def _scan(self, columns: list = None, filters: list = None) -> pa.Table:
+        """Reads the projected columns of the row groups satisfying the filters."""
+        columns = columns or self._columns
+        expression = self._expression(self._filters + list(filters or []))
+        self._logger.debug(f"Reading columns {columns} from {self._path} where {expression}")
+        return self._source().to_table(columns=columns, filter=expression)
+
+    def _expression(self, filters: list) -> ds.Expression:
+        """Converts (column, op, value) filters into a conjunctive pyarrow expression.
+
+        The conversion is shared with ParquetIO, so a filter selects the same rows whether
+        it is pushed down by the dataset or passed to IOService.read.
+        """
+        return ParquetIO.expression(filters)
+
+    @staticmethod
+    def _range(column: str, bounds: tuple) -> list:
+        """Converts a half open [low, high) range into filters."""
+        if bounds is None:
+            return []
+        low, high = bounds
+        filters = []
+        if low is not None:
+            filters.append((column, ">=", low))
+        if high is not None:
+            filters.append((column, "<", high))
+        return filters
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/dataset/profile.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:19:11 am                                                #
+# Modified   : Monday October 19th 2026 12:19:11 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Dataset Profile Module"""
+from __future__ import annotations
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# ------------------------------------------------------------------------------------------------ #
+QUANTILES = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class Profile:
+    """Descriptive statistics for a user/item interaction dataset.
+
+    Degree arrays are aligned with the sorted unique user and item ids, i.e. user_degree[k]
+    is the number of ratings for users[k].
+
+    Args:
+        nrows (int): Number of interactions (rows) in the dataset.
+        ncols (int): Number of columns in the dataset.
+        memory (int): Memory consumed by the dataset in bytes.
+        users (np.ndarray): Sorted array of unique user ids.
+        items (np.ndarray): Sorted array of unique item ids.
+        user_degree (np.ndarray): Number of ratings per user.
+        item_degree (np.ndarray): Number of ratings per item.
+    """
+
+    nrows: int
+    ncols: int
+    memory: int
+    users: np.ndarray
+    items: np.ndarray
+    user_degree: np.ndarray
+    item_degree: np.ndarray
+
+    @property
+    def n_users(self) -> int:
+        return int(self.users.shape[0])
+
+    @property
+    def n_items(self) -> int:
+        return int(self.items.shape[0])
+
+    @property
+    def interaction_matrix_size(self) -> int:
+        return self.n_users * self.n_items
+
+    @property
+    def density(self) -> float:
+        """Percent of the user/item interaction matrix containing ratings."""
+        return self.nrows / self.interaction_matrix_size * 100
+
+    @property
+    def sparsity(self) -> float:
+        return 100 - self.density
+
+    def degree_histogram(self, dimension: str = "user") -> np.ndarray:
+        """Returns the histogram of rating counts, where element k is the number of users
+        (or items) having exactly k ratings.
+
+        Args:
+            dimension (str): Either 'user' or 'item'. Default = 'user'
+        """
+        return np.bincount(self._degree(dimension))
+
+    def degree_quantiles(self, dimension: str = "user", q: tuple = QUANTILES) -> np.ndarray:
+        """Returns the quantiles of the number of ratings per user or item.
+
+        Args:
+            dimension (str): Either 'user' or 'item'. Default = 'user'
+            q (tuple): Quantiles to compute. Default = min, quartiles and max.
+        """
+        return np.quantile(self._degree(dimension), q)
+
+    def degree_distribution(self, dimension: str = "user") -> pd.DataFrame:
+        """Returns the distribution of ratings per user or item in pandas 'describe' format."""
+        return pd.Series(self._degree(dimension), name="n_ratings").describe().to_frame().T
+
+    def to_dict(self) -> dict:
+        """Returns the summary statistics reported by Dataset.summary()."""
+        d = {}
+        d["nrows"] = self.nrows
+        d["ncols"] = self.ncols
+        d["n_users"] = self.n_users
+        d["n_items"] = self.n_items
+        d["max_ratings_per_user"] = int(self.user_degree.max())
+        d["mean_ratings_per_user"] = self.nrows / self.n_users
+        d["min_ratings_per_user"] = int(self.user_degree.min())
+        d["max_ratings_per_item"] = int(self.item_degree.max())
+        d["mean_ratings_per_item"] = self.nrows / self.n_items
+        d["min_ratings_per_item"] = int(self.item_degree.min())
+        d["user_item_ratio"] = self.n_users / self.n_items
+        d["item_user_ratio"] = self.n_items / self.n_users
+        d["size"] = self.nrows * self.ncols
+        d["interaction_matrix_size"] = self.interaction_matrix_size
+        d["memory"] = self.memory
+        d["sparsity"] = self.sparsity
+        d["density"] = self.density
+        return d
+
+    def _degree(self, dimension: str) -> np.ndarray:
+        return self.user_degree if "user" in dimension.lower() else self.item_degree
+
+
+# ------------------------------------------------------------------------------------------------ #
+def profile(data: pd.DataFrame, userid: str = "userId", itemid: str = "movieId") -> Profile:
+    """Profiles an interaction dataframe in a single pass over the user and item columns.
+
+    Args:
+        data (pd.DataFrame): The user rating interaction dataframe.
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+    """
+    users, user_degree = degrees(data[userid].values)
+    items, item_degree = degrees(data[itemid].values)
+    return Profile(
+        nrows=data.shape[0],
+        ncols=data.shape[1],
+        memory=int(data.memory_usage(deep=True).sum()),
+        users=users,
+        items=items,
+        user_degree=user_degree,
+        item_degree=item_degree,
+    )
+
+
+def degrees(ids: np.ndarray) -> tuple:
+    """Returns the sorted unique ids and the number of occurrences of each.
+
+    Non-negative integer ids that are reasonably dense, such as sequential indices or
+    MovieLens ids, are counted with np.bincount in O(n) without sorting. Other ids fall
+    back to np.unique.
+
+    Args:
+        ids (np.ndarray): Array of user or item ids.
+    """
+    if ids.dtype.kind in "iu" and ids.shape[0] > 0:
+        if ids.min() >= 0 and ids.max() < 4 * ids.shape[0] + 65536:
+            counts = np.bincount(ids)
+            uniques = np.flatnonzero(counts)
+            return uniques.astype(ids.dtype, copy=False), counts[uniques]
+    return np.unique(ids, return_counts=True)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/dataset/shard.py                                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:25:05 am                                                #
+# Modified   : Monday October 19th 2026 01:45:12 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Dataset Sharding Module"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import Callable, List
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.index import IndexSequenceOperator
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.profile import Profile
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class MovieLensShard(MovieLens):
+    """A partition of a MovieLens Dataset containing all interactions for a subset of users.
+
+    Shards retain the useridx and itemidx columns of the parent dataset, so every shard
+    shares the global id space, and sparse matrices produced by a shard have the shape of
+    the parent interaction matrix.
+
+    Args:
+        name (str): Name of the shard in lowercase
+        desc (str): Description of the shard
+        data (pd.DataFrame): The interactions of the users assigned to the shard.
+        shard (int): The shard number in [0, n_shards)
+        n_shards (int): The total number of shards.
+        matrix_shape (tuple): Shape of the parent user/item interaction matrix.
+        seed (int): The seed of the hash used to assign users to shards.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        desc: str,
+        data: pd.DataFrame,
+        shard: int,
+        n_shards: int,
+        matrix_shape: tuple,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(name=name, desc=desc, data=data, matrix_shape=matrix_shape)
+        self._shard = shard
+        self._n_shards = n_shards
+        self._seed = seed
+
+    @property
+    def shard(self) -> int:
+        return self._shard
+
+    @property
+    def n_shards(self) -> int:
+        return self._n_shards
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+
+# ------------------------------------------------------------------------------------------------ #
+def assign(ids: np.ndarray, n_shards: int, seed: int = 0) -> np.ndarray:
+    """Assigns ids to shards using a deterministic 64 bit mixing hash.
+
+    The assignment depends only upon the id, the number of shards and the seed, so a user
+    maps to the same shard across runs, processes and datasets.
+
+    Args:
+        ids (np.ndarray): Integer user ids.
+        n_shards (int): The number of shards.
+        seed (int): Hash seed. Default = 0
+    """
+    # SplitMix64 finalizer. Unsigned arithmetic wraps modulo 2**64.
+    h = np.asarray(ids).astype(np.uint64) + np.uint64(seed) * np.uint64(0x9E3779B97F4A7C15)
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    h = h ^ (h >> np.uint64(31))
+    return (h % np.uint64(n_shards)).astype(np.int32)
+
+
+def shard(
+    dataset: MovieLens, n_shards: int, seed: int = 0, userid: str = "userId"
+) -> List[MovieLensShard]:
+    """Partitions a dataset into user-hash shards sharing the global id space.
+
+    The dataset is reindexed first if it lacks the useridx and itemidx columns. Each shard is
+    named '<dataset name>_shard_<k>_of_<n_shards>' so it can be persisted via the
+    AssetCentre alongside its siblings.
+
+    Args:
+        dataset (MovieLens): The dataset to partition.
+        n_shards (int): The number of shards.
+        seed (int): Hash seed. Default = 0
+        userid (str): Name of the column containing the user id.
+    """
+    if n_shards < 1:
+        msg = f"The number of shards must be a positive integer, not {n_shards}."
+        logger.error(msg)
+        raise ValueError(msg)
+
+    # The operator adds the index columns to a shallow copy, so the data need not be copied.
+    data = IndexSequenceOperator(userid=userid)(dataset.to_df(copy=False))
+    matrix_shape = (int(data["useridx"].max()) + 1, int(data["itemidx"].max()) + 1)
+
+    # A stable sort groups the rows by shard while preserving their order within each shard.
+    assignment = assign(data[userid].values, n_shards=n_shards, seed=seed)
+    order = np.argsort(assignment, kind="stable")
+    bounds = np.searchsorted(assignment[order], np.arange(n_shards + 1))
+
+    shards = []
+    for k in range(n_shards):
+        rows = order[bounds[k] : bounds[k + 1]]
+        shards.append(
+            MovieLensShard(
+                name=f"{dataset.name}_shard_{k}_of_{n_shards}",
+                desc=f"Shard {k} of {n_shards} of {dataset.name}",
+                data=data.iloc[rows].reset_index(drop=True),
+                shard=k,
+                n_shards=n_shards,
+                matrix_shape=matrix_shape,
+                seed=seed,
+            )
+        )
+    return shards
+
+
+def map_shards(func: Callable, shards: List[MovieLensShard], max_workers: int = None) -> list:
+    """Applies a function to each shard on a process pool, one shard per task.
+
+    Args:
+        func (Callable): A picklable, i.e. module level, function taking a shard.
+        shards (list): The shards to process.
+        max_workers (int): Number of worker processes. Defaults to the number of shards,
+            capped at the number of processors.
+    """
+    max_workers = max_workers or min(len(shards), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, shards))
+
+
+def combine(shards: List[MovieLens], name: str, desc: str) -> MovieLens:
+    """Concatenates shards, or the outputs of shard-wise operators, into a single dataset.
+
+    Args:
+        shards (list): MovieLens datasets sharing an id space.
+        name (str): Name of the combined dataset.
+        desc (str): Description of the combined dataset.
+    """
+    data = pd.concat([shard.to_df() for shard in shards], axis=0, ignore_index=True)
+    matrix_shape = tuple(int(n) for n in np.max([shard.matrix_shape for shard in shards], axis=0))
+    return MovieLens(name=name, desc=desc, data=data, matrix_shape=matrix_shape)
+
+
+def merge_profiles(profiles: List[Profile]) -> Profile:
+    """Reduces the profiles of user-hash shards into the profile of the whole dataset.
+
+    Users are disjoint across shards whereas items are not, so item degrees are summed over
+    the union of items.
+
+    Args:
+        profiles (list): The Profile of each shard.
+    """
+    users = np.concatenate([p.users for p in profiles])
+    user_degree = np.concatenate([p.user_degree for p in profiles])
+    order = np.argsort(users, kind="stable")
+
+    items, inverse = np.unique(np.concatenate([p.items for p in profiles]), return_inverse=True)
+    item_degree = np.bincount(
+        inverse, weights=np.concatenate([p.item_degree for p in profiles]), minlength=len(items)
+    ).astype(np.int64)
+
+    return Profile(
+        nrows=sum(p.nrows for p in profiles),
+        ncols=profiles[0].ncols,
+        memory=sum(p.memory for p in profiles),
+        users=users[order],
+        items=items,
+        user_degree=user_degree[order],
+        item_degree=item_degree,
+    )
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/dataset/view.py                                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:43:25 am                                                #
+# Modified   : Monday October 19th 2026 01:45:12 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Dataset View Module"""
+from __future__ import annotations
+import logging
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix, csc_matrix, coo_matrix
+
+from recsys.dataset.base import Dataset
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.profile import profile
+
+
+# ------------------------------------------------------------------------------------------------ #
+class SplitView(Dataset):
+    """A subset of the interactions of a MovieLens Dataset, represented by the rows selected.
+
+    The view holds only integer row positions, or a boolean mask, over its parent dataset,
+    so train, validation, test and cross validation folds do not copy the interactions.
+    Data frames and sparse matrices are produced from the parent on request. Matrices
+    retain the shape of the parent interaction matrix, so the matrices of sibling splits
+    share the same user and item coordinates.
+
+    Args:
+        name (str): Name of the view in lowercase
+        desc (str): Description of the view
+        parent (MovieLens): The dataset the view selects from.
+        rows (np.ndarray): Integer positions or a boolean mask over the rows of the parent.
+    """
+
+    def __init__(self, name: str, desc: str, parent: MovieLens, rows: np.ndarray) -> None:
+        super().__init__()
+        self._name = name
+        self._desc = desc
+        self._parent = parent
+        self._rows = np.asarray(rows)
+        self._summary = None
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def desc(self) -> str:
+        return self._desc
+
+    @property
+    def parent(self) -> MovieLens:
+        return self._parent
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows
+
+    @property
+    def shape(self) -> tuple:
+        return (self.nrows, self.ncols)
+
+    @property
+    def columns(self) -> np.array:
+        return self._parent.columns
+
+    @property
+    def nrows(self) -> int:
+        if self._rows.dtype == bool:
+            return int(np.count_nonzero(self._rows))
+        return self._rows.shape[0]
+
+    @property
+    def ncols(self) -> int:
+        return self._parent.ncols
+
+    @property
+    def size(self) -> int:
+        return self.nrows * self.ncols
+
+    @property
+    def matrix_shape(self) -> tuple:
+        return self._parent.matrix_shape
+
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """Prints n rows from the top of the view"""
+        print(self.to_df().head(n))
+
+    def to_df(self) -> pd.DataFrame:
+        """Returns the selected interactions in dataframe format"""
+        return self._parent.to_df(rows=self._rows)
+
+    def load(self) -> MovieLens:
+        """Materializes the view as a MovieLens Dataset with the matrix shape of the parent."""
+        return MovieLens(
+            name=self._name, desc=self._desc, data=self.to_df(), matrix_shape=self.matrix_shape
+        )
+
+    def to_csr(self, centered_by: str = None) -> csr_matrix:
+        """Produces a csr matrix of the selected interactions
+
+        Args:
+            centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+        """
+        return self._parent.to_csr(centered_by=centered_by, rows=self._rows)
+
+    def to_csc(self, centered_by: str = None) -> csc_matrix:
+        """Produces a csc matrix of the selected interactions
+
+        Args:
+            centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+        """
+        return self._parent.to_csc(centered_by=centered_by, rows=self._rows)
+
+    def to_coo(self, centered_by: str = None) -> coo_matrix:
+        """Produces a coo matrix of the selected interactions
+
+        Args:
+            centered_by (str): Valid values in [None, 'user', 'item']. Default is None
+        """
+        return self._parent.to_coo(centered_by=centered_by, rows=self._rows)
+
+    def to_binary(self) -> csr_matrix:
+        """Returns a binary user/item interaction matrix of the selected interactions"""
+        return self._parent.to_binary(rows=self._rows)
+
+    def _summarize(self) -> pd.DataFrame:
+        """Runs a data profile including basic summary statistics"""
+        if self._summary is None:
+            self._summary = pd.DataFrame.from_dict(
+                data=profile(self.to_df()).to_dict(), orient="index", columns=[self._name]
+            )
+        return self._summary
@@ -11,19 +11,23 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday March 17th 2023 03:29:59 pm                                                  #
-# Modified   : Monday March 20th 2023 09:53:30 am                                                  #
+# Modified   : Monday October 19th 2026 12:49:24 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from recsys.datasource.base import DataSource
 from recsys.dataprep.download import DownloadOperator
 from recsys.dataprep.extract import ZipExtractOperator
+from recsys.services.cache import IngestCache
 from recsys.services.io import IOService
 
+# ------------------------------------------------------------------------------------------------ #
+RATING_TYPES = {"userId": "int32", "movieId": "int32", "rating": "float32", "timestamp": "int64"}
+
 
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
@@ -33,6 +37,8 @@ class MovieLens(DataSource):
     filename: str = None
     directory: str = None
     force: bool = False
+    to_parquet: bool = False
+    column_types: dict = None
 
     def __post_init__(self) -> None:
         super().__init__()
@@ -43,7 +49,12 @@ class MovieLens(DataSource):
         downloader.__call__()
 
         extractor = ZipExtractOperator(
-            source=self.destination, destination=self.directory, member=self.filename
+            source=self.destination,
+            destination=self.directory,
+            member=self.filename,
+            force=self.force,
+            to_parquet=self.to_parquet,
+            column_types=self.column_types,
         )
         extractor.__call__()
 
@@ -58,14 +69,15 @@ class MovieLens1M(MovieLens):
     directory: str = "data/movielens1m/raw"
     force: bool = False
 
-    def __post_init__(self) -> None:
-        super().__init__()
-
     def fetch_data(self) -> None:
+        """Parses the ratings on first use, then returns them memory-mapped from the cache."""
         super().fetch_data()
-        ratings = IOService.read(os.path.join(self.directory, self.filename), sep="::")
-        IOService.write(filepath=os.path.join(self.directory, "ratings.pkl"), data=ratings)
-        return ratings
+        cache = IngestCache(directory=os.path.join(self.directory, "cache"))
+        return cache.read(
+            os.path.join(self.directory, self.filename),
+            names=list(RATING_TYPES.keys()),
+            column_types=RATING_TYPES,
+        )
 
 
 @dataclass
@@ -78,14 +90,15 @@ class MovieLens10M(MovieLens):
     directory: str = "data/movielens10m/raw"
     force: bool = False
 
-    def __post_init__(self) -> None:
-        super().__init__()
-
     def fetch_data(self) -> None:
+        """Parses the ratings on first use, then returns them memory-mapped from the cache."""
         super().fetch_data()
-        ratings = IOService.read(os.path.join(self.directory, self.filename), sep="::")
-        IOService.write(filepath=os.path.join(self.directory, "ratings.pkl"), data=ratings)
-        return ratings
+        cache = IngestCache(directory=os.path.join(self.directory, "cache"))
+        return cache.read(
+            os.path.join(self.directory, self.filename),
+            names=list(RATING_TYPES.keys()),
+            column_types=RATING_TYPES,
+        )
 
 
 @dataclass
@@ -97,12 +110,10 @@ class MovieLens25M(MovieLens):
     filename: str = "ratings.csv"
     directory: str = "data/movielens25m/raw"
     force: bool = False
-
-    def __post_init__(self) -> None:
-        super().__init__()
+    to_parquet: bool = True
+    column_types: dict = field(default_factory=lambda: dict(RATING_TYPES))
 
     def fetch_data(self) -> None:
+        """Streams the ratings from the archive into ratings.parquet in a single pass."""
         super().fetch_data()
-        ratings = IOService.read(os.path.join(self.directory, self.filename))
-        IOService.write(filepath=os.path.join(self.directory, "ratings.pkl"), data=ratings)
-        return ratings
+        return IOService.read(os.path.join(self.directory, "ratings.parquet"))
@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday March 17th 2023 06:05:25 pm                                                  #
-# Modified   : Sunday March 19th 2023 04:13:29 pm                                                  #
+# Modified   : Monday October 19th 2026 12:24:08 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -413,13 +413,9 @@ class InteractionMatrix(Matrix):
         self._profiled = True
 
     def _reindex(self, id: str, to: str) -> None:
-        """Creates sequential ids for users and movies."""
-        # Get unique user or movie ids.
-        features = np.sort(self._data[id].unique())
-        features = pd.DataFrame(data=features, columns=[id])
-        features.reset_index(inplace=True)
-        features = features.rename(columns={"index": to})
-        self._data = self._data.merge(features, how="left", on=id)
+        """Creates sequential ids for users and movies, assigned in sorted id order."""
+        codes, _ = pd.factorize(self._data[id], sort=True)
+        self._data[to] = codes.astype(np.int32)
 
     def _arrange_cols(self) -> None:
         cols = [
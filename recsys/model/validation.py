@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/model/validation.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:45:15 am                                                #
+# Modified   : Monday October 19th 2026 01:40:07 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Cross Validation Module"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import multiprocessing as mp
+from multiprocessing.shared_memory import SharedMemory
+import os
+import time
+from typing import Iterator
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.split import assign_folds
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.view import SplitView
+from recsys.model.algorithm import Algorithm
+
+# ------------------------------------------------------------------------------------------------ #
+# Environment variables read by the BLAS and OpenMP runtimes when they are loaded.
+BLAS_THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+# ------------------------------------------------------------------------------------------------ #
+class CrossValidator:
+    """Fits and scores an Algorithm on each fold of a k-fold cross validation in parallel.
+
+    The columns of the dataset, and the fold assignments, are placed in shared memory once,
+    rather than pickled to each worker. Each fold is evaluated in a worker process, which
+    copies the arrays out of shared memory, so the algorithm, its predictions and its
+    metrics may hold the data for as long as they like, and presents the training fold to
+    the algorithm as a SplitView. Columns of object dtype, which cannot be placed in shared
+    memory, are pickled to the workers instead. Workers are started with the BLAS thread count pinned, via environment
+    variables, so that the workers together do not oversubscribe the cores.
+
+    The algorithm is fit on the training view, and scored with its score method on the
+    test interactions. Additional metrics are computed from its predictions.
+
+    Args:
+        algorithm (Algorithm): The algorithm to evaluate. A copy is sent to each worker.
+        n_folds (int): The number of folds. Default = 5
+        metrics (dict): Optional metric functions of (y_true, y_pred), keyed by name.
+        max_workers (int): Maximum number of worker processes. Defaults to the lesser of
+            the number of folds and the number of cores.
+        blas_threads (int): BLAS threads per worker. Defaults to the number of cores
+            divided by the number of workers.
+        seed (int): Seed for the random fold assignments. Default = None
+        userid (str): Name of the column containing the user id.
+        itemid (str): Name of the column containing the item id.
+        rating (str): Name of the column containing the rating.
+    """
+
+    def __init__(
+        self,
+        algorithm: Algorithm,
+        n_folds: int = 5,
+        metrics: dict = None,
+        max_workers: int = None,
+        blas_threads: int = None,
+        seed: int = None,
+        userid: str = "userId",
+        itemid: str = "movieId",
+        rating: str = "rating",
+    ) -> None:
+        self._algorithm = algorithm
+        self._n_folds = n_folds
+        self._metrics = metrics or {}
+        self._max_workers = max_workers or min(n_folds, os.cpu_count() or 1)
+        self._blas_threads = blas_threads or max(1, (os.cpu_count() or 1) // self._max_workers)
+        self._seed = seed
+        self._userid = userid
+        self._itemid = itemid
+        self._rating = rating
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    def run(self, dataset: MovieLens) -> pd.DataFrame:
+        """Evaluates the algorithm on each fold of the dataset.
+
+        Args:
+            dataset (MovieLens): The dataset to cross validate.
+
+        Returns: pd.DataFrame with one row of metrics per fold.
+        """
+        # The columns are copied into shared memory, so the frame itself need not be copied.
+        data = dataset.to_df(copy=False)
+        columns = {column: data[column].values for column in data.columns}
+        columns["__fold"] = assign_folds(n=data.shape[0], n_folds=self._n_folds, seed=self._seed)
+        del data
+
+        with _share(columns) as blocks, _pinned(self._blas_threads):
+            self._logger.debug(
+                f"Running {self._n_folds} folds on {self._max_workers} workers with "
+                f"{self._blas_threads} BLAS threads each."
+            )
+            with ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=mp.get_context("spawn")
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _evaluate,
+                        blocks=blocks,
+                        fold=k,
+                        algorithm=self._algorithm,
+                        metrics=self._metrics,
+                        features=[self._userid, self._itemid],
+                        rating=self._rating,
+                    )
+                    for k in range(self._n_folds)
+                ]
+                results = [future.result() for future in futures]
+        return pd.DataFrame(results)
+
+
+# ------------------------------------------------------------------------------------------------ #
+def _evaluate(
+    blocks: dict, fold: int, algorithm: Algorithm, metrics: dict, features: list, rating: str
+) -> dict:
+    """Fits and scores the algorithm on one fold, in a worker process."""
+    return _fit_score(_load(blocks), fold, algorithm, metrics, features, rating)
+
+
+def _fit_score(
+    columns: dict, fold: int, algorithm: Algorithm, metrics: dict, features: list, rating: str
+) -> dict:
+    """Fits the algorithm on the training view of a fold and scores it on the test set."""
+    test = columns.pop("__fold") == fold
+    parent = MovieLens(
+        name="cross_validation", desc="Cross Validation", data=pd.DataFrame(columns, copy=False)
+    )
+    train = SplitView(name=f"train_fold_{fold}", desc="Training Fold", parent=parent, rows=~test)
+    X = parent.to_df(rows=test, copy=False)[features]
+    y = columns[rating][test]
+
+    result = {"fold": fold, "n_train": train.nrows, "n_test": X.shape[0]}
+    started = time.perf_counter()
+    algorithm.fit(train)
+    result["fit_time"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result["score"] = algorithm.score(X, y)
+    if metrics:
+        predictions = np.asarray(algorithm.predict(X)).ravel()
+        for name, metric in metrics.items():
+            result[name] = metric(y, predictions)
+    result["score_time"] = time.perf_counter() - started
+    return result
+
+
+@contextmanager
+def _share(columns: dict) -> Iterator[dict]:
+    """Copies arrays into shared memory blocks, unlinked on exit.
+
+    Yields the (name, dtype, shape) of the block for each array, keyed by column. Arrays of
+    object dtype hold references to Python objects, so they are yielded as they are, to be
+    pickled.
+    """
+    segments = []
+    try:
+        blocks = {}
+        for column, array in columns.items():
+            array = np.ascontiguousarray(array)
+            if array.dtype == object:
+                blocks[column] = array
+                continue
+            shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+            segments.append(shm)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+            blocks[column] = (shm.name, array.dtype.str, array.shape)
+        yield blocks
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+
+def _load(blocks: dict) -> dict:
+    """Returns copies of the arrays in shared memory blocks, keyed by column.
+
+    The arrays are copied, rather than mapped, because a block is unmapped when closed, and
+    the algorithm may retain the data, or return views of it, beyond the fold.
+    """
+    columns = {}
+    for column, block in blocks.items():
+        if isinstance(block, np.ndarray):
+            columns[column] = block
+            continue
+        name, dtype, shape = block
+        # Spawned workers share the resource tracker of the parent, which owns the blocks
+        # and unlinks them. Attaching adds no registration the parent does not remove.
+        shm = SharedMemory(name=name)
+        try:
+            columns[column] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf).copy()
+        finally:
+            shm.close()
+    return columns
+
+
+@contextmanager
+def _pinned(threads: int) -> Iterator[None]:
+    """Sets the BLAS thread count in the environment inherited by new processes."""
+    previous = {var: os.environ.get(var) for var in BLAS_THREAD_VARS}
+    try:
+        for var in BLAS_THREAD_VARS:
+            os.environ[var] = str(threads)
+        yield
+    finally:
+        for var, value in previous.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/services/benchmark.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 01:00:20 am                                                #
+# Modified   : Monday October 19th 2026 01:00:20 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""IO Benchmark Module"""
+import os
+import tempfile
+import time
+import logging
+
+import pandas as pd
+
+from recsys.services.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# (file extension, compression, compression level) configurations compared by default.
+CONFIGURATIONS = [
+    ("parquet", "none", None),
+    ("parquet", "snappy", None),
+    ("parquet", "lz4", None),
+    ("parquet", "zstd", 1),
+    ("parquet", "zstd", 9),
+    ("arrow", "none", None),
+    ("arrow", "lz4", None),
+    ("arrow", "zstd", 1),
+    ("arrow", "zstd", 9),
+    ("pkl", "none", None),
+    ("pkl", "lz4", None),
+    ("pkl", "zstd", 1),
+    ("pkl", "zstd", 9),
+]
+
+
+# ------------------------------------------------------------------------------------------------ #
+def benchmark_compression(
+    data: pd.DataFrame, configurations: list = None, directory: str = None, repeats: int = 3
+) -> pd.DataFrame:
+    """Measures the file size and the write and read throughput of each configuration.
+
+    Each configuration writes and reads the data through IOService, and the fastest of the
+    repeats is reported. Throughput is measured against the in-memory size of the data.
+
+    Args:
+        data (pd.DataFrame): The data to write, e.g. the ratings frame.
+        configurations (list): (file extension, compression, compression level) tuples.
+            Defaults to CONFIGURATIONS.
+        directory (str): Directory for the files written. Defaults to a temporary directory.
+        repeats (int): Number of times each configuration is written and read. Default = 3
+
+    Returns: pd.DataFrame with one row per configuration.
+    """
+    configurations = configurations or CONFIGURATIONS
+    nbytes = int(data.memory_usage(deep=True).sum())
+    with tempfile.TemporaryDirectory(dir=directory) as tempdir:
+        results = []
+        for fmt, compression, level in configurations:
+            filepath = os.path.join(tempdir, f"{compression}_{level}.{fmt}")
+            write_time, read_time = float("inf"), float("inf")
+            for _ in range(repeats):
+                started = time.perf_counter()
+                IOService.write(
+                    filepath=filepath, data=data, compression=compression, compression_level=level
+                )
+                write_time = min(write_time, time.perf_counter() - started)
+                started = time.perf_counter()
+                IOService.read(filepath)
+                read_time = min(read_time, time.perf_counter() - started)
+            size = os.path.getsize(filepath)
+            results.append(
+                {
+                    "format": fmt,
+                    "compression": compression,
+                    "level": level,
+                    "size_mb": size / 2**20,
+                    "ratio": nbytes / size,
+                    "write_mb_s": nbytes / 2**20 / write_time,
+                    "read_mb_s": nbytes / 2**20 / read_time,
+                }
+            )
+            logger.debug(f"Benchmarked {fmt} with {compression} level {level}: {results[-1]}")
+    return pd.DataFrame(results)
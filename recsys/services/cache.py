@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /recsys/services/cache.py                                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:52:38 am                                                #
+# Modified   : Monday October 19th 2026 01:26:58 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+"""Ingest Cache Module"""
+import hashlib
+import json
+import os
+import uuid
+import logging
+
+import pandas as pd
+import pyarrow as pa
+
+from recsys.services.io import ArrowIO, IOService
+
+
+# ------------------------------------------------------------------------------------------------ #
+class IngestCache:
+    """Caches parsed raw files as Arrow IPC files, keyed by file content and parser settings.
+
+    The key is a digest of the raw file contents together with the keyword arguments passed
+    to the parser, so a cached file is reused only if neither has changed. On a miss, the
+    raw file is parsed by IOService, and the result is written to '<stem>-<key>.arrow' in the
+    cache directory. Cached files are memory-mapped when read, and numeric columns without
+    nulls are presented to pandas without being copied.
+
+    The digest of each raw file is recorded with its size and modification time, so a raw
+    file is only hashed again if it has been modified.
+
+    Args:
+        directory (str): The cache directory.
+        block_size (int): Bytes read per block when hashing the raw file. Default = 1 MiB
+    """
+
+    def __init__(self, directory: str, block_size: int = 1048576) -> None:
+        self._directory = directory
+        self._block_size = block_size
+        self._index_filepath = os.path.join(directory, "index.json")
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def read(self, filepath: str, **kwargs) -> pd.DataFrame:
+        """Returns the parsed contents of a raw file, parsing it only on a cache miss.
+
+        Args:
+            filepath (str): Path to the raw file.
+            kwargs (dict): Keyword arguments for IOService.read.
+        """
+        cached = self.filepath(filepath, **kwargs)
+        if os.path.exists(cached):
+            self._logger.debug(f"Cache hit for {filepath}: {cached}")
+        else:
+            self._logger.debug(f"Cache miss for {filepath}. Parsing.")
+            data = IOService.read(filepath, **kwargs)
+            ArrowIO.write(cached, pa.Table.from_pandas(data, preserve_index=False))
+            del data
+        return ArrowIO.read(cached)
+
+    def filepath(self, filepath: str, **kwargs) -> str:
+        """Returns the path of the cached file for a raw file and parser settings."""
+        settings = json.dumps(kwargs, sort_keys=True, default=str)
+        key = hashlib.sha256(f"{self.digest(filepath)}:{settings}".encode()).hexdigest()
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        return os.path.join(self._directory, f"{stem}-{key[:16]}.arrow")
+
+    def digest(self, filepath: str) -> str:
+        """Returns the sha256 digest of a raw file, hashing it only if it has changed."""
+        stat = os.stat(filepath)
+        index = self._read_index()
+        entry = index.get(os.path.abspath(filepath))
+        if (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime"] == stat.st_mtime_ns
+        ):
+            return entry["digest"]
+
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            while data := f.read(self._block_size):
+                digest.update(data)
+        index[os.path.abspath(filepath)] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "digest": digest.hexdigest(),
+        }
+        os.makedirs(self._directory, exist_ok=True)
+        # Written to a temporary file and renamed, so a reader never sees a partial index.
+        tempfile = os.path.join(self._directory, f".{uuid.uuid4().hex[:8]}.index.json")
+        with open(tempfile, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tempfile, self._index_filepath)
+        return digest.hexdigest()
+
+    def clear(self) -> None:
+        """Removes all cached files and recorded digests."""
+        if os.path.isdir(self._directory):
+            for filename in os.listdir(self._directory):
+                if filename.endswith(".arrow") or filename == "index.json":
+                    os.remove(os.path.join(self._directory, filename))
+
+    def _read_index(self) -> dict:
+        if not os.path.exists(self._index_filepath):
+            return {}
+        with open(self._index_filepath, "r") as f:
+            return json.load(f)
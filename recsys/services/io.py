@@ -11,21 +11,33 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Saturday March 4th 2023 05:56:09 pm                                                 #
-# Modified   : Friday March 17th 2023 05:24:54 pm                                                  #
+# Modified   : Monday October 19th 2026 01:29:06 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
 # ================================================================================================ #
 from abc import ABC, abstractmethod
+import atexit
+import glob
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import json
 import os
+import queue
+import shutil
+import threading
+import uuid
 import logging
 import yaml
 import pickle
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
-from typing import Any, Union, List
-
+import scipy.sparse as sp
+from typing import Any, Iterator, Union, List
 
 # ------------------------------------------------------------------------------------------------ #
 
@@ -46,16 +58,76 @@ class IO(ABC):  # pragma: no cover
     def _read(cls, filepath: str, **kwargs) -> Any:
         pass
 
+    @classmethod
+    def iter_batches(cls, filepath: str, batch_size: int = None, **kwargs) -> Iterator[Any]:
+        return cls._iter_batches(filepath, batch_size=batch_size, **kwargs)
+
+    @classmethod
+    def _iter_batches(cls, filepath: str, batch_size: int = None, **kwargs) -> Iterator[Any]:
+        msg = f"{cls.__name__} does not support reading {filepath} in batches."
+        cls._logger.error(msg)
+        raise ValueError(msg)
+
     @classmethod
     def write(cls, filepath: str, data: Any, *args, **kwargs) -> None:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        cls._write(filepath, data, **kwargs)
+        """Writes the data to a temporary file in the target directory, then renames it.
+
+        The rename is atomic, so the file at filepath is always either the previous version
+        or the complete new one, never a partial write. The temporary file is removed if
+        the write fails.
+        """
+        directory = os.path.dirname(filepath)
+        os.makedirs(directory or ".", exist_ok=True)
+        # The temporary file keeps the extension, which some writers depend on.
+        tempfile = os.path.join(directory, f".{uuid.uuid4().hex[:8]}.{os.path.basename(filepath)}")
+        try:
+            if kwargs.get("write_mode", "w").startswith("a") and os.path.exists(filepath):
+                shutil.copyfile(filepath, tempfile)
+            cls._write(tempfile, data, **kwargs)
+            cls._replace(tempfile, filepath)
+        except BaseException:
+            cls._discard(tempfile)
+            raise
+
+    @classmethod
+    def _replace(cls, source: str, destination: str) -> None:
+        """Moves the source file, or directory, to the destination, replacing it."""
+        if os.path.isdir(source) and os.path.isdir(destination):
+            # A directory can only be renamed over an empty one, so the old one is moved aside.
+            previous = f"{source}.previous"
+            os.replace(destination, previous)
+            os.replace(source, destination)
+            shutil.rmtree(previous)
+        else:
+            os.replace(source, destination)
+
+    @classmethod
+    def _discard(cls, filepath: str) -> None:
+        """Removes a temporary file or directory, if it exists."""
+        if os.path.isdir(filepath):
+            shutil.rmtree(filepath)
+        elif os.path.exists(filepath):
+            os.remove(filepath)
 
     @classmethod
     @abstractmethod
     def _write(cls, filepath: str, data: Any, **kwargs) -> None:
         pass
 
+    @classmethod
+    def _codec(cls, compression: str, compression_level: int = None) -> Union[pa.Codec, None]:
+        """Returns the pyarrow codec for a compression name, or None for no compression."""
+        if compression is None or compression.lower() == "none":
+            return None
+        if not pa.Codec.is_available(compression.lower()):
+            msg = (
+                f"Compression {compression} is not supported. Valid values include 'zstd', "
+                "'lz4' and 'none'."
+            )
+            cls._logger.error(msg)
+            raise ValueError(msg)
+        return pa.Codec(compression.lower(), compression_level=compression_level)
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                         EXCEL IO                                                 #
@@ -111,6 +183,15 @@ class ExcelIO(IO):  # pragma: no cover
 
 
 class CSVIO(IO):  # pragma: no cover
+    """Reads and writes delimited text files with pandas.
+
+    Further keyword arguments are passed to pandas.read_csv. iter_batches streams the file
+    as DataFrames of batch_size rows, converted to the dtype given, so a file larger than
+    memory can be processed a batch at a time.
+    """
+
+    batch_size = 1000000
+
     @classmethod
     def _read(
         cls,
@@ -132,8 +213,34 @@ class CSVIO(IO):  # pragma: no cover
             usecols=usecols,
             low_memory=low_memory,
             encoding=encoding,
+            **kwargs,
         )
 
+    @classmethod
+    def _iter_batches(
+        cls,
+        filepath: str,
+        batch_size: int = None,
+        sep: str = ",",
+        header: Union[int, None] = 0,
+        usecols: List[str] = None,
+        dtype: dict = None,
+        encoding: str = "utf-8",
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            filepath,
+            sep=sep,
+            header=header,
+            usecols=usecols,
+            dtype=dtype,
+            encoding=encoding,
+            chunksize=batch_size or cls.batch_size,
+            engine="python" if len(sep) > 1 else "c",
+            **kwargs,
+        ) as reader:
+            yield from reader
+
     @classmethod
     def _write(
         cls,
@@ -145,7 +252,167 @@ class CSVIO(IO):  # pragma: no cover
         encoding: str = "utf-8",
         **kwargs,
     ) -> None:
-        data.to_csv(filepath, sep=sep, index=index, index_label=index_label, encoding=encoding)
+        data.to_csv(
+            filepath, sep=sep, index=index, index_label=index_label, encoding=encoding, **kwargs
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        DAT IO                                                    #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class DatIO(IO):  # pragma: no cover
+    """Reads and writes the '::' delimited .dat files of the MovieLens 1M and 10M datasets.
+
+    The pandas C parser only supports single character delimiters. Rather than fall back to
+    the python engine, the delimiter is replaced in the raw bytes by the ASCII unit
+    separator, which does not occur in the files, and the result is parsed by the
+    multi-threaded pyarrow CSV reader directly into the column types requested.
+
+    iter_batches applies the same substitution to one block of complete lines at a time,
+    and yields DataFrames of batch_size rows, so memory is bounded by the block size.
+
+    As with CSVIO, the column types may be given as dtype. Arguments the pyarrow reader does
+    not support raise a ValueError rather than being ignored.
+    """
+
+    delimiter = "\x1f"
+    batch_size = 1000000
+
+    @classmethod
+    def _read(
+        cls,
+        filepath: str,
+        sep: str = "::",
+        header: Union[int, None] = None,
+        names: List[str] = None,
+        usecols: List[str] = None,
+        column_types: dict = None,
+        dtype: dict = None,
+        encoding: str = "utf-8",
+        block_size: int = 16777216,
+        **kwargs,
+    ) -> pd.DataFrame:
+        column_types = cls._column_types(column_types, dtype, kwargs)
+        with open(filepath, "rb") as f:
+            data = f.read()
+        return cls._parse(
+            data, sep, header, names, usecols, column_types, encoding, block_size
+        ).to_pandas()
+
+    @classmethod
+    def _iter_batches(
+        cls,
+        filepath: str,
+        batch_size: int = None,
+        sep: str = "::",
+        header: Union[int, None] = None,
+        names: List[str] = None,
+        usecols: List[str] = None,
+        column_types: dict = None,
+        dtype: dict = None,
+        encoding: str = "utf-8",
+        block_size: int = 16777216,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        column_types = cls._column_types(column_types, dtype, kwargs)
+        batch_size = batch_size or cls.batch_size
+        pending = None
+        with open(filepath, "rb") as f:
+            # Column names are resolved up front, so that every block is parsed with them.
+            if header is not None:
+                for _ in range(header):
+                    f.readline()
+                line = f.readline()
+            else:
+                line = f.readline()
+                f.seek(0)
+            fields = line.decode(encoding).rstrip("\r\n").split(sep)
+            if names is None:
+                names = fields if header is not None else [f"f{i}" for i in range(len(fields))]
+
+            remainder = b""
+            while block := f.read(block_size):
+                # Only complete lines are parsed. The partial last line is carried over.
+                block = remainder + block
+                end = block.rfind(b"\n") + 1
+                block, remainder = block[:end], block[end:]
+                if not block:
+                    continue
+                table = cls._parse(
+                    block, sep, None, names, usecols, column_types, encoding, block_size
+                )
+                pending = table if pending is None else pa.concat_tables([pending, table])
+                while pending.num_rows >= batch_size:
+                    yield pending.slice(0, batch_size).to_pandas()
+                    pending = pending.slice(batch_size)
+            if remainder:
+                table = cls._parse(
+                    remainder, sep, None, names, usecols, column_types, encoding, block_size
+                )
+                pending = table if pending is None else pa.concat_tables([pending, table])
+        if pending is not None and pending.num_rows > 0:
+            yield pending.to_pandas()
+
+    @classmethod
+    def _column_types(cls, column_types: dict, dtype: dict, kwargs: dict) -> dict:
+        """Returns the pyarrow column types, given as column_types or dtype."""
+        if kwargs:
+            msg = f"{cls.__name__} does not support the arguments {sorted(kwargs)}."
+            cls._logger.error(msg)
+            raise ValueError(msg)
+        types = {}
+        for column, value in {**(dtype or {}), **(column_types or {})}.items():
+            if isinstance(value, str):
+                value = pa.type_for_alias(value)
+            elif not isinstance(value, pa.DataType):
+                value = pa.from_numpy_dtype(value)
+            types[column] = value
+        return types
+
+    @classmethod
+    def _parse(
+        cls,
+        data: bytes,
+        sep: str,
+        header: Union[int, None],
+        names: List[str],
+        usecols: List[str],
+        column_types: dict,
+        encoding: str,
+        block_size: int,
+    ) -> pa.Table:
+        """Parses '::' delimited bytes into a table of the column types given."""
+        buffer = pa.py_buffer(data.replace(sep.encode(), cls.delimiter.encode()))
+        return pacsv.read_csv(
+            pa.BufferReader(buffer),
+            read_options=pacsv.ReadOptions(
+                use_threads=True,
+                block_size=block_size,
+                column_names=names,
+                autogenerate_column_names=names is None and header is None,
+                skip_rows=0 if header is None else header + int(names is not None),
+                encoding=encoding,
+            ),
+            parse_options=pacsv.ParseOptions(delimiter=cls.delimiter, quote_char=False),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types, include_columns=usecols
+            ),
+        )
+
+    @classmethod
+    def _write(
+        cls,
+        filepath: str,
+        data: pd.DataFrame,
+        sep: str = "::",
+        encoding: str = "utf-8",
+        **kwargs,
+    ) -> None:
+        text = data.to_csv(sep=cls.delimiter, header=False, index=False, quoting=3)
+        with open(filepath, "w", encoding=encoding) as f:
+            f.write(text.replace(cls.delimiter, sep))
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -183,31 +450,156 @@ class YamlIO(IO):  # pragma: no cover
 # ------------------------------------------------------------------------------------------------ #
 
 
+@dataclass
+class OutOfBandPickle:
+    """A protocol 5 pickle whose large buffers are stored out-of-band in a sidecar file.
+
+    Args:
+        payload (bytes): The pickle stream, excluding the out-of-band buffers.
+        offsets (list): Byte offset of each buffer in the sidecar file.
+        lengths (list): Byte length of each buffer.
+        sidecar (str): Filename of the sidecar file, in the directory of the pickle.
+    """
+
+    payload: bytes
+    offsets: list
+    lengths: list
+    sidecar: str = None
+
+
 class PickleIO(IO):  # pragma: no cover
+    """Reads and writes pickles.
+
+    With out_of_band, objects are pickled with protocol 5, and contiguous buffers of at least
+    threshold bytes, such as the arrays of numpy, pandas and scipy objects, are written
+    out-of-band to a uniquely named '.buffers' sidecar file rather than copied into the
+    pickle stream. The pickle records the name of its sidecar, so replacing the pickle
+    switches atomically to the new sidecar, and sidecars no longer referenced are removed
+    once it has been replaced. On read, the sidecar is memory-mapped and the arrays are
+    reconstructed as views of it, without copying. The default mmap_mode 'c' maps the
+    sidecar copy-on-write, so the arrays are writable without modifying the file. Pickles
+    written in-band, including those written before out-of-band buffers were supported,
+    load as before.
+
+    With compression, e.g. 'zstd' or 'lz4', the pickle stream is compressed at the
+    compression_level given, or the codec default. The codec is detected on read.
+    Out-of-band buffers are not compressed, so that they can be memory-mapped.
+    """
+
+    threshold = 1048576
+    alignment = 64
+    # Leading bytes of the zstd and lz4 frame formats. Uncompressed pickles begin with 0x80.
+    magic = {b"\x28\xb5\x2f\xfd": "zstd", b"\x04\x22\x4d\x18": "lz4"}
+
     @classmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
+    def sidecars(cls, filepath: str) -> List[str]:
+        """Returns the paths of the existing sidecar files written for a pickle."""
+        directory, filename = os.path.split(filepath)
+        pattern = os.path.join(glob.escape(directory), f".*.{glob.escape(filename)}.buffers")
+        return glob.glob(pattern) + [
+            path for path in [f"{filepath}.buffers"] if os.path.exists(path)
+        ]
+
+    @classmethod
+    def _read(cls, filepath: str, mmap_mode: str = "c", **kwargs) -> Any:
 
         with open(filepath, "rb") as f:
+            compression = cls.magic.get(f.read(4))
+            f.seek(0)
+            stream = f if compression is None else pa.CompressedInputStream(f, compression)
             try:
-                return pickle.load(f)
-            except pickle.PickleError() as e:  # pragma: no cover
+                data = pickle.load(stream)
+            except pickle.PickleError as e:  # pragma: no cover
                 cls._logger.error(e)
                 raise IOError(e)
-            finally:
-                f.close()
+        if isinstance(data, OutOfBandPickle):
+            return cls._load_out_of_band(filepath, data, mmap_mode)
+        return data
 
     @classmethod
-    def _write(cls, filepath: str, data: Any, write_mode: str = "wb", **kwargs) -> None:
+    def _write(
+        cls,
+        filepath: str,
+        data: Any,
+        write_mode: str = "wb",
+        out_of_band: bool = False,
+        threshold: int = None,
+        compression: str = None,
+        compression_level: int = None,
+        **kwargs,
+    ) -> None:
         # Note, "a+" write_mode for append. If <TypeError: write() argument must be str, not bytes>
         # use "ab+"
+        codec = cls._codec(compression, compression_level)
+        if out_of_band:
+            data = cls._dump_out_of_band(f"{filepath}.buffers", data, threshold or cls.threshold)
         with open(filepath, write_mode) as f:
             try:
-                pickle.dump(data, f)
-            except pickle.PickleError() as e:  # pragma: no cover
+                if codec is None:
+                    pickle.dump(data, f, protocol=5 if out_of_band else None)
+                else:
+                    f.write(codec.compress(pickle.dumps(data, protocol=5), asbytes=True))
+            except pickle.PickleError as e:  # pragma: no cover
                 cls._logger.error(e)
                 raise (e)
-            finally:
-                f.close()
+
+    @classmethod
+    def _replace(cls, source: str, destination: str) -> None:
+        """Replaces the pickle, then removes the sidecars the previous version referenced."""
+        previous = cls.sidecars(destination)
+        super()._replace(source, destination)
+        current = f"{source}.buffers"
+        for sidecar in previous:
+            if os.path.basename(sidecar) != os.path.basename(current):
+                os.remove(sidecar)
+
+    @classmethod
+    def _discard(cls, filepath: str) -> None:
+        super()._discard(filepath)
+        super()._discard(f"{filepath}.buffers")
+
+    @classmethod
+    def _dump_out_of_band(cls, sidecar: str, data: Any, threshold: int) -> OutOfBandPickle:
+        """Pickles the data, writing buffers of at least threshold bytes to the sidecar."""
+        buffers = []
+
+        def callback(buffer: pickle.PickleBuffer) -> bool:
+            if buffer.raw().nbytes < threshold:
+                return True
+            buffers.append(buffer)
+            return False
+
+        payload = pickle.dumps(data, protocol=5, buffer_callback=callback)
+        offsets, lengths = [], []
+        if buffers:
+            with open(sidecar, "wb") as f:
+                for buffer in buffers:
+                    # Each buffer starts on an aligned offset, so the arrays mapped are aligned.
+                    f.write(bytes(-f.tell() % cls.alignment))
+                    offsets.append(f.tell())
+                    raw = buffer.raw()
+                    lengths.append(raw.nbytes)
+                    f.write(raw)
+        return OutOfBandPickle(
+            payload=payload, offsets=offsets, lengths=lengths, sidecar=os.path.basename(sidecar)
+        )
+
+    @classmethod
+    def _load_out_of_band(cls, filepath: str, data: OutOfBandPickle, mmap_mode: str) -> Any:
+        """Unpickles the data with its buffers mapped, or read, from the sidecar."""
+        sidecar = os.path.join(os.path.dirname(filepath), data.sidecar or "")
+        if data.sidecar is None:
+            sidecar = f"{filepath}.buffers"
+        if not data.offsets:
+            source = np.empty(shape=0, dtype=np.uint8)
+        elif mmap_mode is None:
+            source = np.fromfile(sidecar, dtype=np.uint8)
+        else:
+            source = np.memmap(sidecar, dtype=np.uint8, mode=mmap_mode)
+        buffers = [
+            source[offset : offset + length] for offset, length in zip(data.offsets, data.lengths)
+        ]
+        return pickle.loads(data.payload, buffers=buffers)
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -216,17 +608,270 @@ class PickleIO(IO):  # pragma: no cover
 
 
 class ParquetIO(IO):  # pragma: no cover
+    """Reads and writes Parquet files.
+
+    Reads may project columns and filter rows. Filters are given in the disjunctive normal
+    form accepted by pyarrow, e.g. [("rating", ">=", 4), ("userId", "in", [1, 2])], and are
+    pushed down to skip row groups whose statistics exclude them. The file is scanned in
+    batches of batch_size rows, and iter_batches yields the batches one at a time, so a
+    file larger than memory can be streamed.
+    """
+
+    batch_size = 131072
+
     @classmethod
-    def _read(cls, filepath: str, **kwargs) -> Any:
+    def _read(
+        cls,
+        filepath: str,
+        columns: List[str] = None,
+        filters: list = None,
+        batch_size: int = None,
+        **kwargs,
+    ) -> pd.DataFrame:
         """Read the pyarrow table, then convert to pandas."""
-        table = pa.parquet.read_table(filepath, memory_map=True)
+        table = cls._dataset(filepath).to_table(
+            columns=columns,
+            filter=cls.expression(filters),
+            batch_size=batch_size or cls.batch_size,
+        )
         return table.to_pandas()
 
     @classmethod
-    def _write(cls, filepath: str, data: pd.DataFrame, **kwargs) -> None:
+    def _iter_batches(
+        cls,
+        filepath: str,
+        batch_size: int = None,
+        columns: List[str] = None,
+        filters: list = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        batches = cls._dataset(filepath).to_batches(
+            columns=columns,
+            filter=cls.expression(filters),
+            batch_size=batch_size or cls.batch_size,
+        )
+        for batch in batches:
+            if batch.num_rows > 0:
+                yield batch.to_pandas()
+
+    @staticmethod
+    def _dataset(filepath: str) -> ds.Dataset:
+        return ds.dataset(filepath, format="parquet")
+
+    @classmethod
+    def expression(cls, filters: list) -> Union[ds.Expression, None]:
+        """Converts filters into a pyarrow expression, or None if there are no filters.
+
+        Args:
+            filters (list): (column, op, value) tuples, combined conjunctively, or a list of
+                such lists, combined disjunctively. The op is one of '==', '!=', '<', '<=',
+                '>', '>=', 'in' and 'not in'.
+        """
+        if not filters:
+            return None
+        try:
+            return pq.filters_to_expression(filters)
+        except (TypeError, ValueError) as e:
+            msg = f"Filters {filters} are not valid. {e}"
+            cls._logger.error(msg)
+            raise ValueError(msg)
+
+    @classmethod
+    def _write(
+        cls,
+        filepath: str,
+        data: pd.DataFrame,
+        compression: str = "snappy",
+        compression_level: int = None,
+        **kwargs,
+    ) -> None:
         """Converts Pandas DataFrame to a pyarrow table, then persists."""
+        codec = cls._codec(compression, compression_level)
         table = pa.Table.from_pandas(data)
-        pq.write_table(table, filepath)
+        pq.write_table(
+            table,
+            filepath,
+            compression="none" if codec is None else codec.name,
+            compression_level=compression_level,
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       ARROW IPC                                                  #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class ArrowIO(IO):  # pragma: no cover
+    """Reads and writes DataFrames in the Arrow IPC file format, i.e. Feather version 2.
+
+    By default, files are written uncompressed, in a single record batch, so reads can map
+    the file and present its buffers without copying them. Numeric and boolean columns
+    without nulls become zero-copy pandas columns or numpy arrays, backed by the page
+    cache, which worker processes reading the same file share. Other columns are converted.
+
+    Files may instead be written with zstd or lz4 compression, for archival. Compressed
+    files are smaller, but are decompressed into memory when read.
+    """
+
+    @classmethod
+    def _read(
+        cls, filepath: str, columns: List[str] = None, output: str = "pandas", **kwargs
+    ) -> Any:
+        """Reads the file, memory-mapped.
+
+        Args:
+            filepath (str): Path to the file.
+            columns (list): Optional columns to read. Default is all columns.
+            output (str): One of 'pandas', 'numpy', for a dictionary of arrays keyed by
+                column, or 'arrow' for the pyarrow Table. Default = 'pandas'
+        """
+        with pa.memory_map(filepath, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        if output == "arrow":
+            return table
+        elif output == "numpy":
+            return {
+                name: column.to_numpy() for name, column in zip(table.column_names, table.columns)
+            }
+        elif output == "pandas":
+            return table.to_pandas(split_blocks=True)
+        msg = f"Output {output} is not supported. Valid values are 'pandas', 'numpy' and 'arrow'."
+        cls._logger.error(msg)
+        raise ValueError(msg)
+
+    @classmethod
+    def _write(
+        cls,
+        filepath: str,
+        data: Union[pd.DataFrame, pa.Table],
+        compression: str = None,
+        compression_level: int = None,
+        **kwargs,
+    ) -> None:
+        options = pa.ipc.IpcWriteOptions(compression=cls._codec(compression, compression_level))
+        table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data)
+        table = table.combine_chunks()
+        with pa.OSFile(filepath, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         SPARSE                                                   #
+# ------------------------------------------------------------------------------------------------ #
+
+
+class SparseIO(IO):  # pragma: no cover
+    """Reads and writes scipy sparse matrices in the .npz format.
+
+    Matrices are compressed by default, for archival. Uncompressed archives are larger, but
+    are faster to write and to load.
+    """
+
+    @classmethod
+    def _read(cls, filepath: str, **kwargs) -> sp.spmatrix:
+        return sp.load_npz(filepath)
+
+    @classmethod
+    def _write(cls, filepath: str, data: sp.spmatrix, compressed: bool = True, **kwargs) -> None:
+        sp.save_npz(filepath, data, compressed=compressed)
+
+
+class SparseArrayIO(IO):  # pragma: no cover
+    """Reads and writes scipy sparse matrices as a directory of raw .npy arrays.
+
+    The directory holds the component arrays of the matrix, i.e. data, indices and indptr
+    for csr and csc matrices, or data, row and col for coo matrices, along with a
+    format.json file recording the format and shape. With mmap_mode, the arrays are
+    memory-mapped on read, so the matrix is available without reading it into memory, and
+    processes loading the same matrix share its pages.
+    """
+
+    __arrays = {
+        "csr": ("data", "indices", "indptr"),
+        "csc": ("data", "indices", "indptr"),
+        "coo": ("data", "row", "col"),
+    }
+
+    @classmethod
+    def _read(cls, filepath: str, mmap_mode: str = "r", **kwargs) -> sp.spmatrix:
+        with open(os.path.join(filepath, "format.json"), "r") as f:
+            meta = json.load(f)
+        arrays = [
+            np.load(os.path.join(filepath, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in cls.__arrays[meta["format"]]
+        ]
+        shape = tuple(meta["shape"])
+        if meta["format"] == "coo":
+            return sp.coo_matrix((arrays[0], (arrays[1], arrays[2])), shape=shape, copy=False)
+        matrix = sp.csr_matrix if meta["format"] == "csr" else sp.csc_matrix
+        return matrix(tuple(arrays), shape=shape, copy=False)
+
+    @classmethod
+    def _write(cls, filepath: str, data: sp.spmatrix, **kwargs) -> None:
+        if data.format not in cls.__arrays:
+            data = data.tocsr()
+        os.makedirs(filepath, exist_ok=True)
+        for name in cls.__arrays[data.format]:
+            np.save(os.path.join(filepath, f"{name}.npy"), getattr(data, name))
+        with open(os.path.join(filepath, "format.json"), "w") as f:
+            json.dump({"format": data.format, "shape": list(data.shape)}, f)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   WRITE BEHIND QUEUE                                             #
+# ------------------------------------------------------------------------------------------------ #
+class WriteBehindQueue:
+    """Persists data on a background thread, so the caller need not wait for the write.
+
+    Writes are performed in the order they were queued. The queue holds at most max_pending
+    items, so a producer faster than the disk blocks rather than accumulating unwritten
+    data in memory. The data must not be modified once queued. Errors are logged as they
+    occur and the first is raised by the next flush, which waits for all queued writes.
+
+    Args:
+        max_pending (int): Maximum number of writes queued. Default = 8
+    """
+
+    def __init__(self, max_pending: int = 8) -> None:
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._errors = []
+        self._logger = logging.getLogger(
+            f"{self.__module__}.{self.__class__.__name__}",
+        )
+        self._thread = threading.Thread(target=self._run, name="write_behind", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """The number of writes queued or in progress."""
+        return self._queue.unfinished_tasks
+
+    def put(self, filepath: str, data: Any, **kwargs) -> None:
+        """Queues the data to be written to the filepath."""
+        self._queue.put((filepath, data, kwargs))
+
+    def flush(self) -> None:
+        """Waits for all queued writes to complete, then raises the first error, if any."""
+        self._queue.join()
+        if self._errors:
+            error = self._errors[0]
+            self._errors.clear()
+            raise error
+
+    def _run(self) -> None:
+        while True:
+            filepath, data, kwargs = self._queue.get()
+            try:
+                IOService.write(filepath=filepath, data=data, **kwargs)
+            except Exception as e:
+                self._logger.error(f"Write behind to {filepath} failed: {e}")
+                self._errors.append(e)
+            finally:
+                del data
+                self._queue.task_done()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -235,7 +880,7 @@ class ParquetIO(IO):  # pragma: no cover
 class IOService:  # pragma: no cover
 
     __io = {
-        "dat": CSVIO,
+        "dat": DatIO,
         "csv": CSVIO,
         "yaml": YamlIO,
         "yml": YamlIO,
@@ -244,10 +889,16 @@ class IOService:  # pragma: no cover
         "xlsx": ExcelIO,
         "xls": ExcelIO,
         "parquet": ParquetIO,
+        "arrow": ArrowIO,
+        "feather": ArrowIO,
+        "npz": SparseIO,
+        "sparse": SparseArrayIO,
     }
     _logger = logging.getLogger(
         f"{__module__}.{__name__}",
     )
+    _queue = None
+    _lock = threading.Lock()
 
     @classmethod
     def read(cls, filepath: str, **kwargs) -> Any:
@@ -255,10 +906,100 @@ class IOService:  # pragma: no cover
         return io.read(filepath, **kwargs)
 
     @classmethod
-    def write(cls, filepath: str, data: Any, **kwargs) -> None:
+    def iter_batches(cls, filepath: str, batch_size: int = None, **kwargs) -> Iterator[Any]:
+        """Yields the contents of a file in batches of at most batch_size rows.
+
+        Args:
+            filepath (str): Path to the file.
+            batch_size (int): Maximum number of rows per batch. Defaults to the IO class default.
+            kwargs (dict): Further options, such as columns and filters for Parquet files.
+        """
+        io = cls._get_io(filepath)
+        return io.iter_batches(filepath, batch_size=batch_size, **kwargs)
+
+    @classmethod
+    def read_many(cls, filepaths: List[str], max_workers: int = None, **kwargs) -> List[Any]:
+        """Reads several files concurrently, returning their contents in the order given.
+
+        The files are read on a thread pool. The parquet, arrow, numpy and compression
+        routines release the GIL, so the reads overlap. If any read fails, reads not yet
+        started are cancelled and the error of the first failed file is raised.
+
+        Args:
+            filepaths (list): Paths to the files.
+            max_workers (int): Maximum number of concurrent reads. Defaults to one per file,
+                up to 32.
+            kwargs (dict): Keyword arguments passed to each read.
+        """
+        return cls._run_many(
+            [(cls.read, (filepath,), kwargs) for filepath in filepaths], max_workers
+        )
+
+    @classmethod
+    def write_many(cls, data: dict, max_workers: int = None, **kwargs) -> None:
+        """Writes several files concurrently.
+
+        Args:
+            data (dict): The data to write, keyed by filepath.
+            max_workers (int): Maximum number of concurrent writes. Defaults to one per file,
+                up to 32.
+            kwargs (dict): Keyword arguments passed to each write.
+        """
+        cls._run_many(
+            [(cls.write, (filepath, item), kwargs) for filepath, item in data.items()],
+            max_workers,
+        )
+
+    @classmethod
+    def _run_many(cls, calls: list, max_workers: int = None) -> List[Any]:
+        """Runs (function, args, kwargs) calls on a thread pool, returning results in order."""
+        if not calls:
+            return []
+        max_workers = max_workers or min(32, len(calls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(function, *args, **kwargs) for function, args, kwargs in calls
+            ]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            for future in futures:
+                future.cancel()
+            try:
+                return [future.result() for future in futures if not future.cancelled()]
+            except Exception as e:
+                cls._logger.error(f"Concurrent IO failed: {e}")
+                raise
+
+    @classmethod
+    def write(cls, filepath: str, data: Any, background: bool = False, **kwargs) -> None:
+        """Writes the data atomically to the filepath.
+
+        Args:
+            filepath (str): Path to the file.
+            data (Any): The data to write.
+            background (bool): Whether to return once the data is queued, and write it on
+                the write behind thread. Call flush to wait for queued writes. Default = False
+            kwargs (dict): Keyword arguments for the IO class.
+        """
         io = cls._get_io(filepath)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        io.write(filepath=filepath, data=data, **kwargs)
+        if background:
+            cls._write_behind().put(filepath, data, **kwargs)
+        else:
+            io.write(filepath=filepath, data=data, **kwargs)
+
+    @classmethod
+    def flush(cls) -> None:
+        """Waits for all writes queued with background=True, raising the first error."""
+        if cls._queue is not None:
+            cls._queue.flush()
+
+    @classmethod
+    def _write_behind(cls) -> WriteBehindQueue:
+        with cls._lock:
+            if cls._queue is None:
+                cls._queue = WriteBehindQueue()
+                # Queued writes are completed before the interpreter exits.
+                atexit.register(cls._queue.flush)
+        return cls._queue
 
     @classmethod
     def _get_io(cls, filepath: str) -> IO:
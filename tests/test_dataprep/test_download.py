@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_download.py                                               #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:47:51 am                                                #
+# Modified   : Monday October 19th 2026 01:42:37 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+import hashlib
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import pytest
+import logging
+
+import requests
+
+from recsys.dataprep.download import DownloadOperator
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+PAYLOAD = os.urandom(1 << 20)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves PAYLOAD with ETag and range support. Drops the first ranged GET midway."""
+
+    etag = '"v1"'
+    requests = []
+    dropped = False
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        rng = self.headers.get("Range")
+        RangeHandler.requests.append(rng)
+        start, end = 0, len(PAYLOAD) - 1
+        if rng:
+            first, last = rng.split("=")[1].split("-")
+            start, end = int(first), int(last)
+        body = PAYLOAD[start : end + 1]
+        self.send_response(206 if rng else 200)
+        self.send_header("Content-Length", str(len(body)))
+        if rng:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        if rng and not RangeHandler.dropped:
+            RangeHandler.dropped = True
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+class IgnoreRangeHandler(RangeHandler):
+    """Advertises range support, but answers every GET with the whole PAYLOAD."""
+
+    requests = []
+
+    def do_GET(self) -> None:
+        IgnoreRangeHandler.requests.append(self.headers.get("Range"))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+
+class NoLengthHandler(RangeHandler):
+    """Reports neither the length nor range support of PAYLOAD."""
+
+    requests = []
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+
+    def do_GET(self) -> None:
+        NoLengthHandler.requests.append(self.headers.get("Range"))
+        self.send_response(200)
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+        self.close_connection = True
+
+
+def _serve(handler):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/ml.zip"
+    httpd.shutdown()
+
+
+@pytest.fixture(scope="module")
+def server():
+    yield from _serve(RangeHandler)
+
+
+@pytest.fixture(scope="module")
+def ignore_range_server():
+    yield from _serve(IgnoreRangeHandler)
+
+
+@pytest.fixture(scope="module")
+def no_length_server():
+    yield from _serve(NoLengthHandler)
+
+
+@pytest.mark.dataprep
+@pytest.mark.download
+class TestDownload:  # pragma: no cover
+    # ============================================================================================ #
+    def test_download(self, server, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        destination = os.path.join(tmp_path, "ml.zip")
+        checksum = f"sha256:{hashlib.sha256(PAYLOAD).hexdigest()}"
+        operator = DownloadOperator(
+            source=server,
+            destination=destination,
+            chunk_size=65536,
+            n_connections=4,
+            checksum=checksum,
+        )
+        operator()
+        with open(destination, "rb") as f:
+            assert f.read() == PAYLOAD
+        assert RangeHandler.dropped
+        # Four ranges plus one resumed request for the dropped range.
+        assert len(RangeHandler.requests) == 5
+        assert not os.path.exists(f"{destination}.part")
+        assert not os.path.exists(f"{destination}.part.json")
+
+        # Unchanged remote: skipped without a GET.
+        operator()
+        assert len(RangeHandler.requests) == 5
+
+        # Changed ETag: downloaded again.
+        RangeHandler.etag = '"v2"'
+        operator()
+        assert len(RangeHandler.requests) == 9
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_checksum(self, server, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        destination = os.path.join(tmp_path, "ml.zip")
+        operator = DownloadOperator(
+            source=server, destination=destination, checksum=f"md5:{'0' * 32}"
+        )
+        with pytest.raises(ValueError):
+            operator()
+        assert not os.path.exists(destination)
+        assert not os.path.exists(f"{destination}.part")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_ignored_range(self, ignore_range_server, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        destination = os.path.join(tmp_path, "ml.zip")
+        operator = DownloadOperator(
+            source=ignore_range_server,
+            destination=destination,
+            chunk_size=65536,
+            n_connections=4,
+            checksum=f"sha256:{hashlib.sha256(PAYLOAD).hexdigest()}",
+        )
+        operator()
+        with open(destination, "rb") as f:
+            assert f.read() == PAYLOAD
+        # The full bodies answering the range requests are discarded for one plain GET.
+        assert IgnoreRangeHandler.requests[-1] is None
+        assert len(IgnoreRangeHandler.requests) == 5
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_offline(self, no_length_server, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        destination = os.path.join(tmp_path, "ml.zip")
+        DownloadOperator(source=no_length_server, destination=destination)()
+        with open(destination, "rb") as f:
+            assert f.read() == PAYLOAD
+        assert len(NoLengthHandler.requests) == 1
+
+        # Without a reported length, the local file is used rather than downloaded again.
+        DownloadOperator(source=no_length_server, destination=destination)()
+        assert len(NoLengthHandler.requests) == 1
+
+        # An unreachable server falls back to the local file, unless there is none.
+        unreachable = "http://127.0.0.1:9/ml.zip"
+        DownloadOperator(source=unreachable, destination=destination, timeout=5)()
+        assert os.path.getsize(destination) == len(PAYLOAD)
+        with pytest.raises(requests.ConnectionError):
+            DownloadOperator(
+                source=unreachable, destination=os.path.join(tmp_path, "other.zip"), timeout=5
+            )()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
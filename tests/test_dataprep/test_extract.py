@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_extract.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:49:47 am                                                #
+# Modified   : Monday October 19th 2026 01:41:38 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+from zipfile import ZipFile, ZIP_DEFLATED
+import pytest
+import logging
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from recsys.dataprep.extract import ZipExtractOperator
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+COLUMNS = ["userId", "movieId", "rating", "timestamp"]
+TYPES = {"userId": "int32", "movieId": "int32", "rating": "float32", "timestamp": "int64"}
+
+
+@pytest.fixture
+def archive(dataframe, tmp_path):
+    filepath = os.path.join(tmp_path, "ml.zip")
+    with ZipFile(filepath, mode="w", compression=ZIP_DEFLATED) as zip:
+        zip.writestr("ml/ratings.csv", dataframe[COLUMNS].to_csv(index=False))
+        zip.writestr("ml/tags.csv", dataframe[COLUMNS[:2]].to_csv(index=False))
+        zip.writestr("ml/README.txt", "MovieLens test archive.")
+        zip.writestr("ml/movies.dat", "1::Toy Story (1995)::Animation\n")
+    return filepath
+
+
+@pytest.mark.dataprep
+@pytest.mark.extract
+class TestZipExtract:  # pragma: no cover
+    # ============================================================================================ #
+    def test_extract(self, archive, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        destination = os.path.join(tmp_path, "raw")
+        ZipExtractOperator(source=archive, destination=destination)()
+        assert sorted(os.listdir(destination)) == [
+            "README.txt",
+            "movies.dat",
+            "ratings.csv",
+            "tags.csv",
+        ]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_to_parquet(self, archive, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        destination = os.path.join(tmp_path, "raw")
+        operator = ZipExtractOperator(
+            source=archive,
+            destination=destination,
+            member="ratings.csv",
+            to_parquet=True,
+            column_types=TYPES,
+            block_size=65536,
+        )
+        operator()
+        assert os.listdir(destination) == ["ratings.parquet"]
+
+        filepath = os.path.join(destination, "ratings.parquet")
+        metadata = pq.ParquetFile(filepath).metadata
+        assert metadata.num_row_groups > 1
+        assert metadata.num_rows == dataframe.shape[0]
+
+        data = pd.read_parquet(filepath)
+        assert {column: str(dtype) for column, dtype in data.dtypes.items()} == TYPES
+        pd.testing.assert_frame_equal(
+            data, dataframe[COLUMNS].astype(TYPES).reset_index(drop=True), check_dtype=True
+        )
+
+        # An earlier extract of the CSV member does not prevent its conversion.
+        legacy = os.path.join(tmp_path, "legacy")
+        ZipExtractOperator(source=archive, destination=legacy, member="ratings.csv")()
+        ZipExtractOperator(
+            source=archive, destination=legacy, member="ratings.csv", to_parquet=True
+        )()
+        assert sorted(os.listdir(legacy)) == ["ratings.csv", "ratings.parquet"]
+
+        # Only the delimited members are converted, and no temporary files remain.
+        destination = os.path.join(tmp_path, "all")
+        ZipExtractOperator(source=archive, destination=destination, to_parquet=True)()
+        assert sorted(os.listdir(destination)) == [
+            "README.txt",
+            "movies.dat",
+            "ratings.parquet",
+            "tags.parquet",
+        ]
+
+        with pytest.raises(ValueError):
+            ZipExtractOperator(source=archive, destination=destination, to_parquet=True, sep="::")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_filter.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:26:20 am                                                #
+# Modified   : Monday October 19th 2026 01:47:43 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import time
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.filter import (
+    KCoreFilter,
+    MaxItemsPerUserFilter,
+    MaxUsersPerItemFilter,
+    MinUsersPerItemFilter,
+)
+from recsys.dataset.parquet import ParquetDataset
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def heavy_users(n_users: int = 4, n_interactions: int = 600, seed: int = 0) -> pd.DataFrame:
+    """Creates interactions for a few users with long histories."""
+    rng = np.random.default_rng(seed)
+    n = n_users * n_interactions
+    return pd.DataFrame(
+        {
+            "userId": np.repeat(np.arange(n_users), n_interactions),
+            "movieId": rng.integers(0, 100000, n),
+            "rating": rng.integers(1, 6, n).astype(float),
+            "timestamp": rng.integers(0, 10**9, n),
+        }
+    )
+
+
+def loop_filter(data: pd.DataFrame, k: int, by: str = "userId") -> pd.DataFrame:
+    """The row at a time eviction loop previously used by the max interaction filters."""
+    data = data.copy()
+    data["interactions"] = (
+        data.sort_values(by="timestamp", ascending=True).groupby(by=by).cumcount() + 1
+    )
+    pending = data[data["interactions"] > k]
+    data = data[data["interactions"] <= k]
+    groups = pending.sort_values(by=["timestamp"], ascending=True).groupby(by=by)
+    for name, ratings in groups:
+        for _, row in ratings.iterrows():
+            row = row.to_frame()
+            eviction = data[data[by] == name].sample(n=1, replace=False, axis=0)
+            data = data.drop(eviction.index.values)
+            data = pd.concat([data, row.T], axis=0)
+    return data.drop(columns=["interactions"])
+
+
+def naive_k_core(data: pd.DataFrame, k_user: int, k_item: int) -> pd.DataFrame:
+    """Reference k-core: alternates groupby filters until no rows are removed."""
+    while True:
+        n = data.shape[0]
+        pairs = data.drop_duplicates(subset=["userId", "movieId"])
+        users = pairs["userId"].value_counts()
+        data = data[data["userId"].isin(users[users >= k_user].index)]
+        pairs = data.drop_duplicates(subset=["userId", "movieId"])
+        items = pairs["movieId"].value_counts()
+        data = data[data["movieId"].isin(items[items >= k_item].index)]
+        if data.shape[0] == n:
+            return data
+
+
+@pytest.mark.dataprep
+@pytest.mark.filter
+class TestMaxFilters:  # pragma: no cover
+    # ============================================================================================ #
+    def test_max_items_per_user(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        k = 5
+        data = MaxItemsPerUserFilter(max_items_per_user=k, seed=55)(dataframe)
+        before = dataframe["userId"].value_counts()
+        after = data["userId"].value_counts()
+        assert after.max() <= k
+        assert after.equals(np.minimum(before, k).loc[after.index])
+        assert data.shape[0] == np.minimum(before, k).sum()
+        assert "interactions" not in dataframe.columns
+
+        # Seeded sampling is reproducible.
+        again = MaxItemsPerUserFilter(max_items_per_user=k, seed=55)(dataframe)
+        assert data.index.equals(again.index)
+
+        data = MaxUsersPerItemFilter(max_users_per_item=k, seed=55)(dataframe)
+        assert data["movieId"].value_counts().max() <= k
+        assert data.shape[0] == np.minimum(dataframe["movieId"].value_counts(), k).sum()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_uniform(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Each of a user's 10 interactions should be retained with probability 3/10.
+        data = heavy_users(n_users=1, n_interactions=10)
+        counts = np.zeros(10)
+        for seed in range(2000):
+            keep = MaxItemsPerUserFilter(max_items_per_user=3, seed=seed)(data)
+            counts[keep.index.values] += 1
+        assert np.allclose(counts / 2000, 0.3, atol=0.05)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.benchmark
+    def test_benchmark(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = heavy_users()
+        k = 200
+
+        begin = time.perf_counter()
+        expected = loop_filter(data, k=k)
+        loop_duration = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        result = MaxItemsPerUserFilter(max_items_per_user=k, seed=0)(data)
+        vectorized_duration = time.perf_counter() - begin
+
+        logger.info(
+            f"\nReservoir sampling {data.shape[0]} interactions to {k} per user. "
+            f"Loop: {round(loop_duration, 3)}s. Vectorized: {round(vectorized_duration, 4)}s. "
+            f"Speedup: {round(loop_duration / vectorized_duration)}x"
+        )
+        assert result.shape[0] == expected.shape[0]
+        assert vectorized_duration < loop_duration
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.dataprep
+@pytest.mark.filter
+class TestKCoreFilter:  # pragma: no cover
+    # ============================================================================================ #
+    def test_k_core(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = dataframe[["userId", "movieId", "rating", "timestamp"]]
+        filter = KCoreFilter(min_items_per_user=5, min_users_per_item=5)
+        result = filter(data)
+        expected = naive_k_core(data, k_user=5, k_item=5)
+        assert filter.iterations > 1
+        assert result.shape[0] < data.shape[0]
+        assert np.array_equal(np.sort(result.index.values), np.sort(expected.index.values))
+
+        pairs = result.drop_duplicates(subset=["userId", "movieId"])
+        assert pairs["userId"].value_counts().min() >= 5
+        assert pairs["movieId"].value_counts().min() >= 5
+
+        # A single pass of the min users filter selects items, not users, with enough users.
+        items = data.drop_duplicates(subset=["userId", "movieId"])["movieId"].value_counts()
+        single = MinUsersPerItemFilter(min_users_per_item=5)(data)
+        assert set(single["movieId"]) == set(items[items >= 5].index)
+        assert single.shape[0] == data["movieId"].isin(items[items >= 5].index).sum()
+
+        filepath = tmp_path / "ratings.parquet"
+        data.to_parquet(filepath, index=False)
+        lazy = filter(ParquetDataset(name="test_k_core", desc="Test K-Core", path=str(filepath)))
+        assert lazy.shape[0] == result.shape[0]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
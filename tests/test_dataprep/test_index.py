@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_index.py                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:24:24 am                                                #
+# Modified   : Monday October 19th 2026 12:24:24 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+
+from recsys.dataprep.index import IdMap, IndexSequenceOperator, decode, encode
+from recsys.services.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.dataprep
+@pytest.mark.index
+class TestIndexSequenceOperator:  # pragma: no cover
+    # ============================================================================================ #
+    def test_reindex(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "idmap.pkl")
+        operator = IndexSequenceOperator(idmap_filepath=filepath)
+        data = operator(dataframe)
+        assert "useridx" not in dataframe.columns
+        assert data["useridx"].max() == dataframe["userId"].nunique() - 1
+        assert data["itemidx"].max() == dataframe["movieId"].nunique() - 1
+
+        # Indices are assigned in sorted id order.
+        users = np.sort(dataframe["userId"].unique())
+        assert np.array_equal(users[data["useridx"].values], data["userId"].values)
+
+        idmap = IOService.read(filepath)
+        assert isinstance(idmap, IdMap)
+        assert idmap.filepath == filepath
+        assert np.array_equal(idmap.encode_users(data["userId"].values), data["useridx"].values)
+        assert np.array_equal(idmap.decode_items(data["itemidx"].values), data["movieId"].values)
+
+        assert operator(data) is data
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_encode_decode(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        vocabulary = np.array([2, 5, 11, 40])
+        assert np.array_equal(encode([40, 2, 3, 99, 1], vocabulary), [3, 0, -1, -1, -1])
+        assert np.array_equal(decode([1, 2], vocabulary), [5, 11])
+        assert np.array_equal(encode([1, 2], np.array([])), [-1, -1])
+        with pytest.raises(ValueError):
+            decode([-1], vocabulary)
+        with pytest.raises(ValueError):
+            decode([4], vocabulary)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
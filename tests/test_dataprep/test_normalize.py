@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_normalize.py                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:36:58 am                                                #
+# Modified   : Monday October 19th 2026 01:22:49 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+
+from recsys.dataprep.normalize import NormalizeOperator
+from recsys.dataset.movielens import MovieLens
+from recsys.services.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.dataprep
+@pytest.mark.normalize
+class TestNormalizeOperator:  # pragma: no cover
+    # ============================================================================================ #
+    def test_mean_zscore(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        grouped = dataframe.groupby("userId")["rating"]
+        normalizer = NormalizeOperator(by="userId", scheme="mean", epsilon=0)
+        data = normalizer(dataframe)
+        assert np.array_equal(data["userId"].values, dataframe["userId"].values)
+        assert np.allclose(data["rating_cu"], dataframe["rating"] - grouped.transform("mean"))
+        # The centered ratings are those read by MovieLens.
+        csr = MovieLens(name="test_normalize", desc="Test", data=data).to_csr(centered_by="user")
+        assert np.isclose(csr.sum(), data["rating_cu"].sum())
+
+        normalizer = NormalizeOperator(by="movieId", scheme="zscore", epsilon=0)
+        data = normalizer(dataframe)
+        grouped = dataframe.groupby("movieId")["rating"]
+        std = grouped.transform("std", ddof=0).replace(0, 1)
+        expected = (dataframe["rating"] - grouped.transform("mean")) / std
+        assert np.allclose(data["rating_zscore_movieId"], expected)
+
+        with pytest.raises(ValueError):
+            NormalizeOperator(by="userId", scheme="median")
+        with pytest.raises(ValueError):
+            NormalizeOperator(by="nonexistent")(dataframe)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_baseline_denormalize(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "stats", "baseline.pkl")
+        normalizer = NormalizeOperator(scheme="baseline", stats_filepath=filepath)
+        data = normalizer(dataframe)
+        mu = dataframe["rating"].mean()
+        item_bias = (dataframe["rating"] - mu).groupby(dataframe["movieId"]).transform("mean")
+        user_bias = (
+            (dataframe["rating"] - mu - item_bias).groupby(dataframe["userId"]).transform("mean")
+        )
+        expected = dataframe["rating"] - mu - item_bias - user_bias
+        assert np.allclose(data["rating_baseline"], expected)
+
+        # Predictions are de-normalized from the persisted stats, without the ratings.
+        stats = IOService.read(filepath)
+        assert stats.scheme == "baseline"
+        ratings = stats.denormalize(data[["userId", "movieId"]], values=data["rating_baseline"])
+        assert np.allclose(ratings, dataframe["rating"])
+
+        unseen = data[["userId", "movieId"]].head(3).assign(userId=-1, movieId=-1)
+        assert np.allclose(stats.denormalize(unseen, values=np.zeros(3)), mu)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
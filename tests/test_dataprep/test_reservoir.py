@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_reservoir.py                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:32:25 am                                                #
+# Modified   : Monday October 19th 2026 01:26:50 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.filter import IncrementalMaxItemsPerUserFilter
+from recsys.dataprep.reservoir import ReservoirState, random_rank
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.dataprep
+@pytest.mark.reservoir
+class TestReservoir:  # pragma: no cover
+    # ============================================================================================ #
+    def test_incremental_filter(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = dataframe[["userId", "movieId", "rating", "timestamp"]].sort_values("timestamp")
+        data = data.drop_duplicates(subset=["userId", "movieId"])
+        filepath = str(tmp_path / "state" / "max_items_per_user.pkl")
+
+        # Each daily load is filtered by a new operator restoring the persisted state.
+        history = data.iloc[:0]
+        for rows in np.array_split(np.arange(data.shape[0]), 3):
+            batch = data.iloc[rows]
+            filter = IncrementalMaxItemsPerUserFilter(
+                max_items_per_user=20, state_filepath=filepath, seed=55
+            )
+            admitted = filter(batch)
+            evictions = filter.evictions.set_index(["userId", "movieId"]).index
+            pairs = pd.MultiIndex.from_frame(history[["userId", "movieId"]])
+            history = pd.concat([history[~pairs.isin(evictions)], admitted])
+
+        counts = data["userId"].value_counts().sort_index()
+        retained = history["userId"].value_counts().reindex(counts.index, fill_value=0)
+        assert np.array_equal(retained.values, np.minimum(counts.values, 20))
+
+        state = filter.state
+        assert np.array_equal(state.keys, counts.index.values)
+        assert np.array_equal(state.seen, counts.values)
+        expected = history[["userId", "movieId"]].sort_values(["userId", "movieId"])
+        actual = state.to_df(key="userId", member="movieId").sort_values(["userId", "movieId"])
+        assert np.array_equal(actual.values, expected.values)
+
+        with pytest.raises(ValueError):
+            IncrementalMaxItemsPerUserFilter(max_items_per_user=10, state_filepath=filepath)(batch)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_uniform(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Ten items arriving over three loads; each should be retained with probability 3/10.
+        rng = np.random.default_rng(7)
+        batches = np.split(np.arange(10), [3, 5])
+        n_trials = 4000
+        retained = np.zeros(10)
+        for _ in range(n_trials):
+            state = ReservoirState(name="test_uniform", desc="Test Uniform", k=3)
+            for items in batches:
+                state.update(keys=np.zeros(items.shape[0]), members=items, rng=rng)
+            assert state.members(0).shape[0] == 3
+            retained[state.members(0)] += 1
+        assert np.allclose(retained / n_trials, 0.3, atol=0.035)
+
+        # Ranks stay within their group for codes beyond the precision of a float.
+        groups = np.tile(np.array([2**53 + 1, 2**53]), 3)
+        for _ in range(10):
+            rank = random_rank(groups, rng)
+            assert sorted(rank[::2]) == sorted(rank[1::2]) == [0, 1, 2]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataprep/test_split.py                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:38:44 am                                                #
+# Modified   : Monday October 19th 2026 01:45:12 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.index import IndexSequenceOperator
+from recsys.dataprep.split import TemporalSplitOperator, UserSplitOperator, grouped_rank, kfold
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.parquet import ParquetDataset
+from recsys.dataset.view import SplitView
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.dataprep
+@pytest.mark.split
+class TestTemporalSplit:  # pragma: no cover
+    # ============================================================================================ #
+    def test_parquet(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MovieLens(name="test_split", desc="Test Split", data=dataframe)
+        directory = os.path.join(tmp_path, "splits")
+        splits = TemporalSplitOperator(directory=directory)(dataset)
+        assert all(isinstance(split, ParquetDataset) for split in splits.values())
+        assert os.path.exists(os.path.join(directory, "train.parquet"))
+
+        train = splits["train"].to_df()
+        validation = splits["validation"].to_df()
+        test = splits["test"].to_df()
+        assert train.shape[0] + validation.shape[0] + test.shape[0] == dataframe.shape[0]
+        assert train["timestamp"].max() < validation["timestamp"].min()
+        assert validation["timestamp"].max() < test["timestamp"].min()
+
+        # The cut points are those of a full sort on the timestamp.
+        timestamps = np.sort(dataframe["timestamp"].values)
+        assert validation["timestamp"].min() == timestamps[int(0.8 * timestamps.shape[0])]
+
+        # Existing splits are read rather than recomputed.
+        splits = TemporalSplitOperator(directory=directory)(dataset)
+        assert splits["test"].nrows == test.shape[0]
+        # Loaded splits retain the matrix shape of the parent.
+        assert splits["test"].load().matrix_shape == dataset.matrix_shape
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_index(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MovieLens(name="test_split", desc="Test Split", data=dataframe)
+        directory = os.path.join(tmp_path, "splits")
+        splits = TemporalSplitOperator(
+            directory=directory, train_size=0.9, validation_size=0.0, test_size=0.1, output="index"
+        )(dataset)
+        assert set(splits.keys()) == {"train", "test"}
+
+        assert all(isinstance(split, SplitView) for split in splits.values())
+        rows = np.sort(np.concatenate([splits["train"].rows, splits["test"].rows]))
+        assert np.array_equal(rows, np.arange(dataframe.shape[0]))
+        timestamps = dataframe["timestamp"].values
+        assert timestamps[splits["train"].rows].max() < timestamps[splits["test"].rows].min()
+
+        persisted = TemporalSplitOperator(directory=directory, output="index")(dataset)
+        assert persisted["test"].parent is dataset
+        assert np.array_equal(persisted["test"].rows, splits["test"].rows)
+        assert persisted["test"].load().matrix_shape == dataset.matrix_shape
+
+        with pytest.raises(ValueError):
+            TemporalSplitOperator(directory=directory, output="csv")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.dataprep
+@pytest.mark.split
+class TestUserSplit:  # pragma: no cover
+    # ============================================================================================ #
+    def test_grouped_rank(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rank, count = grouped_rank(
+            groups=dataframe["userId"].values, values=dataframe["timestamp"].values
+        )
+        grouped = dataframe.groupby("userId")["timestamp"]
+        assert np.array_equal(count, grouped.transform("size").values)
+        assert np.all(rank >= grouped.rank(method="min").values - 1)
+        assert np.all(rank <= grouped.rank(method="max").values - 1)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_leave_last(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MovieLens(name="test_user_split", desc="Test User Split", data=dataframe)
+        splits = UserSplitOperator(
+            directory=os.path.join(tmp_path, "splits"), n_test=2, n_validation=1, output="index"
+        )(dataset)
+
+        counts = dataframe["userId"].value_counts()
+        eligible = counts[counts > 3].index
+        test = splits["test"].to_df()
+        validation = splits["validation"].to_df()
+        train = splits["train"].to_df()
+        assert (test["userId"].value_counts().reindex(eligible) == 2).all()
+        assert (validation["userId"].value_counts().reindex(eligible) == 1).all()
+        assert set(train["userId"]) == set(dataframe["userId"])
+        assert train.shape[0] + validation.shape[0] + test.shape[0] == dataframe.shape[0]
+
+        # Held out interactions are no earlier than the training interactions of the user.
+        last_train = train.groupby("userId")["timestamp"].max()
+        assert (validation["timestamp"].values >= last_train[validation["userId"]].values).all()
+        first_test = test.groupby("userId")["timestamp"].min()
+        last_validation = validation.groupby("userId")["timestamp"].max()
+        assert (first_test[eligible] >= last_validation[eligible]).all()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_fraction(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MovieLens(name="test_user_split", desc="Test User Split", data=dataframe)
+        splits = UserSplitOperator(
+            directory=os.path.join(tmp_path, "splits"),
+            strategy="fraction",
+            train_size=0.75,
+            test_size=0.25,
+        )(dataset)
+        assert set(splits.keys()) == {"train", "test"}
+
+        counts = dataframe["userId"].value_counts()
+        train = splits["train"].to_df()["userId"].value_counts().reindex(counts.index)
+        assert np.array_equal(train.values, np.ceil(0.75 * counts.values))
+
+        # Exact sizes where the floating point products overshoot the integer cut points.
+        data = pd.DataFrame(
+            {
+                "userId": np.ones(100, dtype=int),
+                "movieId": np.arange(100),
+                "timestamp": np.arange(100),
+            }
+        )
+        splits = UserSplitOperator(
+            directory=os.path.join(tmp_path, "exact"),
+            strategy="fraction",
+            train_size=0.8,
+            validation_size=0.05,
+            test_size=0.15,
+        )(MovieLens(name="test_user_split_exact", desc="Test User Split", data=data))
+        assert {name: split.nrows for name, split in splits.items()} == {
+            "train": 80,
+            "validation": 5,
+            "test": 15,
+        }
+
+        with pytest.raises(ValueError):
+            UserSplitOperator(directory=str(tmp_path), strategy="fraction", train_size=0.5)
+        with pytest.raises(ValueError):
+            UserSplitOperator(directory=str(tmp_path), strategy="random")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.dataprep
+@pytest.mark.split
+class TestKFold:  # pragma: no cover
+    # ============================================================================================ #
+    def test_kfold(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = IndexSequenceOperator()(dataframe)
+        dataset = MovieLens(name="test_kfold", desc="Test KFold", data=data)
+        full = dataset.to_csr()
+
+        folds = np.zeros(dataframe.shape[0], dtype=int)
+        for train, test in kfold(dataset, n_folds=5, seed=11):
+            assert train.nrows + test.nrows == dataset.nrows
+            assert abs(test.nrows - dataset.nrows / 5) <= 1
+            folds += test.rows
+
+            # Views share the coordinates of the parent, so their matrices sum to the whole.
+            csr = train.to_csr()
+            assert csr.shape == full.shape
+            assert abs(csr + test.to_csr() - full).sum() < 1e-6
+            assert test.to_df().shape[0] == test.nrows
+        assert (folds == 1).all()
+
+        with pytest.raises(ValueError):
+            next(kfold(dataset, n_folds=1))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
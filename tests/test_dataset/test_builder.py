@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataset/test_builder.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:21:15 am                                                #
+# Modified   : Monday October 19th 2026 12:24:27 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+
+from recsys.dataset.builder import MovieLensBuilder
+from recsys.dataset.movielens import MovieLens
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.dataset
+@pytest.mark.builder
+class TestMovieLensBuilder:  # pragma: no cover
+    # ============================================================================================ #
+    def test_build(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "ratings.csv")
+        dataframe[["userId", "movieId", "rating", "timestamp"]].to_csv(filepath, index=False)
+
+        builder = MovieLensBuilder(name="test_builder", desc="Test Builder", chunksize=1000)
+        dataset = builder.read(filepath).build()
+        assert isinstance(dataset, MovieLens)
+        assert builder.nrows == 0
+
+        data = dataset.to_df()
+        assert data.shape[0] == dataframe.shape[0]
+        assert np.array_equal(data["userId"].values, dataframe["userId"].values)
+        assert np.array_equal(data["movieId"].values, dataframe["movieId"].values)
+        assert np.array_equal(dataset.users, np.sort(dataframe["userId"].unique()))
+        assert np.array_equal(dataset.users[data["useridx"].values], data["userId"].values)
+        assert np.array_equal(dataset.items[data["itemidx"].values], data["movieId"].values)
+
+        idmap = builder.idmap
+        assert np.array_equal(idmap.encode_users(data["userId"].values), data["useridx"].values)
+        assert np.array_equal(idmap.decode_items(data["itemidx"].values), data["movieId"].values)
+
+        counts = dataframe["userId"].value_counts().sort_index()
+        assert np.array_equal(dataset.profile.user_degree, counts.values)
+
+        csr = dataset.to_csr()
+        assert csr.shape == (dataset.n_users, dataset.n_items)
+        assert np.isclose(csr.sum(), dataframe["rating"].sum(), rtol=1e-5)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_build_dat(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "ratings.dat")
+        names = ["userId", "movieId", "rating", "timestamp"]
+        lines = dataframe[names].astype(str).agg("::".join, axis=1)
+        with open(filepath, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+        builder = MovieLensBuilder(name="test_builder_dat", desc="Test Builder", chunksize=5000)
+        builder.read(filepath, sep="::", header=None, names=names)
+        stats = builder.stats
+        assert stats["nrows"] == dataframe.shape[0]
+        assert stats["timestamp_max"] == dataframe["timestamp"].max()
+        assert np.isclose(stats["rating_mean"], dataframe["rating"].mean())
+        dataset = builder.build()
+        assert dataset.n_items == dataframe["movieId"].nunique()
+
+        with pytest.raises(RuntimeError):
+            builder.build()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataset/test_parquet.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:23:22 am                                                #
+# Modified   : Monday October 19th 2026 01:29:49 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from recsys.dataset.parquet import ParquetDataset
+from recsys.dataset.movielens import MovieLens
+from recsys.dataprep.filter import MinItemsPerUserFilter
+from recsys.dataprep.split import TemporalSplitOperator
+from recsys.services.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+@pytest.fixture(scope="function")
+def parquet_filepath(dataframe, tmp_path):
+    filepath = os.path.join(tmp_path, "ratings.parquet")
+    data = dataframe.sort_values(by="timestamp").reset_index(drop=True)
+    pq.write_table(pa.Table.from_pandas(data, preserve_index=False), filepath, row_group_size=1000)
+    return filepath
+
+
+@pytest.mark.dataset
+@pytest.mark.parquet
+class TestParquetDataset:  # pragma: no cover
+    # ============================================================================================ #
+    def test_select(self, dataframe, parquet_filepath, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = ParquetDataset(name="test_parquet", desc="Test Parquet", path=parquet_filepath)
+        assert dataset.nrows == dataframe.shape[0]
+        assert list(dataset.columns) == list(dataframe.columns)
+        assert dataset.n_users == dataframe["userId"].nunique()
+
+        lo, hi = dataframe["userId"].quantile([0.25, 0.75]).astype(int)
+        t0 = int(dataframe["timestamp"].median())
+        selection = dataset.select(
+            columns=["userId", "rating"], users=(lo, hi), timestamps=(t0, None)
+        )
+        expected = dataframe[
+            (dataframe["userId"] >= lo)
+            & (dataframe["userId"] < hi)
+            & (dataframe["timestamp"] >= t0)
+        ]
+        data = selection.to_df()
+        assert list(data.columns) == ["userId", "rating"]
+        assert data.shape[0] == expected.shape[0] == selection.nrows
+        assert np.isclose(data["rating"].sum(), expected["rating"].sum())
+        assert dataset.nrows == dataframe.shape[0]
+
+        movielens = selection.select(columns=["userId", "movieId", "rating", "timestamp"]).load()
+        assert isinstance(movielens, MovieLens)
+        assert movielens.n_users == expected["userId"].nunique()
+
+        # The dataset and ParquetIO select the same rows for the same filters.
+        filters = [("userId", "in", [lo, hi]), ("rating", ">=", 4)]
+        pd.testing.assert_frame_equal(
+            dataset.read(filters=filters), IOService.read(parquet_filepath, filters=filters)
+        )
+
+        with pytest.raises(ValueError):
+            dataset.read(filters=[("userId", "~", 1)])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_operators(self, dataframe, parquet_filepath, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = ParquetDataset(name="test_parquet", desc="Test Parquet", path=parquet_filepath)
+
+        filtered = MinItemsPerUserFilter(min_items_per_user=5)(dataset)
+        expected = MinItemsPerUserFilter(min_items_per_user=5)(dataframe)
+        assert filtered.shape == expected.shape
+        assert (filtered["userId"].value_counts() >= 5).all()
+
+        directory = os.path.join(tmp_path, "splits")
+        splits = TemporalSplitOperator(directory=directory)(dataset)
+        assert all(isinstance(split, ParquetDataset) for split in splits.values())
+        assert sum(split.nrows for split in splits.values()) == dataframe.shape[0]
+        assert (
+            splits["train"].to_df()["timestamp"].max() < splits["test"].to_df()["timestamp"].min()
+        )
+        assert os.path.exists(os.path.join(directory, "train.pkl"))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
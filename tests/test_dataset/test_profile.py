@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataset/test_profile.py                                                 #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:19:32 am                                                #
+# Modified   : Monday October 19th 2026 12:19:32 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.profile import Profile, degrees
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.dataset
+@pytest.mark.profile
+class TestProfile:  # pragma: no cover
+    # ============================================================================================ #
+    def test_profile(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dataset = MovieLens(name="test_profile", desc="Test Profile", data=dataframe)
+        profile = dataset.profile
+        assert isinstance(profile, Profile)
+        assert dataset.profile is profile
+
+        user_counts = dataframe["userId"].value_counts().sort_index()
+        item_counts = dataframe["movieId"].value_counts().sort_index()
+        assert np.array_equal(dataset.users, user_counts.index.values)
+        assert np.array_equal(dataset.items, item_counts.index.values)
+        assert np.array_equal(profile.user_degree, user_counts.values)
+        assert np.array_equal(profile.item_degree, item_counts.values)
+        assert dataset.n_users == dataframe["userId"].nunique()
+        assert dataset.n_items == dataframe["movieId"].nunique()
+        assert dataset.nrows == dataframe.shape[0]
+
+        histogram = profile.degree_histogram(dimension="user")
+        assert histogram.sum() == dataset.n_users
+        assert np.dot(histogram, np.arange(len(histogram))) == dataset.nrows
+        quantiles = profile.degree_quantiles(dimension="item")
+        assert quantiles[0] == item_counts.min()
+        assert quantiles[-1] == item_counts.max()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_summary(self, dataset, dataset3, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        summary = dataset.summary()
+        assert isinstance(summary, pd.DataFrame)
+        assert summary is dataset.summary()
+        assert summary.loc["n_users", dataset.name] == dataset.n_users
+        assert (
+            summary.loc["max_ratings_per_user", dataset.name] == dataset.profile.user_degree.max()
+        )
+        comparison = dataset.compare(dataset3)
+        assert (comparison["% change"] == 0).all()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_degrees(self, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        dense = np.array([3, 1, 3, 7, 1, 3])
+        uniques, counts = degrees(dense)
+        assert np.array_equal(uniques, [1, 3, 7])
+        assert np.array_equal(counts, [2, 3, 1])
+
+        sparse = np.array([10**12, -5, 10**12])
+        uniques, counts = degrees(sparse)
+        assert np.array_equal(uniques, [-5, 10**12])
+        assert np.array_equal(counts, [1, 2])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
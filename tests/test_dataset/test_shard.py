@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_dataset/test_shard.py                                                   #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:25:19 am                                                #
+# Modified   : Monday October 19th 2026 01:21:50 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+
+from recsys.dataset.movielens import MovieLens
+from recsys.dataset.shard import MovieLensShard, assign, combine, map_shards, merge_profiles, shard
+from recsys.services.io import IOService
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+def get_profile(dataset: MovieLens):
+    return dataset.profile
+
+
+@pytest.mark.dataset
+@pytest.mark.shard
+class TestShard:  # pragma: no cover
+    # ============================================================================================ #
+    def test_shard(self, dataset, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        shards = shard(dataset, n_shards=4)
+        assert len(shards) == 4
+        assert all(isinstance(s, MovieLensShard) for s in shards)
+        assert sum(s.nrows for s in shards) == dataset.nrows
+        assert len(set(s.name for s in shards)) == 4
+
+        # Users are disjoint and assignment is deterministic.
+        users = np.concatenate([s.users for s in shards])
+        assert len(np.unique(users)) == len(users) == dataset.n_users
+        assert np.array_equal(assign(dataset.users, 4), assign(dataset.users, 4))
+        assert np.array_equal(
+            shards[1].to_df()["userId"], shard(dataset, n_shards=4)[1].to_df()["userId"]
+        )
+
+        # Shards share the global id space.
+        for s in shards:
+            assert s.to_csr().shape == (dataset.n_users, dataset.n_items)
+
+        profiles = map_shards(get_profile, shards, max_workers=2)
+        merged = merge_profiles(profiles)
+        assert np.array_equal(merged.users, dataset.users)
+        assert np.array_equal(merged.items, dataset.items)
+        assert np.array_equal(merged.user_degree, dataset.profile.user_degree)
+        assert np.array_equal(merged.item_degree, dataset.profile.item_degree)
+
+        combined = combine(shards, name="combined", desc="Combined Shards")
+        assert combined.nrows == dataset.nrows
+
+        # A subset retains the global coordinates of its interactions.
+        subset = combine(shards[2:], name="subset", desc="Subset of Shards")
+        assert subset.n_users < subset.matrix_shape[0]
+        assert subset.to_csr().nnz == subset.nrows
+
+        filepath = os.path.join(tmp_path, shards[0].name + ".pkl")
+        IOService.write(filepath=filepath, data=shards[0])
+        restored = IOService.read(filepath)
+        assert restored.shard == 0
+        assert restored.matrix_shape == shards[0].matrix_shape
+
+        with pytest.raises(ValueError):
+            shard(dataset, n_shards=0)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_model/test_validation.py                                                #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:45:36 am                                                #
+# Modified   : Monday October 19th 2026 01:40:07 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+
+from recsys.dataprep.index import IndexSequenceOperator
+from recsys.dataset.base import Dataset
+from recsys.dataset.movielens import MovieLens
+from recsys.model.algorithm import Algorithm
+from recsys.model.validation import CrossValidator
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ItemMean(Algorithm):
+    """Predicts the average training rating of the item, else the global average."""
+
+    def fit(self, dataset: Dataset) -> None:
+        data = dataset.to_df()
+        self._mean = data["rating"].mean()
+        self._items = data.groupby("movieId")["rating"].mean()
+        self._threads = os.environ.get("OPENBLAS_NUM_THREADS")
+
+    def predict(self, X: pd.DataFrame) -> pd.DataFrame:
+        return X["movieId"].map(self._items).fillna(self._mean).values
+
+    def score(self, X: pd.DataFrame, y: np.array) -> float:
+        assert self._threads == "1"
+        return float(np.sqrt(np.mean(np.square(self.predict(X) - y))))
+
+
+class RetainedItemMean(ItemMean):
+    """Retains the training dataset, and reads it again when scoring."""
+
+    def fit(self, dataset: Dataset) -> None:
+        super().fit(dataset)
+        self._dataset = dataset
+
+    def score(self, X: pd.DataFrame, y: np.array) -> float:
+        data = self._dataset.to_df()
+        assert data["title"].str.startswith("movie").all()
+        return super().score(X, y)
+
+
+def mae(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    return float(np.mean(np.abs(y_true - y_pred)))
+
+
+def first(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    return y_true[:1]
+
+
+@pytest.mark.model
+@pytest.mark.validation
+class TestCrossValidator:  # pragma: no cover
+    # ============================================================================================ #
+    def test_run(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = IndexSequenceOperator()(dataframe[["userId", "movieId", "rating", "timestamp"]])
+        dataset = MovieLens(name="test_cross_validation", desc="Test CV", data=data)
+        validator = CrossValidator(
+            algorithm=ItemMean(),
+            n_folds=4,
+            metrics={"mae": mae},
+            max_workers=2,
+            blas_threads=1,
+            seed=3,
+        )
+        threads = os.environ.get("OPENBLAS_NUM_THREADS")
+        results = validator.run(dataset)
+        assert list(results["fold"]) == [0, 1, 2, 3]
+        assert (results["n_train"] + results["n_test"] == dataset.nrows).all()
+        assert results["n_test"].sum() == dataset.nrows
+        assert (results["score"] > 0).all()
+        assert (results["mae"] <= results["score"]).all()
+        # The BLAS thread settings apply to the workers only.
+        assert os.environ.get("OPENBLAS_NUM_THREADS") == threads
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    @pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="requires /dev/shm")
+    def test_shared_memory(self, dataframe, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        data = IndexSequenceOperator()(dataframe[["userId", "movieId", "rating", "timestamp"]])
+        # Object columns are pickled to the workers rather than placed in shared memory.
+        data["title"] = "movie " + data["movieId"].astype(str)
+        dataset = MovieLens(name="test_shared_memory", desc="Test CV", data=data)
+        # The algorithm reads the retained dataset, and a metric returns an array, after the
+        # blocks have been closed in the worker.
+        validator = CrossValidator(
+            algorithm=RetainedItemMean(),
+            n_folds=2,
+            metrics={"first": first},
+            max_workers=2,
+            blas_threads=1,
+            seed=3,
+        )
+        before = {f for f in os.listdir("/dev/shm") if f.startswith("psm_")}
+        results = validator.run(dataset)
+        after = {f for f in os.listdir("/dev/shm") if f.startswith("psm_")}
+        assert all(isinstance(value, np.ndarray) for value in results["first"])
+        # The parent unlinks every block it shared with the workers.
+        assert after <= before
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
@@ -11,7 +11,7 @@
 # URL        : https://github.com/john-james-ai/recsys-lab                                         #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Sunday March 19th 2023 08:34:29 pm                                                  #
-# Modified   : Monday March 20th 2023 11:26:52 am                                                  #
+# Modified   : Monday October 19th 2026 01:44:20 am                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2023 John James                                                                 #
@@ -24,6 +24,7 @@ import logging
 from sqlalchemy import exc
 
 from recsys.dataset.base import Dataset
+from recsys.dataset.shard import shard
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
@@ -420,3 +421,44 @@ class TestCentre:  # pragma: no cover
             )
         )
         logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_shards(self, dataset, container, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        centre = container.asset.centre()
+        shards = shard(dataset, n_shards=2)
+        try:
+            for s in shards:
+                centre.add(s)
+            restored = centre.get_many([(s.name, s.__class__.__name__) for s in shards])
+            assert [s.shard for s in restored] == [0, 1]
+            assert [s.matrix_shape for s in restored] == [s.matrix_shape for s in shards]
+            assert restored[1].to_csr().nnz == shards[1].nrows
+        finally:
+            for s in shards:
+                if centre.exists(name=s.name, asset_type=s.__class__.__name__):
+                    centre.remove(name=s.name, asset_type=s.__class__.__name__)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\n\tCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
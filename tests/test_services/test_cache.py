@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_services/test_cache.py                                                  #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:53:02 am                                                #
+# Modified   : Monday October 19th 2026 12:53:02 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import pandas as pd
+
+from recsys.services.cache import IngestCache
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+TYPES = {"userId": "int32", "movieId": "int32", "rating": "float32", "timestamp": "int64"}
+
+
+@pytest.mark.io
+@pytest.mark.cache
+class TestIngestCache:  # pragma: no cover
+    # ============================================================================================ #
+    def test_cache(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "ratings.csv")
+        expected = dataframe[list(TYPES.keys())].reset_index(drop=True)
+        expected.to_csv(filepath, index=False)
+        cache = IngestCache(directory=os.path.join(tmp_path, "cache"))
+
+        data = cache.read(filepath)
+        cached = cache.filepath(filepath)
+        assert os.path.exists(cached)
+        pd.testing.assert_frame_equal(data, expected)
+
+        # A hit is served from the cached file without parsing.
+        mtime = os.path.getmtime(cached)
+        data = cache.read(filepath)
+        assert os.path.getmtime(cached) == mtime
+        pd.testing.assert_frame_equal(data, expected)
+
+        # Different parser settings are cached separately.
+        assert cache.filepath(filepath, usecols=["userId"]) != cached
+
+        # A modified raw file is hashed again and parsed again.
+        expected.iloc[:10].to_csv(filepath, index=False)
+        assert cache.filepath(filepath) != cached
+        assert cache.read(filepath).shape[0] == 10
+
+        cache.clear()
+        assert os.listdir(cache.directory) == []
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
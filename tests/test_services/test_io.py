@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : Recommender Systems Lab: Towards State-of-the-Art                                   #
+# Version    : 0.1.0                                                                               #
+# Python     : 3.10.8                                                                              #
+# Filename   : /tests/test_services/test_io.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john.james.ai.studio@gmail.com                                                      #
+# URL        : https://github.com/john-james-ai/recsys-lab                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Monday October 19th 2026 12:51:06 am                                                #
+# Modified   : Monday October 19th 2026 01:24:02 am                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2026 John James                                                                 #
+# ================================================================================================ #
+import os
+import pickle
+import inspect
+from datetime import datetime
+import pytest
+import logging
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from recsys.services.io import IOService, PickleIO
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+TYPES = {"userId": "int32", "movieId": "int32", "rating": "float32", "timestamp": "int64"}
+
+
+@pytest.mark.io
+@pytest.mark.dat
+class TestDatIO:  # pragma: no cover
+    # ============================================================================================ #
+    def test_read_write(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "ratings.dat")
+        expected = dataframe[list(TYPES.keys())].reset_index(drop=True)
+        IOService.write(filepath=filepath, data=expected)
+        with open(filepath, "r") as f:
+            line = f.readline().strip()
+        assert line.count("::") == 3
+
+        data = IOService.read(filepath, names=list(TYPES.keys()), column_types=TYPES)
+        assert {column: str(dtype) for column, dtype in data.dtypes.items()} == TYPES
+        pd.testing.assert_frame_equal(data, expected.astype(TYPES))
+
+        # Column names taken from a header row.
+        with open(filepath, "r") as f:
+            body = f.read()
+        with open(filepath, "w") as f:
+            f.write("::".join(TYPES.keys()) + "\n" + body)
+        data = IOService.read(filepath, header=0)
+        assert list(data.columns) == list(TYPES.keys())
+        assert data.shape[0] == expected.shape[0]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.sparse
+class TestSparseIO:  # pragma: no cover
+    # ============================================================================================ #
+    def test_read_write(self, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        matrix = sp.random(500, 300, density=0.05, format="csr", dtype=np.float32, random_state=5)
+
+        compressed = os.path.join(tmp_path, "compressed.npz")
+        uncompressed = os.path.join(tmp_path, "uncompressed.npz")
+        IOService.write(filepath=compressed, data=matrix)
+        IOService.write(filepath=uncompressed, data=matrix, compressed=False)
+        assert os.path.getsize(compressed) < os.path.getsize(uncompressed)
+        assert (IOService.read(compressed) != matrix).nnz == 0
+
+        for fmt in ("csr", "csc", "coo", "lil"):
+            filepath = os.path.join(tmp_path, f"{fmt}.sparse")
+            IOService.write(filepath=filepath, data=matrix.asformat(fmt))
+            loaded = IOService.read(filepath)
+            assert loaded.format == ("csr" if fmt == "lil" else fmt)
+            assert loaded.shape == matrix.shape
+            assert not loaded.data.flags.writeable
+            assert (loaded.tocsr() != matrix).nnz == 0
+
+        loaded = IOService.read(os.path.join(tmp_path, "csr.sparse"), mmap_mode=None)
+        assert loaded.data.flags.writeable
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.arrow
+class TestArrowIO:  # pragma: no cover
+    # ============================================================================================ #
+    def test_read_write(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        expected = dataframe[list(TYPES.keys())].astype(TYPES).reset_index(drop=True)
+        for ext in ("arrow", "feather"):
+            filepath = os.path.join(tmp_path, f"ratings.{ext}")
+            IOService.write(filepath=filepath, data=expected)
+            data = IOService.read(filepath)
+            pd.testing.assert_frame_equal(data, expected)
+            # Memory-mapped, so the numeric columns are read-only views of the file.
+            assert not data["userId"].values.flags.writeable
+
+        arrays = IOService.read(filepath, columns=["userId", "rating"], output="numpy")
+        assert list(arrays.keys()) == ["userId", "rating"]
+        assert not arrays["rating"].flags.writeable
+        assert np.array_equal(arrays["rating"], expected["rating"].values)
+
+        table = IOService.read(filepath, output="arrow")
+        assert table.num_rows == expected.shape[0]
+
+        with pytest.raises(ValueError):
+            IOService.read(filepath, output="polars")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.parquet
+class TestParquetIO:  # pragma: no cover
+    # ============================================================================================ #
+    def test_read(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "ratings.parquet")
+        expected = dataframe[list(TYPES.keys())].reset_index(drop=True)
+        IOService.write(filepath=filepath, data=expected)
+        pd.testing.assert_frame_equal(IOService.read(filepath), expected)
+
+        users = expected["userId"].unique()[:10]
+        data = IOService.read(
+            filepath,
+            columns=["userId", "rating"],
+            filters=[("rating", ">=", 4), ("userId", "in", users)],
+            batch_size=100,
+        )
+        subset = expected[(expected["rating"] >= 4) & expected["userId"].isin(users)]
+        assert list(data.columns) == ["userId", "rating"]
+        assert np.array_equal(data["userId"].values, subset["userId"].values)
+
+        batches = list(IOService.iter_batches(filepath, batch_size=1000, columns=["movieId"]))
+        assert all(batch.shape[0] <= 1000 for batch in batches)
+        assert len(batches) >= expected.shape[0] // 1000
+        assert np.array_equal(pd.concat(batches)["movieId"].values, expected["movieId"].values)
+
+        with pytest.raises(ValueError):
+            next(IOService.iter_batches(os.path.join(tmp_path, "config.yml")))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.pickle
+class TestPickleIO:  # pragma: no cover
+    # ============================================================================================ #
+    def test_out_of_band(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "asset.pkl")
+        matrix = sp.random(2000, 1000, density=0.1, format="csr", random_state=5)
+        data = {"ratings": dataframe, "matrix": matrix, "small": np.arange(10)}
+
+        IOService.write(filepath=filepath, data=data, out_of_band=True)
+        sidecars = PickleIO.sidecars(filepath)
+        assert len(sidecars) == 1
+        assert os.path.getsize(sidecars[0]) > os.path.getsize(filepath)
+        loaded = IOService.read(filepath)
+        pd.testing.assert_frame_equal(loaded["ratings"], dataframe)
+        assert (loaded["matrix"] != matrix).nnz == 0
+        assert np.array_equal(loaded["small"], data["small"])
+        # The large arrays are copy-on-write views of the mapped sidecar.
+        assert isinstance(loaded["matrix"].data.base.base, np.memmap)
+        loaded["matrix"].data[0] = -1
+        assert IOService.read(filepath)["matrix"].data[0] == matrix.data[0]
+
+        loaded = IOService.read(filepath, mmap_mode=None)
+        assert (loaded["matrix"] != matrix).nnz == 0
+
+        # Rewriting replaces the sidecar.
+        IOService.write(filepath=filepath, data=data, out_of_band=True)
+        assert len(PickleIO.sidecars(filepath)) == 1
+        assert PickleIO.sidecars(filepath) != sidecars
+
+        # In-band pickles, as written before, still load, and a stale sidecar is removed.
+        IOService.write(filepath=filepath, data=data)
+        assert PickleIO.sidecars(filepath) == []
+        with open(filepath, "rb") as f:
+            assert isinstance(pickle.load(f), dict)
+        assert (IOService.read(filepath)["matrix"] != matrix).nnz == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.compression
+class TestCompression:  # pragma: no cover
+    # ============================================================================================ #
+    def test_round_trip(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        expected = dataframe.reset_index(drop=True)
+        for fmt in ("parquet", "arrow", "pkl"):
+            sizes = {}
+            for compression, level in (("none", None), ("lz4", None), ("zstd", 9)):
+                filepath = os.path.join(tmp_path, f"{compression}.{fmt}")
+                IOService.write(
+                    filepath=filepath,
+                    data=expected,
+                    compression=compression,
+                    compression_level=level,
+                )
+                sizes[compression] = os.path.getsize(filepath)
+                pd.testing.assert_frame_equal(IOService.read(filepath), expected)
+            assert sizes["zstd"] < sizes["none"]
+
+        with pytest.raises(ValueError):
+            IOService.write(filepath=filepath, data=expected, compression="lzma")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.concurrent
+class TestConcurrentIO:  # pragma: no cover
+    # ============================================================================================ #
+    def test_read_write_many(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        splits = np.array_split(np.arange(dataframe.shape[0]), 3)
+        data = {
+            os.path.join(tmp_path, "train.parquet"): dataframe.iloc[splits[0]],
+            os.path.join(tmp_path, "validation.arrow"): dataframe.iloc[splits[1]],
+            os.path.join(tmp_path, "test.pkl"): dataframe.iloc[splits[2]],
+            os.path.join(tmp_path, "matrix.npz"): sp.random(100, 50, density=0.1, format="csr"),
+        }
+        IOService.write_many(data)
+        filepaths = list(data.keys())
+        loaded = IOService.read_many(filepaths, max_workers=2)
+        assert len(loaded) == len(data)
+        for expected, result in zip(list(data.values())[:3], loaded[:3]):
+            assert np.array_equal(result["userId"].values, expected["userId"].values)
+        assert (loaded[3] != data[filepaths[3]]).nnz == 0
+
+        with pytest.raises(FileNotFoundError):
+            IOService.read_many(filepaths + [os.path.join(tmp_path, "missing.pkl")])
+        assert IOService.read_many([]) == []
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.atomic
+class TestAtomicWrite:  # pragma: no cover
+    # ============================================================================================ #
+    def test_atomic(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepath = os.path.join(tmp_path, "ratings.pkl")
+        IOService.write(filepath=filepath, data=dataframe, out_of_band=True)
+        contents = sorted(os.listdir(tmp_path))
+
+        # A failed write leaves the previous version intact, and no temporary files.
+        with pytest.raises(Exception):
+            IOService.write(filepath=filepath, data={"rows": dataframe, "f": lambda x: x})
+        assert sorted(os.listdir(tmp_path)) == contents
+        pd.testing.assert_frame_equal(IOService.read(filepath), dataframe)
+
+        # Directories are replaced as a whole.
+        matrix = sp.random(100, 50, density=0.1, format="csr", random_state=5)
+        directory = os.path.join(tmp_path, "matrix.sparse")
+        IOService.write(filepath=directory, data=matrix)
+        IOService.write(filepath=directory, data=matrix.tocoo())
+        assert IOService.read(directory).format == "coo"
+        assert sorted(os.listdir(tmp_path)) == sorted(contents + ["matrix.sparse"])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_write_behind(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        filepaths = [os.path.join(tmp_path, f"split_{i}.parquet") for i in range(5)]
+        for filepath in filepaths:
+            IOService.write(filepath=filepath, data=dataframe, background=True)
+        IOService.flush()
+        for filepath in filepaths:
+            assert IOService.read(filepath).shape == dataframe.shape
+
+        # Errors on the write behind thread are raised by the next flush.
+        IOService.write(
+            filepath=os.path.join(tmp_path, "bad.pkl"), data=lambda x: x, background=True
+        )
+        with pytest.raises(Exception):
+            IOService.flush()
+        IOService.flush()
+        assert not os.path.exists(os.path.join(tmp_path, "bad.pkl"))
+        with pytest.raises(ValueError):
+            IOService.write(filepath=os.path.join(tmp_path, "bad.xyz"), data=1, background=True)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.io
+@pytest.mark.batches
+class TestCSVBatches:  # pragma: no cover
+    # ============================================================================================ #
+    def test_iter_batches(self, dataframe, tmp_path, caplog):
+        start = datetime.now()
+        logger.info(
+            "\n\nStarted {} {} at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                start.strftime("%I:%M:%S %p"),
+                start.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        expected = dataframe[list(TYPES.keys())].astype(TYPES).reset_index(drop=True)
+        csv = os.path.join(tmp_path, "ratings.csv")
+        expected.to_csv(csv, index=False)
+
+        # Keyword arguments are forwarded to pandas.
+        assert IOService.read(csv, nrows=10).shape[0] == 10
+
+        batches = list(IOService.iter_batches(csv, batch_size=1000, dtype=TYPES))
+        assert all(batch.shape[0] <= 1000 for batch in batches[:-1])
+        assert {column: str(dtype) for column, dtype in batches[0].dtypes.items()} == TYPES
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), expected)
+
+        dat = os.path.join(tmp_path, "ratings.dat")
+        IOService.write(filepath=dat, data=expected)
+        # A small block size splits lines across blocks. The dtype argument of CSVIO applies.
+        batches = list(
+            IOService.iter_batches(
+                dat,
+                batch_size=1000,
+                names=list(TYPES.keys()),
+                dtype=TYPES,
+                block_size=4099,
+            )
+        )
+        assert [batch.shape[0] for batch in batches[:-1]] == [1000] * (len(batches) - 1)
+        pd.testing.assert_frame_equal(pd.concat(batches, ignore_index=True), expected)
+        with pytest.raises(ValueError):
+            next(IOService.iter_batches(dat, names=list(TYPES.keys()), low_memory=False))
+
+        with open(dat, "r") as f:
+            body = f.read()
+        with open(dat, "w") as f:
+            f.write("::".join(TYPES.keys()) + "\n" + body)
+        batches = list(
+            IOService.iter_batches(
+                dat, batch_size=5000, header=0, usecols=["movieId", "rating"], block_size=4099
+            )
+        )
+        data = pd.concat(batches, ignore_index=True)
+        assert list(data.columns) == ["movieId", "rating"]
+        assert np.array_equal(data["movieId"].values, expected["movieId"].values)
+
+        # Keyword arguments are forwarded to pandas on write.
+        IOService.write(filepath=csv, data=expected, columns=["userId", "rating"])
+        assert list(IOService.read(csv).columns) == ["userId", "rating"]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            "\nCompleted {} {} in {} seconds at {} on {}".format(
+                self.__class__.__name__,
+                inspect.stack()[0][3],
+                duration,
+                end.strftime("%I:%M:%S %p"),
+                end.strftime("%m/%d/%Y"),
+            )
+        )
+        logger.info(single_line)